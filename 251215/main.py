@@ -15,6 +15,7 @@ from pathlib import Path
 from urllib.parse import urlparse
 from scheduler import NewsScheduler
 from crawler import HwasungNewsCrawler
+from article_dates import merge_articles
 
 # 현재 디렉토리를 기준으로 작업
 BASE_DIR = Path(__file__).parent
@@ -33,7 +34,7 @@ def update_news_now():
         print(f"\n[수동 업데이트 요청] {time.strftime('%Y-%m-%d %H:%M:%S')}")
         new_crawled_articles = crawler_instance.crawl_all_news()
         
-        # 기존 데이터 로드
+        # 기존 데이터 로드 (파일이 손상되어 있으면 예외 - 덮어쓰지 않고 중단)
         existing_data = crawler_instance.load_from_json("data.json")
         existing_articles = existing_data.get("articles", [])
         existing_ids = {article["article_id"] for article in existing_articles}
@@ -41,27 +42,12 @@ def update_news_now():
         # 새로운 기사만 확인
         new_articles = [article for article in new_crawled_articles if article["article_id"] not in existing_ids]
         
-        # 기존 기사와 새 기사 병합
-        all_articles = existing_articles + new_articles
-        
-        # 날짜순 정렬 (최신순)
-        def parse_date(date_str):
-            """날짜 문자열을 파싱하여 정렬 가능한 형식으로 변환"""
-            if not date_str:
-                return "0000-00-00 00:00:00"
-            try:
-                if len(date_str) >= 19 and date_str[4] == '-':
-                    return date_str[:19]
-                from datetime import datetime
-                dt = datetime.strptime(date_str[:25], "%a, %d %b %Y %H:%M:%S")
-                return dt.strftime("%Y-%m-%d %H:%M:%S")
-            except:
-                return date_str[:19] if len(date_str) >= 19 else date_str
-        
-        all_articles.sort(key=lambda x: parse_date(x.get("pub_date", "")), reverse=True)
+        # 기존 기사(최신순)에 새 기사를 날짜순으로 병합 (수집 시 정규화한 published_ts 기준)
+        all_articles = merge_articles(existing_articles, new_articles)
         
         # 모든 기사 저장
         crawler_instance.save_to_json(all_articles, "data.json")
+        crawler_instance.commit_crawl_state()  # 저장한 뒤 증분 크롤링 기준점 확정
         
         result = {
             "success": True,
@@ -189,6 +175,7 @@ def main():
         print("[초기화] 데이터 파일이 없습니다. 초기 크롤링을 시작합니다...")
         articles = crawler_instance.crawl_all_news()
         crawler_instance.save_to_json(articles, "data.json")
+        crawler_instance.commit_crawl_state()
         print("[초기화] 초기 크롤링 완료\n")
     
     # 스케줄러 시작 (1시간 = 3600초)
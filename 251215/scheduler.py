@@ -8,6 +8,7 @@ import time
 import threading
 from datetime import datetime
 from crawler import HwasungNewsCrawler
+from article_dates import merge_articles
 
 class NewsScheduler:
     """뉴스 자동 업데이트 스케줄러"""
@@ -28,7 +29,7 @@ class NewsScheduler:
             # 크롤링 실행
             new_crawled_articles = self.crawler.crawl_all_news()
             
-            # 기존 데이터 로드
+            # 기존 데이터 로드 (파일이 손상되어 있으면 예외 - 덮어쓰지 않고 중단)
             existing_data = self.crawler.load_from_json("data.json")
             existing_articles = existing_data.get("articles", [])
             existing_ids = {article["article_id"] for article in existing_articles}
@@ -36,30 +37,12 @@ class NewsScheduler:
             # 새로운 기사만 추가
             new_articles = [article for article in new_crawled_articles if article["article_id"] not in existing_ids]
             
-            # 기존 기사와 새 기사 병합
-            all_articles = existing_articles + new_articles
-            
-            # 날짜순 정렬 (최신순 - pub_date가 큰 것이 위로)
-            def parse_date(date_str):
-                """날짜 문자열을 파싱하여 정렬 가능한 형식으로 변환"""
-                if not date_str:
-                    return "0000-00-00 00:00:00"
-                # 네이버 뉴스 날짜 형식: "Mon, 01 Jan 2024 12:00:00 +0900" 또는 "2024-01-01 12:00:00"
-                try:
-                    # ISO 형식인 경우
-                    if len(date_str) >= 19 and date_str[4] == '-':
-                        return date_str[:19]
-                    # RFC 형식인 경우
-                    from datetime import datetime
-                    dt = datetime.strptime(date_str[:25], "%a, %d %b %Y %H:%M:%S")
-                    return dt.strftime("%Y-%m-%d %H:%M:%S")
-                except:
-                    return date_str[:19] if len(date_str) >= 19 else date_str
-            
-            all_articles.sort(key=lambda x: parse_date(x.get("pub_date", "")), reverse=True)
+            # 기존 기사(최신순)에 새 기사를 날짜순으로 병합 (수집 시 정규화한 published_ts 기준)
+            all_articles = merge_articles(existing_articles, new_articles)
             
             # 모든 기사 저장 (중복 제거)
             self.crawler.save_to_json(all_articles, "data.json")
+            self.crawler.commit_crawl_state()  # 저장한 뒤 증분 크롤링 기준점 확정
             
             if new_articles:
                 print(f"[새로운 기사] {len(new_articles)}개의 새로운 기사 발견")
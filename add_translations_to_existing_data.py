@@ -1,14 +1,28 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """
-기존 data.json 파일에 번역 추가 스크립트
+기존 data.json 파일에 번역 추가 스크립트 (일괄 백필)
+
+모든 251215* 폴더의 data.json에서 번역이 없는 영어 제목/요약을 모아 번역
+서비스의 워커 풀로 묶음/병렬 번역합니다. 일정 개수마다 data.json에 중간
+저장(체크포인트)하므로, 중단 후 다시 실행하면 이미 번역된 항목은 건너뛰고
+남은 항목부터 이어서 진행합니다.
+
+통합 서버가 실행 중이어도 서버는 data.json을 다시 만들기 전에 바뀐 파일을
+기사 저장소에 병합하므로 결과가 덮어써지지 않습니다. 다만 두 쪽이 같은 순간에
+저장하면 한쪽 변경이 빠질 수 있어, 대량 작업은 서버를 멈춘 상태가 안전합니다.
+
+사용법:
+    python add_translations_to_existing_data.py                    # 모든 폴더
+    python add_translations_to_existing_data.py 251215_cooper      # 특정 폴더만
+    python add_translations_to_existing_data.py --workers 8 --checkpoint-every 200
 """
 
 import json
 import sys
-import os
-import importlib.util
+import time
 from pathlib import Path
+from typing import Dict, List, Tuple
 
 # Windows 콘솔 인코딩 설정
 if sys.platform == 'win32':
@@ -16,96 +30,128 @@ if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
 
-def load_crawler_class(folder_name, class_name):
-    """크롤러 클래스를 동적으로 로드"""
-    module_path = Path(folder_name) / "crawler.py"
-    spec = importlib.util.spec_from_file_location(f"{folder_name}.crawler", module_path)
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    return getattr(module, class_name)
-
-def add_translations_to_data(folder: str, crawler_class):
-    """기존 data.json에 번역 추가"""
-    data_file = Path(folder) / "data.json"
-    
-    if not data_file.exists():
-        print(f"[건너뛰기] {folder}/data.json 파일이 없습니다.")
-        return
-    
-    print(f"\n[처리 중] {folder}/data.json")
-    
-    # 데이터 로드
-    with open(data_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    articles = data.get("articles", [])
-    if not articles:
-        print(f"[건너뛰기] {folder}에 기사가 없습니다.")
-        return
-    
-    # 크롤러 인스턴스 생성
-    crawler = crawler_class()
-    
-    updated_count = 0
-    for i, article in enumerate(articles):
-        title = article.get("title", "")
-        description = article.get("description", "")
-        
-        # 번역이 이미 있으면 건너뛰기
-        if article.get("title_translated") or article.get("description_translated"):
+BASE_DIR = Path(__file__).parent
+sys.path.insert(0, str(BASE_DIR))
+
+import atomic_file
+import static_cache
+from translation_cache import translation_cache
+from translation_service import TranslationService, TRANSLATE_MAX_WORKERS, is_mostly_english
+
+# 번역 대상 필드 (원문 필드 → 번역 필드)
+TRANSLATE_FIELDS = (("title", "title_translated"), ("description", "description_translated"))
+
+
+def find_data_folders() -> List[str]:
+    """data.json이 있는 업체 폴더 목록"""
+    return sorted(path.parent.name for path in BASE_DIR.glob("251215*/data.json"))
+
+
+def load_data(folder: str) -> Dict:
+    with open(BASE_DIR / folder / "data.json", 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_data(folder: str, data: Dict):
+    """data.json 저장 (임시 파일에 쓴 뒤 교체해 중간에 끊겨도 파일이 깨지지 않음)"""
+    data_file = BASE_DIR / folder / "data.json"
+    atomic_file.write_json(data_file, data)
+    static_cache.compress_file(data_file)
+
+
+def collect_pending(data: Dict) -> List[Tuple[Dict, str, str]]:
+    """번역이 필요한 (기사, 번역 필드, 원문) 목록"""
+    pending = []
+    for article in data.get("articles", []):
+        for source_field, translated_field in TRANSLATE_FIELDS:
+            text = article.get(source_field, "")
+            if text and not article.get(translated_field) and is_mostly_english(text):
+                pending.append((article, translated_field, text))
+    return pending
+
+
+def backfill(folders: List[str], workers: int, checkpoint_every: int):
+    """폴더들의 번역 누락 항목을 병렬로 번역하고 주기적으로 저장"""
+    datasets: Dict[str, Dict] = {}
+    pending: List[Tuple[str, Dict, str, str]] = []
+    for folder in folders:
+        try:
+            data = load_data(folder)
+        except FileNotFoundError:
+            print(f"[건너뛰기] {folder}/data.json 파일이 없습니다.")
             continue
-        
-        # 제목 번역
-        if title and crawler._is_mostly_english(title):
-            translated_title = crawler._translate_to_korean(title)
-            if translated_title:
-                article["title_translated"] = translated_title
-                updated_count += 1
-                print(f"  [{i+1}/{len(articles)}] 제목 번역 추가: {title[:50]}...")
-        
-        # 설명 번역
-        if description and crawler._is_mostly_english(description):
-            translated_desc = crawler._translate_to_korean(description)
-            if translated_desc:
-                article["description_translated"] = translated_desc
-                updated_count += 1
-                print(f"  [{i+1}/{len(articles)}] 설명 번역 추가")
-        
-        # 진행 상황 표시
-        if (i + 1) % 10 == 0:
-            print(f"  진행: {i+1}/{len(articles)}")
-    
-    # 데이터 저장
-    if updated_count > 0:
-        with open(data_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-        print(f"[완료] {folder}: {updated_count}개의 번역 추가됨")
-    else:
-        print(f"[완료] {folder}: 번역할 항목이 없거나 이미 번역이 있습니다.")
+        items = collect_pending(data)
+        print(f"[대상] {folder}: 기사 {len(data.get('articles', []))}개, 번역할 항목 {len(items)}개")
+        if items:
+            datasets[folder] = data
+            pending.extend((folder, article, field, text) for article, field, text in items)
+
+    total = len(pending)
+    if total == 0:
+        print("[완료] 번역할 항목이 없거나 이미 번역이 있습니다.")
+        return
+
+    service = TranslationService('en', 'ko', max_workers=workers)
+    translated = {folder: 0 for folder in datasets}
+    failed = 0
+    done = 0
+    started = time.time()
+
+    for start in range(0, total, checkpoint_every):
+        chunk = pending[start:start + checkpoint_every]
+        results = service.translate_many([text for _, _, _, text in chunk])
+
+        touched = set()
+        for (folder, article, field, _), result in zip(chunk, results):
+            if result:
+                article[field] = result
+                translated[folder] += 1
+                touched.add(folder)
+            else:
+                failed += 1
+
+        # 체크포인트: 이번 구간에서 바뀐 폴더만 저장
+        for folder in sorted(touched):
+            save_data(folder, datasets[folder])
+        translation_cache.save()
+
+        done += len(chunk)
+        elapsed = max(time.time() - started, 1e-6)
+        rate = done / elapsed
+        remaining = (total - done) / rate if rate else 0
+        print(f"[체크포인트] {done}/{total} ({done / total * 100:.1f}%) - "
+              f"{rate:.1f} 문자열/초, 남은 시간 약 {remaining:.0f}초")
+
+    elapsed = max(time.time() - started, 1e-6)
+    print(f"\n[처리량] {total}개 문자열을 {elapsed:.1f}초에 처리 ({total / elapsed:.1f} 문자열/초), "
+          f"번역 요청 {service.requests}회")
+    print(f"[번역 캐시] {translation_cache.format_stats()}")
+    for folder, count in translated.items():
+        print(f"[완료] {folder}: {count}개의 번역 추가됨")
+    if failed:
+        print(f"[경고] {failed}개 항목은 번역하지 못했습니다. 다시 실행하면 해당 항목만 재시도합니다.")
+
 
 def main():
     """메인 함수"""
+    import argparse
+    parser = argparse.ArgumentParser(description="기존 data.json에 번역 일괄 추가 (중단 후 이어서 실행 가능)")
+    parser.add_argument("folders", nargs="*", help="처리할 폴더 (기본: 모든 251215* 폴더)")
+    parser.add_argument("--workers", "-w", type=int, default=TRANSLATE_MAX_WORKERS,
+                        help=f"동시 번역 요청 수 (기본: {TRANSLATE_MAX_WORKERS})")
+    parser.add_argument("--checkpoint-every", "-c", type=int, default=200,
+                        help="이 개수의 문자열을 처리할 때마다 저장 (기본: 200)")
+    args = parser.parse_args()
+
     print("="*60)
     print("기존 데이터에 번역 추가")
     print("="*60)
-    
-    # 각 업체별 처리
-    companies = [
-        ("251215_cooper", "CooperStandardNewsCrawler"),
-        ("251215_saargummi", "SaarGummiNewsCrawler"),
-        ("251215_hutchinson", "HutchinsonNewsCrawler")
-    ]
-    
-    for folder, class_name in companies:
-        try:
-            crawler_class = load_crawler_class(folder, class_name)
-            add_translations_to_data(folder, crawler_class)
-        except Exception as e:
-            print(f"[오류] {folder} 처리 중 오류: {str(e)}")
-            import traceback
-            traceback.print_exc()
-    
+
+    folders = args.folders or find_data_folders()
+    backfill(folders, max(1, args.workers), max(1, args.checkpoint_every))
+
     print("\n[완료] 모든 작업이 완료되었습니다.")
 
+
 if __name__ == "__main__":
     main()
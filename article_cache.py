@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+기사 본문 캐시 - get_full_article 결과를 메모리(LRU) + 디스크에 보관하고 같은 URL 요청을 한 번의 조회로 합침
+
+기사를 열 때마다 원문 요청, HTML 파싱, (영어 기사는) 본문 번역을 다시 하므로
+여러 사람이 같은 기사를 열면 같은 작업이 반복됩니다. 결과를
+(업체, 정규 URL) 키로 보관해 두고 다음과 같이 돌려줍니다.
+
+  fresh  - 가져온 지 ARTICLE_CACHE_TTL_SECONDS 이내: 캐시 그대로
+  stale  - 그 뒤 ARTICLE_CACHE_STALE_SECONDS 이내: 캐시를 바로 돌려주고
+           백그라운드에서 다시 가져와 갱신 (stale-while-revalidate)
+  그 외  - 새로 가져옴
+
+같은 키를 동시에 요청하면 먼저 온 요청 하나만 원문을 가져오고 나머지는 그
+결과를 기다려 함께 씁니다 (single-flight). 본문을 가져오지 못한 결과는 디스크에
+남기지 않고 메모리에만 ARTICLE_CACHE_FAILURE_SECONDS 동안 보관합니다.
+"""
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+import atomic_file
+from url_canonical import canonicalize_url
+
+# 캐시 설정 (환경 변수로 조정 가능)
+ARTICLE_CACHE_DIR = os.environ.get('ARTICLE_CACHE_DIR', str(Path(__file__).parent / "article_cache"))
+ARTICLE_CACHE_MAX_ENTRIES = int(os.environ.get('ARTICLE_CACHE_MAX_ENTRIES', 500))
+ARTICLE_CACHE_DISK_MAX_ENTRIES = int(os.environ.get('ARTICLE_CACHE_DISK_MAX_ENTRIES', 5000))
+ARTICLE_CACHE_TTL_SECONDS = int(os.environ.get('ARTICLE_CACHE_TTL_SECONDS', 6 * 3600))
+ARTICLE_CACHE_STALE_SECONDS = int(os.environ.get('ARTICLE_CACHE_STALE_SECONDS', 7 * 86400))
+ARTICLE_CACHE_FAILURE_SECONDS = int(os.environ.get('ARTICLE_CACHE_FAILURE_SECONDS', 60))
+# false로 설정하면 디스크 캐시를 쓰지 않음 (메모리만)
+ARTICLE_CACHE_DISK_ENABLED = os.environ.get('ARTICLE_CACHE_DISK', 'true').lower() == 'true'
+# 디스크 항목을 이만큼 새로 쓸 때마다 오래된 파일 정리
+PRUNE_EVERY = 100
+
+
+class _Flight:
+    """진행 중인 원문 조회 하나 (같은 키 요청이 결과를 기다림)"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Optional[Dict] = None
+        self.error: Optional[BaseException] = None
+
+
+class ArticleCache:
+    """기사 본문 캐시 (스레드 안전)
+
+    항목: 키 → (결과 딕셔너리, 가져온 시각). 메모리는 max_entries를 넘으면 가장
+    오래 사용하지 않은 항목부터 버리고, 디스크는 키 해시 이름의 JSON 파일로
+    보관합니다.
+    """
+
+    def __init__(self, directory=ARTICLE_CACHE_DIR,
+                 max_entries: int = ARTICLE_CACHE_MAX_ENTRIES,
+                 ttl: int = ARTICLE_CACHE_TTL_SECONDS,
+                 stale_ttl: int = ARTICLE_CACHE_STALE_SECONDS,
+                 disk_enabled: bool = ARTICLE_CACHE_DISK_ENABLED,
+                 disk_max_entries: int = ARTICLE_CACHE_DISK_MAX_ENTRIES):
+        self.directory = Path(directory)
+        self.max_entries = max(1, max_entries)
+        self.ttl = ttl
+        self.stale_ttl = max(ttl, stale_ttl)
+        self.disk_enabled = disk_enabled
+        self.disk_max_entries = disk_max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[Dict, float]]" = OrderedDict()
+        self._flights: Dict[str, _Flight] = {}
+        self._disk_writes = 0
+        self.stats = {"hits": 0, "stale": 0, "misses": 0, "coalesced": 0, "disk_hits": 0, "errors": 0}
+
+    @staticmethod
+    def make_key(company: str, url: str) -> str:
+        return f"{company}:{canonicalize_url(url) or url}"
+
+    def _disk_path(self, key: str) -> Path:
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return self.directory / digest[:2] / f"{digest}.json"
+
+    # ------------------------------------------------------------ 저장 계층
+    def _lookup(self, key: str) -> Optional[Tuple[Dict, float]]:
+        """메모리 → 디스크 순으로 항목 조회 (디스크에서 찾으면 메모리에 올림)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+        if not self.disk_enabled:
+            return None
+        try:
+            data = atomic_file.read_json(self._disk_path(key))
+        except Exception:
+            return None
+        if not data or data.get("key") != key:
+            return None
+        entry = (data["result"], data["fetched_at"])
+        with self._lock:
+            self.stats["disk_hits"] += 1
+            self._remember_locked(key, entry)
+        return entry
+
+    def _remember_locked(self, key: str, entry: Tuple[Dict, float]):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _store(self, key: str, result: Dict):
+        fetched_at = time.time()
+        with self._lock:
+            previous = self._entries.get(key)
+            if not result.get("success") and previous is not None and previous[0].get("success"):
+                # 갱신 실패 - 가져와 둔 본문을 계속 stale로 제공 (실패 결과로 덮지 않음)
+                self.stats["errors"] += 1
+                return
+            self._remember_locked(key, (result, fetched_at))
+        if not self.disk_enabled or not result.get("success"):
+            return
+        path = self._disk_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_file.write_json(path, {"key": key, "fetched_at": fetched_at, "result": result}, indent=None)
+        except Exception as e:
+            print(f"[기사 캐시] 디스크 저장 오류: {str(e)}")
+            return
+        with self._lock:
+            self._disk_writes += 1
+            should_prune = self._disk_writes % PRUNE_EVERY == 0
+        if should_prune:
+            self.prune_disk()
+
+    def prune_disk(self):
+        """갱신 기한이 지났거나 최대 개수를 넘는 디스크 항목 삭제 (오래된 파일부터)"""
+        try:
+            files = [(path.stat().st_mtime, path) for path in self.directory.glob("*/*.json")]
+        except OSError:
+            return
+        files.sort()
+        cutoff = time.time() - self.stale_ttl
+        excess = len(files) - self.disk_max_entries
+        for index, (mtime, path) in enumerate(files):
+            if mtime >= cutoff and index >= excess:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+    # ------------------------------------------------------------ 조회
+    def _age_limit(self, result: Dict) -> Tuple[int, int]:
+        """(fresh 기한, stale 기한) 초 - 실패 결과는 짧게 보관하고 stale로 쓰지 않음"""
+        if result.get("success"):
+            return self.ttl, self.stale_ttl
+        return ARTICLE_CACHE_FAILURE_SECONDS, ARTICLE_CACHE_FAILURE_SECONDS
+
+    def get_or_fetch(self, key: str, fetch: Callable[[], Dict]) -> Tuple[Dict, str]:
+        """캐시된 결과 또는 fetch() 결과 (반환: (결과, "hit"|"stale"|"miss"|"coalesced"))"""
+        entry = self._lookup(key)
+        if entry is not None:
+            result, fetched_at = entry
+            fresh_for, stale_for = self._age_limit(result)
+            age = time.time() - fetched_at
+            if age <= fresh_for:
+                with self._lock:
+                    self.stats["hits"] += 1
+                return result, "hit"
+            if age <= stale_for:
+                with self._lock:
+                    self.stats["stale"] += 1
+                self._revalidate(key, fetch)
+                return result, "stale"
+        return self._fetch(key, fetch)
+
+    def _fetch(self, key: str, fetch: Callable[[], Dict]) -> Tuple[Dict, str]:
+        """원문 조회 (같은 키를 조회 중인 요청이 있으면 그 결과를 기다림)"""
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = _Flight()
+                self._flights[key] = flight
+                self.stats["misses"] += 1
+            else:
+                self.stats["coalesced"] += 1
+        if leader:
+            self._run_flight(key, flight, fetch)
+        else:
+            flight.done.wait()
+        if flight.error is not None:
+            raise flight.error
+        return flight.result, "miss" if leader else "coalesced"
+
+    def _run_flight(self, key: str, flight: _Flight, fetch: Callable[[], Dict]):
+        try:
+            flight.result = fetch()
+            self._store(key, flight.result)
+        except BaseException as e:
+            flight.error = e
+            with self._lock:
+                self.stats["errors"] += 1
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.done.set()
+
+    def _revalidate(self, key: str, fetch: Callable[[], Dict]):
+        """백그라운드에서 다시 가져와 갱신 (이미 조회 중이면 건너뜀)"""
+        with self._lock:
+            if key in self._flights:
+                return
+            flight = _Flight()
+            self._flights[key] = flight
+
+        def refresh():
+            self._run_flight(key, flight, fetch)
+            if flight.error is not None:
+                print(f"[기사 캐시] 갱신 오류 ({key}): {str(flight.error)}")
+
+        threading.Thread(target=refresh, name="article-cache-refresh", daemon=True).start()
+
+    # ------------------------------------------------------------ 통계
+    def get_stats(self) -> Dict:
+        with self._lock:
+            stats = dict(self.stats)
+            stats["entries"] = len(self._entries)
+            stats["in_flight"] = len(self._flights)
+        return stats
+
+
+# 프로세스 전체에서 공유하는 기사 본문 캐시
+article_cache = ArticleCache()
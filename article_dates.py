@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+기사 발행 시각 정규화 - 수집할 때 한 번 파싱해 정렬용 필드로 저장
+
+pub_date는 출처마다 형식이 달라 화면 표시용으로만 그대로 두고, 수집 시점에
+다음 두 필드를 추가합니다.
+  published_at - 시간대가 있는 ISO 8601 (KST, 예: "2026-01-02T09:00:00+09:00")
+  published_ts - epoch 초 (정렬/기간 조회용 정수, 날짜가 없거나 읽을 수 없으면 0)
+
+pub_date 형식:
+  네이버      - RFC 822 ("Mon, 01 Jan 2024 12:00:00 +0900")
+  구글 뉴스   - "YYYY-MM-DD HH:MM:SS" (RSS의 UTC 시각) 또는 RFC 822 원문
+  구글 웹     - ISO 8601 (article:published_time) 또는 "YYYY-MM-DD HH:MM:SS" (수집 시각, KST)
+"""
+
+import heapq
+from datetime import datetime, timezone, timedelta
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterable, List, Optional
+
+# 한국 시간대 (KST, UTC+9)
+KST = timezone(timedelta(hours=9))
+
+PUBLISHED_AT_FIELD = "published_at"
+PUBLISHED_TS_FIELD = "published_ts"
+
+# 시간대가 없는 pub_date를 어느 시간대로 볼지 (source_type별, 기본 KST)
+NAIVE_TIMEZONES = {"google": timezone.utc}
+
+
+def parse_pub_date(value: str, naive_tz=KST) -> Optional[datetime]:
+    """pub_date 문자열을 시간대가 있는 datetime으로 변환 (읽을 수 없으면 None)"""
+    value = (value or "").strip()
+    if not value:
+        return None
+    try:
+        if value[:3].isalpha():
+            dt = parsedate_to_datetime(value)
+        else:
+            dt = datetime.fromisoformat(value.replace('Z', '+00:00').replace('z', '+00:00'))
+    except (TypeError, ValueError, IndexError):
+        return None
+    if dt is None:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=naive_tz)
+    return dt
+
+
+def normalize_pub_date(article: Dict) -> Dict:
+    """기사에 published_at/published_ts 추가 (기사를 직접 수정하고 그대로 반환)"""
+    naive_tz = NAIVE_TIMEZONES.get(article.get("source_type"), KST)
+    dt = parse_pub_date(article.get("pub_date", ""), naive_tz)
+    if dt is None:
+        article[PUBLISHED_AT_FIELD] = ""
+        article[PUBLISHED_TS_FIELD] = 0
+    else:
+        article[PUBLISHED_AT_FIELD] = dt.astimezone(KST).isoformat()
+        article[PUBLISHED_TS_FIELD] = int(dt.timestamp())
+    return article
+
+
+def ensure_pub_date(article: Dict) -> Dict:
+    """정규화 필드가 없는 (이전에 저장된) 기사만 정규화"""
+    if not isinstance(article.get(PUBLISHED_TS_FIELD), int):
+        normalize_pub_date(article)
+    return article
+
+
+def article_timestamp(article: Dict) -> int:
+    """정렬 키 (epoch 초) - 정규화 필드가 있으면 파싱하지 않음"""
+    ts = article.get(PUBLISHED_TS_FIELD)
+    if isinstance(ts, int):
+        return ts
+    naive_tz = NAIVE_TIMEZONES.get(article.get("source_type"), KST)
+    dt = parse_pub_date(article.get("pub_date", ""), naive_tz)
+    return int(dt.timestamp()) if dt else 0
+
+
+def is_sorted_newest_first(articles: List[Dict]) -> bool:
+    return all(article_timestamp(articles[i]) >= article_timestamp(articles[i + 1])
+               for i in range(len(articles) - 1))
+
+
+def merge_articles(existing: List[Dict], new_articles: Iterable[Dict]) -> List[Dict]:
+    """최신순으로 정렬된 기존 목록에 새 기사를 병합 (최신순, 같은 시각이면 기존 기사가 앞)
+
+    새 기사만 정렬한 뒤 한 번 훑어 합치므로 전체를 다시 정렬하지 않습니다.
+    기존 목록이 정렬되어 있지 않으면 (마이그레이션 전 파일) 전체를 정렬합니다.
+    """
+    new_sorted = sorted((ensure_pub_date(article) for article in new_articles),
+                        key=article_timestamp, reverse=True)
+    if not is_sorted_newest_first(existing):
+        return sorted(list(existing) + new_sorted, key=article_timestamp, reverse=True)
+    return list(heapq.merge(existing, new_sorted, key=article_timestamp, reverse=True))
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+기사 변경 알림 - 업체별 구독자(SSE 연결)에게 추가/삭제된 기사를 바로 전달
+"""
+
+import json
+import os
+import queue
+import threading
+from typing import Dict, List, Optional
+
+# 동시 SSE 연결 수 제한 (연결마다 요청 처리 스레드 하나를 점유)
+SSE_MAX_CLIENTS = int(os.environ.get('SSE_MAX_CLIENTS', 100))
+# 연결 유지용 주석 전송 간격 (초)
+SSE_KEEPALIVE_SECONDS = int(os.environ.get('SSE_KEEPALIVE_SECONDS', 15))
+# 구독자별 대기 이벤트 수 (넘치면 reset 이벤트로 대체)
+SSE_QUEUE_SIZE = 50
+
+
+def format_sse(event: str, data: Dict, event_id: Optional[str] = None) -> bytes:
+    """SSE 메시지 형식으로 변환"""
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    lines.append("data: " + json.dumps(data, ensure_ascii=False))
+    return ("\n".join(lines) + "\n\n").encode('utf-8')
+
+
+class Subscription:
+    """구독자 하나의 이벤트 대기열"""
+
+    def __init__(self, company: str):
+        self.company = company
+        self._queue: "queue.Queue[Dict]" = queue.Queue(maxsize=SSE_QUEUE_SIZE)
+        self._put_lock = threading.Lock()
+
+    def put(self, event: Dict):
+        with self._put_lock:
+            try:
+                self._queue.put_nowait(event)
+            except queue.Full:
+                # 느린 클라이언트: 밀린 이벤트를 버리고 처음부터 다시 받도록 알림
+                while True:
+                    try:
+                        self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                self._queue.put_nowait({"type": "reset", "data": {"reset": True}, "id": None})
+
+    def get(self, timeout: float) -> Optional[Dict]:
+        """이벤트 대기 (timeout 동안 없으면 None)"""
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+
+class EventBroker:
+    """업체별 구독자 관리와 이벤트 전달 (스레드 안전)"""
+
+    def __init__(self, max_clients: int = SSE_MAX_CLIENTS):
+        self.max_clients = max_clients
+        self._subscriptions: Dict[str, List[Subscription]] = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, company: str) -> Optional[Subscription]:
+        """구독 등록 (연결 수 제한을 넘으면 None)"""
+        with self._lock:
+            if self._count_locked() >= self.max_clients:
+                return None
+            subscription = Subscription(company)
+            self._subscriptions.setdefault(company, []).append(subscription)
+            return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.company, [])
+            if subscription in subscriptions:
+                subscriptions.remove(subscription)
+
+    def publish(self, company: str, event_type: str, data: Dict, event_id: Optional[str] = None):
+        """업체의 모든 구독자에게 이벤트 전달"""
+        event = {"type": event_type, "data": data, "id": event_id}
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(company, []))
+        for subscription in subscriptions:
+            subscription.put(event)
+
+    def _count_locked(self) -> int:
+        return sum(len(subscriptions) for subscriptions in self._subscriptions.values())
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return self._count_locked()
+
+
+# 프로세스 전체에서 공유하는 알림 브로커
+event_broker = EventBroker()
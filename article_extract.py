@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+기사 본문 추출 - 본문 선택자 후보 요소만 트리로 만드는 빠른 HTML 파싱
+
+이전에는 페이지 전체를 BeautifulSoup(html, 'html.parser')로 트리로 만든 뒤 선택자를
+찾았는데, 뉴스 페이지는 메뉴/광고/스크립트가 대부분이라 쓰지 않을 노드를 만드는
+데 시간과 메모리를 씁니다. SoupStrainer로 본문/언론사 선택자에 걸릴 수 있는 요소
+(그리고 그 하위 요소)만 트리로 만들고, 그 트리를 한 번 훑어 만든 색인으로 같은
+선택자를 같은 순서로 적용하므로 결과 텍스트는 전체 파싱과 같습니다. 단, 후보 요소가 바깥 요소의 닫는 태그로 닫히는 깨진
+HTML(<section><div class="content">…</section>)은 후보 요소가 더 늦게 닫혀 본문이
+조금 길어질 수 있습니다.
+
+lxml이 설치되어 있고 ARTICLE_PARSER=lxml이면 토크나이저로 lxml을 씁니다 (더 빠르지만
+깨진 HTML을 html.parser와 다르게 고칠 수 있어 기본값은 html.parser).
+
+벤치마크: python benchmark_article_extract.py
+"""
+
+import os
+import re
+from typing import Dict, List, Optional, Tuple
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml  # noqa: F401 (BeautifulSoup 'lxml' 파서)
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+# html.parser | lxml (lxml이 없으면 html.parser)
+ARTICLE_PARSER = os.environ.get('ARTICLE_PARSER', 'html.parser')
+
+# 네이버 뉴스 언론사 정보 선택자 (앞에서부터 시도)
+PRESS_SELECTORS = [
+    '.press_logo img[alt]',
+    '.press_logo a',
+    '.media_end_head_top a',
+    '.media_end_head_top .press_logo',
+    '._press_logo',
+    '.media_end_head_top_logo img[alt]'
+]
+
+# 네이버 뉴스 본문 선택자 (앞에서부터 시도)
+BODY_SELECTORS = [
+    '#articleBodyContents',
+    '.article_body',
+    '#articleBody',
+    '.article_view',
+    '.news_end_body',
+    '#newsEndContents'
+]
+
+# 일반 뉴스 사이트용: <article>, <main>, 클래스가 이 패턴과 맞는 <div> 순
+FALLBACK_CLASS_PATTERN = re.compile('content|body|article', re.I)
+
+# 본문에서 제거할 태그
+REMOVED_TAGS = ['script', 'style', 'iframe']
+
+
+def _selector_keys(selectors: List[str]) -> Tuple[set, set]:
+    """선택자 목록의 첫 단계(#id / .class)를 후보 id/클래스 집합으로 분리"""
+    ids, classes = set(), set()
+    for selector in selectors:
+        first = selector.split()[0]
+        if first.startswith('#'):
+            ids.add(first[1:])
+        elif first.startswith('.'):
+            classes.add(first[1:])
+    return ids, classes
+
+
+_BODY_IDS, _BODY_CLASSES = _selector_keys(BODY_SELECTORS)
+_PRESS_IDS, _PRESS_CLASSES = _selector_keys(PRESS_SELECTORS)
+_CANDIDATE_IDS = _BODY_IDS | _PRESS_IDS
+_CANDIDATE_CLASSES = _BODY_CLASSES | _PRESS_CLASSES
+
+
+def _classes(attrs: Dict) -> List[str]:
+    value = attrs.get('class') or ''
+    return value.split() if isinstance(value, str) else list(value)
+
+
+def _is_candidate(name: str, attrs: Dict) -> bool:
+    """선택자/대체 규칙에 걸릴 수 있는 요소인지 (하위 요소는 함께 트리로 만들어짐)"""
+    if name in ('article', 'main'):
+        return True
+    if attrs.get('id') in _CANDIDATE_IDS:
+        return True
+    classes = _classes(attrs)
+    if any(cls in _CANDIDATE_CLASSES for cls in classes):
+        return True
+    return name == 'div' and any(FALLBACK_CLASS_PATTERN.search(cls) for cls in classes)
+
+
+CANDIDATES = SoupStrainer(_is_candidate)
+
+
+def parser_name(parser: Optional[str] = None) -> str:
+    parser = parser or ARTICLE_PARSER
+    return 'lxml' if parser == 'lxml' and LXML_AVAILABLE else 'html.parser'
+
+
+class _CandidateIndex:
+    """후보 트리를 한 번 훑어 만든 id/클래스/태그별 첫 요소 색인
+
+    선택자마다 soupsieve로 트리 전체를 다시 훑지 않도록, 단순 선택자(#id, .class)는
+    색인에서 바로 찾고 하위 선택자(".a img[alt]")는 첫 단계 클래스 요소 안에서만
+    찾습니다. 요소를 문서 순서로 훑으므로 select_one/find와 같은 요소를 돌려줍니다.
+    """
+
+    def __init__(self, soup):
+        self.first_by_id: Dict[str, object] = {}
+        self.by_class: Dict[str, List] = {}
+        self.first_by_name: Dict[str, object] = {}
+        self.first_fallback_div = None
+        for tag in soup.find_all(True):
+            tag_id = tag.get('id')
+            if tag_id in _CANDIDATE_IDS and tag_id not in self.first_by_id:
+                self.first_by_id[tag_id] = tag
+            classes = tag.get('class') or ()
+            for cls in classes:
+                if cls in _CANDIDATE_CLASSES:
+                    self.by_class.setdefault(cls, []).append(tag)
+            if tag.name in ('article', 'main') and tag.name not in self.first_by_name:
+                self.first_by_name[tag.name] = tag
+            elif (tag.name == 'div' and self.first_fallback_div is None
+                    and any(FALLBACK_CLASS_PATTERN.search(cls) for cls in classes)):
+                self.first_fallback_div = tag
+
+    def select_one(self, selector: str):
+        """select_one과 같은 결과 (선택자 목록의 형식만 지원)"""
+        first, _, rest = selector.partition(' ')
+        if first.startswith('#'):
+            anchors = [self.first_by_id[first[1:]]] if first[1:] in self.first_by_id else []
+        else:
+            anchors = self.by_class.get(first[1:], [])
+        if not rest:
+            return anchors[0] if anchors else None
+        for anchor in anchors:
+            found = anchor.select_one(rest)
+            if found:
+                return found
+        return None
+
+
+def find_press_name(index: _CandidateIndex) -> Optional[str]:
+    """네이버 뉴스 페이지의 언론사 이름 (찾지 못하면 None)"""
+    for selector in PRESS_SELECTORS:
+        press_elem = index.select_one(selector)
+        if press_elem:
+            source_name = press_elem.get('alt', '') or press_elem.get_text(strip=True)
+            if source_name:
+                return source_name
+    return None
+
+
+def find_body(index: _CandidateIndex):
+    """본문 요소 (본문 선택자 → <article> → <main> → 본문 클래스 <div> 순)"""
+    for selector in BODY_SELECTORS:
+        article_content = index.select_one(selector)
+        if article_content:
+            return article_content
+    return index.first_by_name.get('article') or index.first_by_name.get('main') or index.first_fallback_div
+
+
+def body_text(article_content) -> str:
+    """본문 요소의 텍스트 (스크립트/스타일/iframe 제거, 연속된 줄바꿈 정리)"""
+    for script in article_content.find_all(REMOVED_TAGS):
+        script.decompose()
+    text = article_content.get_text(separator='\n', strip=True)
+    text = re.sub(r'\n{3,}', '\n\n', text)  # 연속된 줄바꿈 정리
+    return text.strip()
+
+
+def extract_article(html: str, with_press: bool = False,
+                    parser: Optional[str] = None) -> Tuple[Optional[str], Optional[str]]:
+    """HTML에서 (본문 텍스트, 언론사 이름) 추출 - 본문이 없으면 텍스트는 None
+
+    with_press=True이면 (네이버 뉴스) 언론사 선택자도 찾습니다.
+    """
+    soup = BeautifulSoup(html, parser_name(parser), parse_only=CANDIDATES)
+    index = _CandidateIndex(soup)
+    source_name = find_press_name(index) if with_press else None
+    article_content = find_body(index)
+    if not article_content:
+        return None, source_name
+    return body_text(article_content), source_name
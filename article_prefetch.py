@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+기사 본문 미리 가져오기 - 크롤링에서 새로 저장한 기사의 본문을 백그라운드에서 가져와 압축 보관
+
+기사 본문은 누군가 기사를 처음 열 때 가져오므로 그 사람은 원문 요청, 파싱,
+(영어 기사는) 번역을 기다려야 합니다. ARTICLE_PREFETCH=true이면 크롤링 결과를
+저장한 직후 새 기사 ID의 본문을 워커 풀에서 get_full_article(기존 본문 선택자와
+번역 그대로)로 가져와 article_bodies/<업체>/<기사 ID>.json.z에 zlib으로 압축해
+저장하고, /api/article 요청에 article_id가 있으면 여기서 바로 돌려줍니다.
+
+- 같은 사이트에는 ARTICLE_PREFETCH_DOMAIN_INTERVAL초에 한 번만 요청하고, 작업을
+  사이트별로 번갈아 넣어 워커가 한 사이트를 기다리느라 멈추지 않게 합니다.
+- 원문 URL을 풀 수 없는 구글 뉴스 링크는 본문을 추출할 수 없어 건너뜁니다.
+- 본문을 가져오지 못한 기사는 저장하지 않습니다 (열 때 다시 시도).
+"""
+
+import json
+import os
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+import atomic_file
+from url_canonical import unwrap_redirect
+
+# 미리 가져오기 설정 (환경 변수로 조정 가능)
+ARTICLE_PREFETCH_ENABLED = os.environ.get('ARTICLE_PREFETCH', 'false').lower() == 'true'
+ARTICLE_PREFETCH_WORKERS = int(os.environ.get('ARTICLE_PREFETCH_WORKERS', 4))
+# 같은 사이트에 보내는 요청 사이의 최소 간격 (초)
+ARTICLE_PREFETCH_DOMAIN_INTERVAL = float(os.environ.get('ARTICLE_PREFETCH_DOMAIN_INTERVAL', 2))
+# 크롤링 한 번에 미리 가져올 최대 기사 수 (최신 기사부터)
+ARTICLE_PREFETCH_MAX_ARTICLES = int(os.environ.get('ARTICLE_PREFETCH_MAX_ARTICLES', 50))
+
+ARTICLE_BODY_DIR = os.environ.get('ARTICLE_BODY_DIR', str(Path(__file__).parent / "article_bodies"))
+# 업체별로 보관할 최대 본문 수 (넘으면 오래된 파일부터 삭제)
+ARTICLE_BODY_MAX_ENTRIES = int(os.environ.get('ARTICLE_BODY_MAX_ENTRIES', 2000))
+
+# 본문을 추출할 수 없는 (원문으로 풀리지 않은) 링크의 호스트
+_UNFETCHABLE_HOSTS = ("news.google.com",)
+
+
+class ArticleBodyStore:
+    """기사 ID별 본문 저장소 (get_full_article 결과를 zlib 압축 JSON 파일로 보관)"""
+
+    SUFFIX = ".json.z"
+
+    def __init__(self, directory=ARTICLE_BODY_DIR, max_entries: int = ARTICLE_BODY_MAX_ENTRIES):
+        self.directory = Path(directory)
+        self.max_entries = max_entries
+
+    def _path(self, company: str, article_id: str) -> Optional[Path]:
+        # 요청으로 받은 값이 경로를 벗어나지 않도록 영숫자 ID만 허용
+        if not article_id.isalnum() or not company.replace("_", "").isalnum():
+            return None
+        return self.directory / company / f"{article_id}{self.SUFFIX}"
+
+    def has(self, company: str, article_id: str) -> bool:
+        path = self._path(company, article_id)
+        return path is not None and path.exists()
+
+    def get(self, company: str, article_id: str) -> Optional[Dict]:
+        """저장된 본문 (없거나 읽을 수 없으면 None)"""
+        path = self._path(company, article_id)
+        if path is None:
+            return None
+        try:
+            return json.loads(zlib.decompress(path.read_bytes()).decode('utf-8'))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, zlib.error) as e:
+            print(f"[본문 저장소] 읽기 오류 ({company}/{article_id}): {str(e)}")
+            return None
+
+    def put(self, company: str, article_id: str, result: Dict):
+        path = self._path(company, article_id)
+        if path is None:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = json.dumps(result, ensure_ascii=False).encode('utf-8')
+        atomic_file.write_bytes(path, zlib.compress(data, 6))
+
+    def prune(self, company: str):
+        """업체별 최대 개수를 넘는 본문을 오래된 파일부터 삭제"""
+        try:
+            files = sorted((path.stat().st_mtime, path)
+                           for path in (self.directory / company).glob(f"*{self.SUFFIX}"))
+        except OSError:
+            return
+        for _, path in files[:max(0, len(files) - self.max_entries)]:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+
+class DomainLimiter:
+    """사이트(호스트)별 요청 간격 제한 - 같은 사이트 요청은 interval초 간격으로 차례로 실행"""
+
+    def __init__(self, interval: float = ARTICLE_PREFETCH_DOMAIN_INTERVAL):
+        self.interval = max(0.0, interval)
+        self._lock = threading.Lock()
+        self._next_at: Dict[str, float] = {}
+
+    def wait(self, domain: str):
+        """domain에 요청해도 되는 시각까지 대기 (대기 순서대로 시각을 예약)"""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_at.get(domain, 0.0))
+            self._next_at[domain] = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+def interleave_by_domain(tasks: List[Dict]) -> List[Dict]:
+    """사이트별로 한 개씩 번갈아 나오도록 작업 순서 재배열 (사이트 안의 순서는 유지)"""
+    by_domain: "OrderedDict[str, List[Dict]]" = OrderedDict()
+    for task in tasks:
+        by_domain.setdefault(task["domain"], []).append(task)
+    ordered = []
+    queues = [list(reversed(queue)) for queue in by_domain.values()]
+    while queues:
+        for queue in queues:
+            ordered.append(queue.pop())
+        queues = [queue for queue in queues if queue]
+    return ordered
+
+
+class ArticlePrefetcher:
+    """새 기사 본문을 백그라운드 워커 풀에서 가져와 ArticleBodyStore에 저장"""
+
+    def __init__(self, bodies: ArticleBodyStore, enabled: bool = ARTICLE_PREFETCH_ENABLED,
+                 workers: int = ARTICLE_PREFETCH_WORKERS,
+                 domain_interval: float = ARTICLE_PREFETCH_DOMAIN_INTERVAL,
+                 max_articles: int = ARTICLE_PREFETCH_MAX_ARTICLES):
+        self.bodies = bodies
+        self.enabled = enabled
+        self.workers = max(1, workers)
+        self.max_articles = max_articles
+        self.limiter = DomainLimiter(domain_interval)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._in_flight = set()  # (업체, 기사 ID) - 같은 기사를 두 번 가져오지 않음
+        self._lock = threading.Lock()
+        self.stats = {"fetched": 0, "stored": 0, "failed": 0, "skipped": 0}
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="prefetch")
+            return self._executor
+
+    def _plan(self, company: str, articles: List[Dict]) -> List[Dict]:
+        """미리 가져올 작업 목록 (이미 저장했거나 가져오는 중이거나 추출할 수 없는 기사 제외)"""
+        tasks = []
+        for article in articles:
+            article_id = article.get("article_id", "")
+            url = unwrap_redirect(article.get("link", ""))
+            domain = urlparse(url).netloc.lower()
+            if not domain or any(domain.endswith(host) for host in _UNFETCHABLE_HOSTS):
+                self._count("skipped")
+                continue
+            key = (company, article_id)
+            with self._lock:
+                if key in self._in_flight or self.bodies.has(company, article_id):
+                    continue
+                self._in_flight.add(key)
+            tasks.append({"article_id": article_id, "url": url, "domain": domain})
+            if len(tasks) >= self.max_articles:
+                break
+        return interleave_by_domain(tasks)
+
+    def submit(self, company: str, crawler, articles: List[Dict]) -> int:
+        """새 기사 본문 미리 가져오기 시작 (기다리지 않음, 반환: 등록한 작업 수)"""
+        if not self.enabled or not articles or not hasattr(crawler, "get_full_article"):
+            return 0
+        tasks = self._plan(company, articles)
+        if not tasks:
+            return 0
+        started = time.perf_counter()
+        executor = self._get_executor()
+        futures = [executor.submit(self._fetch, company, crawler, task) for task in tasks]
+
+        def report():
+            stored = sum(1 for future in futures if future.result())
+            self.bodies.prune(company)
+            print(f"[본문 미리 가져오기] {company}: {stored}/{len(tasks)}개 저장 "
+                  f"({time.perf_counter() - started:.1f}초) - 누적 {self.format_stats()}")
+
+        threading.Thread(target=report, name="prefetch-report", daemon=True).start()
+        print(f"[본문 미리 가져오기] {company}: 새 기사 {len(tasks)}개 본문 가져오기 시작")
+        return len(tasks)
+
+    def _count(self, name: str):
+        with self._lock:
+            self.stats[name] += 1
+
+    def format_stats(self) -> str:
+        with self._lock:
+            stats = dict(self.stats)
+        return (f"가져옴 {stats['fetched']}개, 저장 {stats['stored']}개, "
+                f"실패 {stats['failed']}개, 건너뜀 {stats['skipped']}개")
+
+    def _fetch(self, company: str, crawler, task: Dict) -> bool:
+        try:
+            self.limiter.wait(task["domain"])
+            result = crawler.get_full_article(task["url"])
+            self._count("fetched")
+            if not result or not result.get("success"):
+                self._count("failed")
+                return False
+            self.bodies.put(company, task["article_id"], result)
+            self._count("stored")
+            return True
+        except Exception as e:
+            self._count("failed")
+            print(f"[본문 미리 가져오기 오류] {task['url'][:80]}: {str(e)}")
+            return False
+        finally:
+            with self._lock:
+                self._in_flight.discard((company, task["article_id"]))
+
+
+# 프로세스 전체에서 공유하는 본문 저장소 / 미리 가져오기 워커
+article_bodies = ArticleBodyStore()
+article_prefetcher = ArticlePrefetcher(article_bodies)
@@ -0,0 +1,879 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+기사 저장소 - 추가/삭제를 로그에 덧붙이고 data.json은 변경이 있을 때만 생성
+
+업데이트나 삭제마다 data.json 전체를 다시 쓰는 대신 변경분만 기록하고,
+대시보드가 읽는 data.json은 저장소 내용의 스냅샷(materialized view)으로
+필요할 때만 다시 만듭니다.
+
+저장 방식은 ARTICLE_STORE 환경 변수로 선택합니다.
+  sqlite - SQLite(FTS5) 색인 저장소, 전문 검색/기간 조회 지원 (기본값)
+  jsonl  - JSON-lines 추가 전용 로그
+"""
+
+import base64
+import json
+import os
+import sqlite3
+import threading
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import atomic_file
+import static_cache
+from article_dates import KST, article_timestamp, ensure_pub_date
+
+# 로그 줄 수가 (살아있는 기사 수 * 배수 + 여유분)을 넘으면 압축
+COMPACT_RATIO = 2
+COMPACT_SLACK = 500
+
+# 업체별로 보관할 최근 변경(추가/삭제) 기록 수 - 이보다 오래된 marker로 조회하면 reset
+CHANGE_LOG_MAX_ENTRIES = int(os.environ.get('ARTICLE_CHANGE_LOG_MAX', 1000))
+
+# 검색 API 페이지 크기
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+# 검색 대상 필드
+SEARCH_FIELDS = ("title", "description", "title_translated", "description_translated")
+
+# SQLite 저장소 파일 (모든 업체 공용, company 컬럼으로 구분)
+ARTICLE_DB_FILE = os.environ.get('ARTICLE_DB', str(Path(__file__).parent / "articles.db"))
+
+
+def _check_fts5() -> bool:
+    """FTS5 trigram 토크나이저 지원 여부 (SQLite 3.34 이상)"""
+    try:
+        conn = sqlite3.connect(":memory:")
+        try:
+            conn.execute("CREATE VIRTUAL TABLE t USING fts5(x, tokenize='trigram')")
+        finally:
+            conn.close()
+        return True
+    except sqlite3.Error:
+        return False
+
+
+FTS5_AVAILABLE = _check_fts5()
+ARTICLE_STORE_BACKEND = os.environ.get('ARTICLE_STORE', 'sqlite' if FTS5_AVAILABLE else 'jsonl').lower()
+
+
+def get_kst_now():
+    """한국 시간 현재 시각 반환"""
+    return datetime.now(KST)
+
+
+def pub_date_sort_key(article: Dict) -> int:
+    """정렬 키 - 수집 시 정규화한 발행 시각 (epoch 초)"""
+    return article_timestamp(article)
+
+
+def encode_cursor(sort_key: int, article_id: str) -> str:
+    """(정렬 키, 기사 ID)를 URL에 넣을 수 있는 커서 문자열로 변환"""
+    raw = json.dumps([sort_key, article_id], ensure_ascii=False).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Tuple[int, str]:
+    """커서 문자열 해석 (형식이 잘못되면 ValueError)"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        sort_key, article_id = json.loads(raw.decode('utf-8'))
+        return int(sort_key), str(article_id)
+    except Exception:
+        raise ValueError(f"잘못된 커서: {cursor}")
+
+
+def _date_bound(value: Optional[str], end: bool) -> Optional[int]:
+    """from/to 파라미터("YYYY-MM-DD" 또는 "YYYY-MM-DD HH:MM:SS", KST)를 정렬 키 범위로 변환"""
+    if not value:
+        return None
+    value = value.strip().replace('T', ' ')
+    if len(value) == 10:
+        value += " 23:59:59" if end else " 00:00:00"
+    try:
+        dt = datetime.strptime(value[:19], "%Y-%m-%d %H:%M:%S")
+    except ValueError:
+        raise ValueError(f"잘못된 날짜: {value}")
+    return int(dt.replace(tzinfo=KST).timestamp())
+
+
+def _search_terms(q: Optional[str]) -> List[str]:
+    return [term.lower() for term in (q or "").split() if term]
+
+
+class ArticleStore:
+    """기사 저장소 공통 인터페이스"""
+
+    def __init__(self, data_file):
+        self.data_file = Path(data_file)
+        # 마지막 data.json 생성 이후 삭제한 기사 (외부 변경 병합 시 되살리지 않도록)
+        self._deleted_since_mat: Set[str] = set()
+
+    def ids(self) -> Set[str]:
+        """저장된 기사 ID 집합"""
+        raise NotImplementedError
+
+    def articles(self) -> List[Dict]:
+        """최신순으로 정렬된 전체 기사"""
+        raise NotImplementedError
+
+    def get_article(self, article_id: str) -> Optional[Dict]:
+        """기사 하나 (없으면 None)"""
+        raise NotImplementedError
+
+    def count(self) -> int:
+        return len(self.ids())
+
+    def add_articles(self, articles: Iterable[Dict]) -> List[Dict]:
+        """새 기사 추가 (이미 있는 ID는 무시), 실제로 추가된 기사 반환"""
+        raise NotImplementedError
+
+    def update_articles(self, articles: Iterable[Dict]) -> List[Dict]:
+        """저장된 기사 내용 교체 (없는 ID는 무시), 실제로 바뀐 기사 반환
+
+        바뀐 기사는 변경 기록에 남으므로 changes_since의 articles에 다시 나옵니다.
+        """
+        raise NotImplementedError
+
+    def delete_article(self, article_id: str) -> bool:
+        """기사 삭제 (없으면 False)"""
+        raise NotImplementedError
+
+    def materialize(self, force: bool = False) -> bool:
+        """변경이 있으면 data.json 다시 생성 (생성했으면 True)
+
+        data.json이 마지막으로 생성/로드한 뒤 외부(번역 백필, 발행일 변환 스크립트,
+        단독 실행 크롤러 등)에서 바뀌었으면 덮어쓰기 전에 그 내용을 저장소에 병합합니다.
+        """
+        raise NotImplementedError
+
+    def marker(self) -> str:
+        """현재 변경 위치 표시 (changes_since에 넘기는 값)"""
+        raise NotImplementedError
+
+    def changes_since(self, marker: str) -> Dict:
+        """marker 이후 추가/삭제된 기사
+
+        반환: {"marker": 새 위치, "reset": 처음부터 다시 받아야 하는지,
+               "articles": 추가된 기사(최신순), "deleted": 삭제된 기사 ID, "total": 전체 개수}
+        marker가 이 저장소에서 발급한 값이 아니거나(재시작, 재구성, 저장 방식 변경)
+        변경이 너무 많으면 reset=True를 반환합니다.
+        """
+        raise NotImplementedError
+
+    def search(self, q: Optional[str] = None, date_from: Optional[str] = None,
+               date_to: Optional[str] = None, source: Optional[str] = None,
+               source_type: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE,
+               cursor: Optional[str] = None) -> Dict:
+        """기사 검색 (최신순, 커서 기반 페이지)
+
+        q는 공백으로 구분한 단어가 모두 제목/요약(번역 포함)에 포함된 기사를 찾습니다.
+        반환: {"articles": [...], "total": 조건에 맞는 전체 개수, "next_cursor": 다음 페이지 커서,
+               "marker": 조회 시점의 변경 위치}
+        기본 구현은 메모리에서 걸러내며, 색인이 있는 저장소는 재정의합니다.
+        """
+        limit = max(1, min(int(limit), MAX_PAGE_SIZE))
+        after = decode_cursor(cursor) if cursor else None
+        terms = _search_terms(q)
+        lower = _date_bound(date_from, end=False)
+        upper = _date_bound(date_to, end=True)
+
+        marker = self.marker()
+        matched = []
+        for article in self.articles():
+            key = pub_date_sort_key(article)
+            if lower is not None and key < lower or upper is not None and key > upper:
+                continue
+            if source and article.get("source") != source:
+                continue
+            if source_type and article.get("source_type") != source_type:
+                continue
+            if terms:
+                text = " ".join(str(article.get(field) or "") for field in SEARCH_FIELDS).lower()
+                if not all(term in text for term in terms):
+                    continue
+            matched.append((key, article.get("article_id", ""), article))
+        matched.sort(key=lambda item: (item[0], item[1]), reverse=True)
+
+        page = [item for item in matched if after is None or (item[0], item[1]) < after]
+        has_more = len(page) > limit
+        page = page[:limit]
+        return {
+            "articles": [item[2] for item in page],
+            "total": len(matched),
+            "next_cursor": encode_cursor(page[-1][0], page[-1][1]) if has_more else None,
+            "marker": marker,
+        }
+
+    def _load_data_file(self) -> Optional[List[Dict]]:
+        """data.json의 기사 목록 (읽을 수 없으면 None - 저장소 내용을 비우지 않도록)"""
+        try:
+            data = atomic_file.read_json(self.data_file, {})
+            return data.get("articles", [])
+        except Exception as e:
+            print(f"[저장소] 데이터 로드 오류: {str(e)}")
+            return None
+
+    def _data_file_mtime(self) -> Optional[int]:
+        try:
+            return self.data_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def _merge_external_changes(self, known_mtime: Optional[int]) -> bool:
+        """data.json이 known_mtime 이후 외부에서 바뀌었으면 저장소에 병합 (병합했으면 True)
+
+        파일에만 있는 기사는 추가하고(마지막 생성 이후 삭제한 기사 제외), 양쪽에
+        있는 기사는 파일 내용으로 바꿉니다. 저장소에만 있는 기사(아직 data.json에
+        반영하지 않은 새 기사)는 그대로 둡니다. 호출하는 쪽이 잠금을 잡고 있어야 합니다.
+        """
+        mtime = self._data_file_mtime()
+        if mtime is None or mtime == known_mtime:
+            return False
+        articles = self._load_data_file()
+        if articles is None:
+            return False  # 읽을 수 없는 파일은 (손상본을 보관했으므로) 저장소 내용으로 다시 씀
+        ids = self.ids()
+        new_articles = [article for article in articles
+                        if article.get("article_id") and article["article_id"] not in ids
+                        and article["article_id"] not in self._deleted_since_mat]
+        added = self.add_articles(new_articles)
+        updated = self.update_articles(article for article in articles if article.get("article_id") in ids)
+        print(f"[저장소] {self.data_file}이 외부에서 변경됨 - 새 기사 {len(added)}개, "
+              f"바뀐 기사 {len(updated)}개를 병합한 뒤 다시 생성")
+        return True
+
+    def _write_data_file(self, articles: List[Dict]):
+        """대시보드용 data.json 작성 (save_to_json과 같은 형식)"""
+        data = {
+            "last_updated": get_kst_now().strftime('%Y-%m-%d %H:%M:%S'),
+            "total_count": len(articles),
+            "articles": articles
+        }
+        atomic_file.write_json(self.data_file, data)
+        # 정적 서빙용 gzip/brotli 압축본도 함께 갱신
+        static_cache.compress_file(self.data_file)
+        print(f"[저장 완료] {self.data_file}에 {len(articles)}개의 기사 저장")
+
+
+class JsonlArticleStore(ArticleStore):
+    """JSON-lines 추가 전용 로그 기반 저장소
+
+    로그 레코드:
+      {"op": "add", "article": {...}}
+      {"op": "del", "article_id": "..."}
+      {"op": "mat", "mtime_ns": ...}   # data.json 생성 시점 기록
+
+    열 때 data.json이 마지막 생성 이후 외부에서 바뀌었으면(GitHub 복원,
+    번역 백필 스크립트 등) data.json을 기준으로 로그를 다시 만듭니다.
+
+    변경 위치(marker)는 프로세스 안에서만 유지하므로, 재시작하면 이전에
+    발급한 marker로 조회할 때 reset이 됩니다. 변경 기록은 최근
+    CHANGE_LOG_MAX_ENTRIES개만 보관하며, 그보다 오래된 marker도 reset이 됩니다.
+    """
+
+    def __init__(self, data_file, log_file=None):
+        super().__init__(data_file)
+        self.log_file = Path(log_file) if log_file else self.data_file.parent / "articles.log.jsonl"
+        self._lock = threading.RLock()
+        self._articles: Dict[str, Dict] = {}
+        self._log_lines = 0
+        self._dirty = False
+        self._last_mat_mtime: Optional[int] = None
+        self._epoch = uuid.uuid4().hex[:8]
+        self._changes: List[Tuple[str, str]] = []  # (op, article_id)
+        self._changes_base = 0  # _changes[0]의 변경 위치 (앞쪽 기록은 잘라냄)
+        self._open()
+
+    # ------------------------------------------------------------------ 로드
+    def _open(self):
+        if self.log_file.exists():
+            self._replay()
+        data_mtime = self._data_file_mtime()
+        if data_mtime is not None and data_mtime != self._last_mat_mtime:
+            # 로그가 없거나 data.json이 외부에서 변경됨 → data.json 기준으로 재구성
+            articles = self._load_data_file()
+            if articles is None:
+                # data.json이 손상됨 → 로그 내용을 유지하고 다음 생성 때 data.json을 다시 씀
+                self._dirty = True
+                return
+            self._articles = {}
+            for article in articles:
+                if article.get("article_id"):
+                    self._articles[article["article_id"]] = ensure_pub_date(article)
+            self._last_mat_mtime = data_mtime
+            self._dirty = False
+            self._rewrite_log()
+            print(f"[저장소] {self.data_file} 기준으로 로그 재구성 ({len(self._articles)}개)")
+
+    def _replay(self):
+        """로그를 재생해 기사 목록과 마지막 data.json 생성 시각 복원"""
+        self._articles = {}
+        self._log_lines = 0
+        self._dirty = True
+        with open(self.log_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # 비정상 종료로 마지막 줄이 잘린 경우
+                    print(f"[저장소] 손상된 로그 줄 무시: {self.log_file}")
+                    continue
+                self._log_lines += 1
+                op = record.get("op")
+                if op == "add":
+                    article = ensure_pub_date(record["article"])
+                    self._articles[article["article_id"]] = article
+                elif op == "del":
+                    self._articles.pop(record.get("article_id"), None)
+                elif op == "mat":
+                    self._last_mat_mtime = record.get("mtime_ns")
+                # 마지막 생성 이후 변경이 있으면 다시 생성해야 함
+                self._dirty = op != "mat"
+
+    # ------------------------------------------------------------------ 로그
+    def _append(self, records: List[Dict]):
+        if not records:
+            return
+        with open(self.log_file, 'a', encoding='utf-8') as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self._log_lines += len(records)
+
+    def _rewrite_log(self):
+        """살아있는 기사만으로 로그 압축
+
+        data.json 생성 기록은 유지합니다. 아직 data.json에 반영되지 않은
+        변경이 있으면 생성 기록을 맨 앞에 두어 다시 열었을 때도 재생성 대상이 됩니다.
+        """
+        mat_record = json.dumps({"op": "mat", "mtime_ns": self._last_mat_mtime}) + "\n"
+        tmp_file = self.log_file.with_suffix(self.log_file.suffix + ".tmp")
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            if self._dirty:
+                f.write(mat_record)
+            for article in self._articles.values():
+                f.write(json.dumps({"op": "add", "article": article}, ensure_ascii=False) + "\n")
+            if not self._dirty:
+                f.write(mat_record)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.log_file)
+        self._log_lines = len(self._articles) + 1
+
+    def _maybe_compact(self):
+        if self._log_lines > len(self._articles) * COMPACT_RATIO + COMPACT_SLACK:
+            self._rewrite_log()
+
+    def _record_changes(self, changes: Iterable[Tuple[str, str]]):
+        """변경 기록 추가 (최근 CHANGE_LOG_MAX_ENTRIES개만 남김)"""
+        self._changes.extend(changes)
+        overflow = len(self._changes) - CHANGE_LOG_MAX_ENTRIES
+        if overflow > 0:
+            del self._changes[:overflow]
+            self._changes_base += overflow
+
+    # ------------------------------------------------------------ 인터페이스
+    def ids(self) -> Set[str]:
+        with self._lock:
+            return set(self._articles)
+
+    def count(self) -> int:
+        with self._lock:
+            return len(self._articles)
+
+    def get_article(self, article_id: str) -> Optional[Dict]:
+        with self._lock:
+            return self._articles.get(article_id)
+
+    def articles(self) -> List[Dict]:
+        with self._lock:
+            articles = list(self._articles.values())
+        # 검색/페이지 커서와 같은 순서 (같은 시각이면 기사 ID 역순)
+        articles.sort(key=lambda article: (pub_date_sort_key(article), article.get("article_id", "")), reverse=True)
+        return articles
+
+    def add_articles(self, articles: Iterable[Dict]) -> List[Dict]:
+        with self._lock:
+            added = []
+            for article in articles:
+                article_id = article.get("article_id")
+                if article_id and article_id not in self._articles:
+                    self._articles[article_id] = ensure_pub_date(article)
+                    added.append(article)
+            self._append([{"op": "add", "article": article} for article in added])
+            self._record_changes(("add", article["article_id"]) for article in added)
+            if added:
+                self._dirty = True
+                self._maybe_compact()
+            return added
+
+    def update_articles(self, articles: Iterable[Dict]) -> List[Dict]:
+        with self._lock:
+            updated = []
+            for article in articles:
+                article_id = article.get("article_id")
+                if article_id in self._articles and self._articles[article_id] != ensure_pub_date(article):
+                    self._articles[article_id] = article
+                    updated.append(article)
+            # 재생할 때 add는 같은 ID의 기사를 교체함
+            self._append([{"op": "add", "article": article} for article in updated])
+            self._record_changes(("upd", article["article_id"]) for article in updated)
+            if updated:
+                self._dirty = True
+                self._maybe_compact()
+            return updated
+
+    def delete_article(self, article_id: str) -> bool:
+        with self._lock:
+            if article_id not in self._articles:
+                return False
+            del self._articles[article_id]
+            self._append([{"op": "del", "article_id": article_id}])
+            self._record_changes([("del", article_id)])
+            self._deleted_since_mat.add(article_id)
+            self._dirty = True
+            self._maybe_compact()
+            return True
+
+    def materialize(self, force: bool = False) -> bool:
+        with self._lock:
+            if self._merge_external_changes(self._last_mat_mtime):
+                force = True
+            if not (self._dirty or force) and self.data_file.exists():
+                return False
+            self._write_data_file(self.articles())
+            self._last_mat_mtime = self._data_file_mtime()
+            self._append([{"op": "mat", "mtime_ns": self._last_mat_mtime}])
+            self._dirty = False
+            self._deleted_since_mat.clear()
+            self._maybe_compact()
+            return True
+
+    def marker(self) -> str:
+        with self._lock:
+            return f"{self._epoch}.{self._changes_base + len(self._changes)}"
+
+    def changes_since(self, marker: str) -> Dict:
+        epoch, _, position = marker.partition(".")
+        with self._lock:
+            current = self.marker()
+            total = len(self._articles)
+            offset = int(position) - self._changes_base if position.isdigit() else -1
+            if epoch != self._epoch or not 0 <= offset <= len(self._changes):
+                return {"marker": current, "reset": True, "articles": [], "deleted": [], "total": total}
+            changes = self._changes[offset:]
+            added_ids = {article_id for op, article_id in changes if op in ("add", "upd")}
+            deleted = [article_id for op, article_id in changes if op == "del"]
+            added = [self._articles[article_id] for article_id in added_ids if article_id in self._articles]
+        if len(added) > MAX_PAGE_SIZE:
+            return {"marker": current, "reset": True, "articles": [], "deleted": [], "total": total}
+        added.sort(key=lambda article: (pub_date_sort_key(article), article.get("article_id", "")), reverse=True)
+        return {"marker": current, "reset": False, "articles": added, "deleted": deleted, "total": total}
+
+
+class SqliteArticleStore(ArticleStore):
+    """SQLite(FTS5) 색인 저장소
+
+    모든 업체가 하나의 DB 파일을 쓰고 (company, article_id)로 기사를 구분합니다.
+    업체/발행일/출처/출처 유형 색인과 제목·요약 전문 검색 색인(trigram,
+    한국어 부분 문자열 검색 가능)을 유지합니다.
+
+    data.json 생성 기록(mtime)은 store_meta 테이블에 저장하며, 열 때 data.json이
+    외부에서 바뀌었으면 data.json을 기준으로 해당 업체 행을 다시 만듭니다.
+
+    추가/삭제마다 changes 테이블에 증가하는 일련번호(seq)를 남기며, 이 번호가
+    클라이언트에 주는 변경 위치(marker)입니다. 재구성하면 그 이전 marker는
+    reset 대상이 됩니다 (store_meta.reset_seq). changes 테이블은 업체별로 최근
+    CHANGE_LOG_MAX_ENTRIES개만 남기고, 잘라낸 기록 이전 marker도 reset 대상이 됩니다.
+    """
+
+    # 스키마가 바뀌면 올림 (DB는 data.json에서 재구성 가능하므로 다시 만듦)
+    SCHEMA_VERSION = 3
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS articles (
+            id INTEGER PRIMARY KEY,
+            company TEXT NOT NULL,
+            article_id TEXT NOT NULL,
+            seq INTEGER NOT NULL,
+            pub_date TEXT,
+            pub_ts INTEGER NOT NULL,
+            source TEXT,
+            source_type TEXT,
+            data TEXT NOT NULL,
+            UNIQUE (company, article_id)
+        );
+        CREATE INDEX IF NOT EXISTS idx_articles_pub ON articles (company, pub_ts DESC, article_id DESC);
+        CREATE INDEX IF NOT EXISTS idx_articles_source ON articles (company, source);
+        CREATE INDEX IF NOT EXISTS idx_articles_source_type ON articles (company, source_type);
+        CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5 (
+            title, description, title_translated, description_translated,
+            tokenize = 'trigram'
+        );
+        CREATE TABLE IF NOT EXISTS changes (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            company TEXT NOT NULL,
+            article_id TEXT NOT NULL,
+            op TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_changes_company ON changes (company, seq);
+        CREATE TABLE IF NOT EXISTS store_meta (
+            company TEXT PRIMARY KEY,
+            mat_mtime_ns INTEGER,
+            dirty INTEGER NOT NULL DEFAULT 0,
+            reset_seq INTEGER NOT NULL DEFAULT 0
+        );
+    """
+
+    def __init__(self, data_file, company: str, db_file=None):
+        super().__init__(data_file)
+        self.company = company
+        self.db_file = Path(db_file or ARTICLE_DB_FILE)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.db_file), check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._migrate()
+        self._open()
+
+    def _migrate(self):
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != self.SCHEMA_VERSION:
+            with self._conn:
+                for table in ("articles", "articles_fts", "changes", "store_meta"):
+                    self._conn.execute(f"DROP TABLE IF EXISTS {table}")
+                self._conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+        self._conn.executescript(self._SCHEMA)
+
+    # ------------------------------------------------------------------ 로드
+    def _get_meta(self) -> Tuple[Optional[int], bool]:
+        row = self._conn.execute(
+            "SELECT mat_mtime_ns, dirty FROM store_meta WHERE company = ?", (self.company,)
+        ).fetchone()
+        return (row[0], bool(row[1])) if row else (None, False)
+
+    def _set_meta(self, mtime_ns: Optional[int], dirty: bool):
+        self._conn.execute(
+            "INSERT INTO store_meta (company, mat_mtime_ns, dirty) VALUES (?, ?, ?) "
+            "ON CONFLICT(company) DO UPDATE SET mat_mtime_ns = excluded.mat_mtime_ns, dirty = excluded.dirty",
+            (self.company, mtime_ns, int(dirty))
+        )
+
+    def _record_change(self, article_id: str, op: str) -> int:
+        return self._conn.execute(
+            "INSERT INTO changes (company, article_id, op) VALUES (?, ?, ?)",
+            (self.company, article_id, op)
+        ).lastrowid
+
+    def _current_seq(self) -> int:
+        row = self._conn.execute(
+            "SELECT MAX(seq) FROM changes WHERE company = ?", (self.company,)
+        ).fetchone()
+        return row[0] or 0
+
+    def _reset_seq(self) -> int:
+        row = self._conn.execute(
+            "SELECT reset_seq FROM store_meta WHERE company = ?", (self.company,)
+        ).fetchone()
+        return row[0] if row else 0
+
+    def _prune_changes(self):
+        """트랜잭션 안에서 호출, 최근 CHANGE_LOG_MAX_ENTRIES개보다 오래된 변경 기록 삭제"""
+        row = self._conn.execute(
+            "SELECT seq FROM changes WHERE company = ? ORDER BY seq DESC LIMIT 1 OFFSET ?",
+            (self.company, CHANGE_LOG_MAX_ENTRIES)
+        ).fetchone()
+        if row is None:
+            return
+        self._conn.execute("DELETE FROM changes WHERE company = ? AND seq <= ?", (self.company, row[0]))
+        # 잘라낸 기록까지의 marker는 더 이상 이어서 조회할 수 없음
+        self._conn.execute(
+            "UPDATE store_meta SET reset_seq = MAX(reset_seq, ?) WHERE company = ?", (row[0], self.company)
+        )
+
+    def _open(self):
+        with self._lock:
+            mat_mtime, _ = self._get_meta()
+            data_mtime = self._data_file_mtime()
+            if data_mtime is not None and data_mtime != mat_mtime:
+                # 처음 열었거나 data.json이 외부에서 변경됨 → data.json 기준으로 재구성
+                articles = self._load_data_file()
+                if articles is None:
+                    # data.json이 손상됨 → 색인 내용을 유지하고 다음 생성 때 data.json을 다시 씀
+                    with self._conn:
+                        self._set_meta(mat_mtime, True)
+                    return
+                with self._conn:
+                    self._conn.execute(
+                        "DELETE FROM articles_fts WHERE rowid IN (SELECT id FROM articles WHERE company = ?)",
+                        (self.company,)
+                    )
+                    self._conn.execute("DELETE FROM articles WHERE company = ?", (self.company,))
+                    self._conn.execute("DELETE FROM changes WHERE company = ?", (self.company,))
+                    self._insert(articles)
+                    self._set_meta(data_mtime, False)
+                    # 재구성 이전에 발급한 marker는 더 이상 이어서 조회할 수 없음
+                    reset_seq = self._record_change("", "reset")
+                    self._conn.execute(
+                        "UPDATE store_meta SET reset_seq = ? WHERE company = ?", (reset_seq, self.company)
+                    )
+                print(f"[저장소] {self.data_file} 기준으로 색인 재구성 ({self.count()}개)")
+
+    def _insert(self, articles: Iterable[Dict]) -> List[Dict]:
+        """트랜잭션 안에서 호출, 새로 들어간 기사 반환"""
+        added = []
+        for article in articles:
+            article_id = article.get("article_id")
+            if not article_id:
+                continue
+            exists = self._conn.execute(
+                "SELECT 1 FROM articles WHERE company = ? AND article_id = ?", (self.company, article_id)
+            ).fetchone()
+            if exists:
+                continue
+            ensure_pub_date(article)
+            cur = self._conn.execute(
+                "INSERT INTO articles "
+                "(company, article_id, seq, pub_date, pub_ts, source, source_type, data) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (self.company, article_id, self._record_change(article_id, "add"),
+                 article.get("pub_date", ""), pub_date_sort_key(article),
+                 article.get("source", ""), article.get("source_type", ""),
+                 json.dumps(article, ensure_ascii=False))
+            )
+            if cur.rowcount:
+                self._index_text(cur.lastrowid, article)
+                added.append(article)
+        return added
+
+    def _index_text(self, rowid: int, article: Dict):
+        """트랜잭션 안에서 호출, 기사의 전문 검색 색인 행 추가"""
+        self._conn.execute(
+            "INSERT INTO articles_fts (rowid, title, description, title_translated, description_translated) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (rowid, *(str(article.get(field) or "") for field in SEARCH_FIELDS))
+        )
+
+    # ------------------------------------------------------------ 인터페이스
+    def ids(self) -> Set[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT article_id FROM articles WHERE company = ?", (self.company,)
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM articles WHERE company = ?", (self.company,)
+            ).fetchone()[0]
+
+    def articles(self) -> List[Dict]:
+        # 검색/페이지 커서와 같은 순서 (같은 시각이면 기사 ID 역순)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT data FROM articles WHERE company = ? ORDER BY pub_ts DESC, article_id DESC",
+                (self.company,)
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def get_article(self, article_id: str) -> Optional[Dict]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM articles WHERE company = ? AND article_id = ?", (self.company, article_id)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def add_articles(self, articles: Iterable[Dict]) -> List[Dict]:
+        with self._lock, self._conn:
+            added = self._insert(articles)
+            if added:
+                self._set_meta(self._get_meta()[0], True)
+                self._prune_changes()
+            return added
+
+    def update_articles(self, articles: Iterable[Dict]) -> List[Dict]:
+        with self._lock, self._conn:
+            updated = []
+            for article in articles:
+                article_id = article.get("article_id")
+                row = self._conn.execute(
+                    "SELECT id, data FROM articles WHERE company = ? AND article_id = ?",
+                    (self.company, article_id)
+                ).fetchone()
+                if row is None:
+                    continue
+                data = json.dumps(ensure_pub_date(article), ensure_ascii=False)
+                if data == row[1]:
+                    continue
+                # 새 일련번호로 바꿔 changes_since에 다시 나오게 함
+                self._conn.execute(
+                    "UPDATE articles SET seq = ?, pub_date = ?, pub_ts = ?, source = ?, source_type = ?, data = ? "
+                    "WHERE id = ?",
+                    (self._record_change(article_id, "upd"),
+                     article.get("pub_date", ""), pub_date_sort_key(article),
+                     article.get("source", ""), article.get("source_type", ""), data, row[0])
+                )
+                self._conn.execute("DELETE FROM articles_fts WHERE rowid = ?", (row[0],))
+                self._index_text(row[0], article)
+                updated.append(article)
+            if updated:
+                self._set_meta(self._get_meta()[0], True)
+                self._prune_changes()
+            return updated
+
+    def delete_article(self, article_id: str) -> bool:
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT id FROM articles WHERE company = ? AND article_id = ?",
+                (self.company, article_id)
+            ).fetchone()
+            if row is None:
+                return False
+            self._conn.execute("DELETE FROM articles_fts WHERE rowid = ?", (row[0],))
+            self._conn.execute("DELETE FROM articles WHERE id = ?", (row[0],))
+            self._record_change(article_id, "del")
+            self._set_meta(self._get_meta()[0], True)
+            self._prune_changes()
+            self._deleted_since_mat.add(article_id)
+            return True
+
+    def materialize(self, force: bool = False) -> bool:
+        with self._lock:
+            mat_mtime, _ = self._get_meta()
+            if self._merge_external_changes(mat_mtime):
+                force = True
+            _, dirty = self._get_meta()
+            if not (dirty or force) and self.data_file.exists():
+                return False
+            self._write_data_file(self.articles())
+            with self._conn:
+                self._set_meta(self._data_file_mtime(), False)
+            self._deleted_since_mat.clear()
+            return True
+
+    def marker(self) -> str:
+        with self._lock:
+            return str(self._current_seq())
+
+    def changes_since(self, marker: str) -> Dict:
+        since = int(marker) if marker.isdigit() else -1
+        with self._lock:
+            current = self._current_seq()
+            total = self.count()
+            result = {"marker": str(current), "reset": True, "articles": [], "deleted": [], "total": total}
+            if since < self._reset_seq() or since > current:
+                return result
+            rows = self._conn.execute(
+                "SELECT data FROM articles WHERE company = ? AND seq > ? "
+                "ORDER BY pub_ts DESC, article_id DESC LIMIT ?",
+                (self.company, since, MAX_PAGE_SIZE + 1)
+            ).fetchall()
+            if len(rows) > MAX_PAGE_SIZE:
+                return result
+            deleted = self._conn.execute(
+                "SELECT article_id FROM changes WHERE company = ? AND op = 'del' AND seq > ? ORDER BY seq",
+                (self.company, since)
+            ).fetchall()
+        result.update({
+            "reset": False,
+            "articles": [json.loads(row[0]) for row in rows],
+            "deleted": [row[0] for row in deleted],
+        })
+        return result
+
+    def search(self, q: Optional[str] = None, date_from: Optional[str] = None,
+               date_to: Optional[str] = None, source: Optional[str] = None,
+               source_type: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE,
+               cursor: Optional[str] = None) -> Dict:
+        limit = max(1, min(int(limit), MAX_PAGE_SIZE))
+        where = ["a.company = ?"]
+        params: List = [self.company]
+
+        lower = _date_bound(date_from, end=False)
+        upper = _date_bound(date_to, end=True)
+        if lower is not None:
+            where.append("a.pub_ts >= ?")
+            params.append(lower)
+        if upper is not None:
+            where.append("a.pub_ts <= ?")
+            params.append(upper)
+        if source:
+            where.append("a.source = ?")
+            params.append(source)
+        if source_type:
+            where.append("a.source_type = ?")
+            params.append(source_type)
+
+        # trigram 색인은 3글자 이상만 검색 가능 → 짧은 단어는 LIKE로 확인
+        fts_terms = []
+        for term in _search_terms(q):
+            if len(term) >= 3:
+                fts_terms.append('"' + term.replace('"', '""') + '"')
+            else:
+                pattern = '%' + term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+                where.append("(" + " OR ".join(
+                    f"lower(f.{field}) LIKE ? ESCAPE '\\'" for field in SEARCH_FIELDS) + ")")
+                params.extend([pattern] * len(SEARCH_FIELDS))
+        if fts_terms:
+            where.append("articles_fts MATCH ?")
+            params.append(" AND ".join(fts_terms))
+
+        join = "JOIN articles_fts f ON f.rowid = a.id" if q and q.strip() else ""
+        base = f"FROM articles a {join} WHERE {' AND '.join(where)}"
+
+        page_where, page_params = "", []
+        if cursor:
+            after_key, after_id = decode_cursor(cursor)
+            page_where = " AND (a.pub_ts, a.article_id) < (?, ?)"
+            page_params = [after_key, after_id]
+
+        with self._lock:
+            marker = str(self._current_seq())
+            total = self._conn.execute(f"SELECT COUNT(*) {base}", params).fetchone()[0]
+            rows = self._conn.execute(
+                f"SELECT a.pub_ts, a.article_id, a.data {base}{page_where} "
+                f"ORDER BY a.pub_ts DESC, a.article_id DESC LIMIT ?",
+                params + page_params + [limit + 1]
+            ).fetchall()
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        return {
+            "articles": [json.loads(row[2]) for row in rows],
+            "total": total,
+            "next_cursor": encode_cursor(rows[-1][0], rows[-1][1]) if has_more else None,
+            "marker": marker,
+        }
+
+
+# 데이터 파일별 저장소 인스턴스 (프로세스 내 공유)
+_stores: Dict[str, ArticleStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_store(data_file, company: Optional[str] = None) -> ArticleStore:
+    """data.json 경로에 해당하는 저장소 반환 (처음 요청 시 로드)
+
+    company는 SQLite 저장소에서 업체를 구분하는 키이며, 생략하면 data.json이
+    있는 폴더 이름을 사용합니다.
+    """
+    key = str(Path(data_file).resolve())
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            if ARTICLE_STORE_BACKEND == 'sqlite' and FTS5_AVAILABLE:
+                store = SqliteArticleStore(data_file, company or Path(key).parent.name)
+            else:
+                store = JsonlArticleStore(data_file)
+            _stores[key] = store
+        return store
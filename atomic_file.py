@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+원자적 파일 쓰기 - 임시 파일에 쓰고 fsync한 뒤 rename으로 교체
+
+data.json, deleted_articles.json 같은 파일을 대상 파일에 바로 덮어쓰면
+대시보드가 쓰는 도중의 파일을 읽거나, 쓰는 중에 프로세스가 죽으면 파일이
+깨집니다. 같은 폴더의 임시 파일에 다 쓴 뒤 os.replace로 바꾸면 읽는 쪽은
+잠금 없이도 항상 이전 파일이나 새 파일 중 하나의 완전한 내용만 봅니다.
+
+같은 파일에 대한 쓰기는 파일별 잠금으로 차례로 실행합니다. 임시 파일 이름은
+프로세스/스레드마다 달라서, 번역 백필 스크립트처럼 다른 프로세스가 같은
+파일을 써도 임시 파일끼리 섞이지 않습니다 (마지막으로 교체한 쪽이 남음).
+"""
+
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict
+
+# Windows에서 교체 대상 파일을 다른 곳에서 열고 있을 때 재시도 횟수
+REPLACE_RETRIES = 5
+
+# 파일별 쓰기 잠금 (읽고-고쳐-쓰는 호출자가 잡은 채로 write_json을 부를 수 있게 RLock)
+_locks: Dict[str, threading.RLock] = {}
+_locks_lock = threading.Lock()
+
+
+def file_lock(path) -> threading.RLock:
+    """파일별 쓰기 잠금 (같은 경로는 같은 잠금)"""
+    key = os.path.abspath(str(path))
+    with _locks_lock:
+        lock = _locks.get(key)
+        if lock is None:
+            lock = threading.RLock()
+            _locks[key] = lock
+        return lock
+
+
+def _fsync_dir(directory: Path):
+    """rename 결과가 디스크에 남도록 폴더도 fsync (지원하지 않는 OS는 건너뜀)"""
+    if os.name == 'nt':
+        return
+    try:
+        fd = os.open(str(directory), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _replace(src: Path, dst: Path):
+    """os.replace (Windows에서 읽는 쪽이 파일을 열고 있으면 잠시 후 재시도)"""
+    for attempt in range(REPLACE_RETRIES):
+        try:
+            os.replace(src, dst)
+            return
+        except PermissionError:
+            if attempt == REPLACE_RETRIES - 1:
+                raise
+            time.sleep(0.05 * (attempt + 1))
+
+
+def write_bytes(path, data: bytes):
+    """파일 내용을 원자적으로 교체 (임시 파일 → fsync → rename)"""
+    path = Path(path)
+    tmp_file = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with file_lock(path):
+        try:
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            _replace(tmp_file, path)
+        except BaseException:
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
+            raise
+        _fsync_dir(path.parent)
+
+
+def write_json(path, data: Any, indent=2, ensure_ascii: bool = False):
+    """JSON을 원자적으로 저장 (직렬화를 먼저 끝내므로 직렬화 오류 시 기존 파일 유지)"""
+    text = json.dumps(data, ensure_ascii=ensure_ascii, indent=indent)
+    write_bytes(path, text.encode('utf-8'))
+
+
+def read_json(path, default: Any = None) -> Any:
+    """JSON 파일 읽기 (파일이 없으면 default)
+
+    파일이 손상되어 있으면 다음 저장에 덮어써지지 않도록 옆에
+    <파일>.corrupt-<시각>으로 복사해 두고 예외를 그대로 올립니다.
+    """
+    path = Path(path)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return default
+    except ValueError:
+        backup = path.with_name(f"{path.name}.corrupt-{datetime.now().strftime('%Y%m%d-%H%M%S')}")
+        try:
+            backup.write_bytes(path.read_bytes())
+            print(f"[파일 손상] {path}를 읽을 수 없어 {backup.name}으로 보관합니다.")
+        except OSError:
+            pass
+        raise
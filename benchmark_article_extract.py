@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+기사 본문 추출 벤치마크 - 저장된 HTML 파일로 파싱 시간과 메모리 비교
+
+이전 방식(페이지 전체를 BeautifulSoup html.parser로 파싱한 뒤 선택자 적용)과
+article_extract의 후보 요소만 파싱하는 방식(SoupStrainer, lxml이 있으면 lxml
+토크나이저도)을 같은 HTML에 실행하고, 추출한 본문/언론사가 같은지도 확인합니다.
+메모리는 tracemalloc으로 잰 추출 한 번의 최대 할당량입니다.
+
+사용법:
+    python benchmark_article_extract.py                     # NAVER.html, naver(html).html
+    python benchmark_article_extract.py page1.html page2.html --repeat 20
+"""
+
+import re
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    import io
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
+
+BASE_DIR = Path(__file__).parent
+sys.path.insert(0, str(BASE_DIR))
+
+from bs4 import BeautifulSoup
+
+from article_extract import (BODY_SELECTORS, FALLBACK_CLASS_PATTERN, LXML_AVAILABLE, PRESS_SELECTORS,
+                             extract_article)
+
+DEFAULT_FIXTURES = ["NAVER.html", "naver(html).html"]
+
+Extractor = Callable[[str], Tuple[Optional[str], Optional[str]]]
+
+
+# ------------------------------------------------------------ 이전 방식
+def legacy_extract(html: str) -> Tuple[Optional[str], Optional[str]]:
+    """이전 get_full_article의 파싱/추출 부분 (페이지 전체 파싱)"""
+    soup = BeautifulSoup(html, 'html.parser')
+
+    source_name = None
+    for selector in PRESS_SELECTORS:
+        press_elem = soup.select_one(selector)
+        if press_elem:
+            source_name = press_elem.get('alt', '') or press_elem.get_text(strip=True)
+            if source_name:
+                break
+
+    article_content = None
+    for selector in BODY_SELECTORS:
+        article_content = soup.select_one(selector)
+        if article_content:
+            break
+    if not article_content:
+        article_content = soup.find('article') or soup.find('main') or soup.find('div', class_=FALLBACK_CLASS_PATTERN)
+    if not article_content:
+        return None, source_name or None
+
+    for script in article_content.find_all(['script', 'style', 'iframe']):
+        script.decompose()
+    text = article_content.get_text(separator='\n', strip=True)
+    text = re.sub(r'\n{3,}', '\n\n', text)
+    return text.strip(), source_name or None
+
+
+def extractors() -> Dict[str, Extractor]:
+    engines: Dict[str, Extractor] = {
+        "전체 파싱": legacy_extract,
+        "후보만(html.parser)": lambda html: extract_article(html, with_press=True, parser="html.parser"),
+    }
+    if LXML_AVAILABLE:
+        engines["후보만(lxml)"] = lambda html: extract_article(html, with_press=True, parser="lxml")
+    return engines
+
+
+def measure_time(extract: Extractor, html: str, repeat: int) -> float:
+    """추출 한 번의 최소 시간 (밀리초)"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        extract(html)
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def measure_memory(extract: Extractor, html: str) -> float:
+    """추출 한 번의 최대 메모리 할당량 (MB)"""
+    tracemalloc.start()
+    try:
+        extract(html)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1024 / 1024
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="기사 본문 추출 비용 비교 (전체 파싱 vs 후보 요소만 파싱)")
+    parser.add_argument("files", nargs="*", help=f"HTML 파일 (기본: {', '.join(DEFAULT_FIXTURES)})")
+    parser.add_argument("--repeat", "-r", type=int, default=10, help="반복 횟수 (최솟값 사용, 기본: 10)")
+    args = parser.parse_args()
+
+    files: List[Path] = [Path(f) for f in args.files] or [BASE_DIR / f for f in DEFAULT_FIXTURES]
+    engines = extractors()
+    if not LXML_AVAILABLE:
+        print("[안내] lxml이 설치되어 있지 않아 html.parser만 비교합니다.")
+    print(f"[벤치마크] HTML {len(files)}개, 반복 {args.repeat}회 중 최솟값\n")
+    print(f"{'파일':<24} {'크기(KB)':>9} {'방식':<20} {'시간(ms)':>9} {'메모리(MB)':>11} {'배율':>6}  결과")
+
+    totals = {name: 0.0 for name in engines}
+    for path in files:
+        try:
+            html = path.read_text(encoding='utf-8', errors='replace')
+        except OSError as e:
+            print(f"[오류] {path}: {str(e)}")
+            continue
+        baseline_result = legacy_extract(html)
+        baseline_time = None
+        for name, extract in engines.items():
+            elapsed = measure_time(extract, html, args.repeat)
+            memory = measure_memory(extract, html)
+            totals[name] += elapsed
+            if baseline_time is None:
+                baseline_time = elapsed
+            same = extract(html) == baseline_result
+            text = baseline_result[0]
+            outcome = ("본문 없음" if text is None else f"본문 {len(text)}자") if same else "결과 다름!"
+            print(f"{path.name[:24]:<24} {len(html.encode('utf-8')) / 1024:>9.0f} {name:<20} "
+                  f"{elapsed:>9.2f} {memory:>11.2f} {baseline_time / elapsed:>5.2f}x  {outcome}")
+
+    baseline_total = totals["전체 파싱"]
+    summary = "\n[합계] " + " / ".join(
+        f"{name} {total:.2f}ms ({baseline_total / total:.2f}x)" for name, total in totals.items() if total)
+    print(summary)
+
+
+if __name__ == "__main__":
+    main()
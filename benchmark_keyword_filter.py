@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+키워드 필터 마이크로 벤치마크 - 기사 하나를 필터링하는 비용 비교
+
+이전 방식(기사마다 키워드 목록을 소문자로 바꿔 any(kw in text)로 그룹별 검사)과
+공용 크롤러 엔진의 필터(업체 설정으로 컴파일한 KeywordMatcher, 한 번의 순회로
+모든 그룹 검사)를 저장된 data.json 기사 전체에 대해 실행하고, 판정이 같은지도
+확인합니다.
+매처는 사용할 수 있는 엔진(regex, pyahocorasick이 있으면 ahocorasick)별로 측정합니다.
+
+이전 방식은 크롤러의 키워드 목록을 그대로 참조하므로 (기사마다 목록을 새로
+만들던 원래 코드보다) 약간 유리하게 측정됩니다.
+
+사용법:
+    python benchmark_keyword_filter.py              # 기본 반복 횟수
+    python benchmark_keyword_filter.py --repeat 50
+"""
+
+import importlib.util
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    import io
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
+
+BASE_DIR = Path(__file__).parent
+sys.path.insert(0, str(BASE_DIR))
+
+from keyword_matcher import KeywordMatcher, AHOCORASICK_AVAILABLE
+from company_config import find_company_configs
+from news_crawler import NewsCrawler
+
+# 이전 AIA 크롤러가 제목에서 바로 제외하던 키워드 (제외 키워드 목록의 일부)
+LEGACY_AIA_TITLE_EXCLUDE = ["생명보험", "AIA생명", "AIA 생명", "아이아생명", "보험사", "보험회사", "보험", "생명"]
+
+
+def load_crawler(config: Dict) -> NewsCrawler:
+    crawler_file = BASE_DIR / config["folder"] / "crawler.py"
+    if not crawler_file.exists() or not config.get("crawler_class"):
+        return NewsCrawler(config_dir=BASE_DIR / config["folder"])
+    spec = importlib.util.spec_from_file_location(f"bench_crawler_{config['slug']}", crawler_file)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return getattr(module, config["crawler_class"])()
+
+
+def load_corpus() -> List[Tuple[str, str]]:
+    """모든 업체의 저장된 기사 (제목, 설명)"""
+    corpus = []
+    for data_file in sorted(BASE_DIR.glob("251215*/data.json")):
+        with open(data_file, 'r', encoding='utf-8') as f:
+            for article in json.load(f).get("articles", []):
+                corpus.append((article.get("title", ""), article.get("description", "")))
+    return corpus
+
+
+# ------------------------------------------------------------ 이전 방식
+def legacy_filter(company: str, crawler) -> Callable[[str, str], bool]:
+    keywords = crawler.keywords
+
+    if company == "hwasung":
+        def check(title, description):
+            return any(keyword.lower() in title.lower() for keyword in keywords)
+    elif company == "yuil":
+        def check(title, description):
+            title_lower = title.lower()
+            desc_lower = description.lower()
+            return any(keyword.lower() in title_lower or keyword.lower() in desc_lower for keyword in keywords)
+    elif company == "aia":
+        rubber_keywords = crawler.rubber_keywords
+        exclude_keywords = crawler.exclude_keywords
+        title_exclude_keywords = LEGACY_AIA_TITLE_EXCLUDE
+
+        def check(title, description):
+            title_lower = title.lower()
+            desc_lower = description.lower()
+            text_combined = title_lower + " " + desc_lower
+            has_rubber = any(rubber_kw in text_combined for rubber_kw in rubber_keywords)
+            has_aia = any(keyword.lower() in text_combined for keyword in keywords)
+            has_exclude = any(exclude_kw.lower() in text_combined for exclude_kw in exclude_keywords)
+            if any(exclude_kw.lower() in title_lower for exclude_kw in title_exclude_keywords):
+                return False
+            exclude_count = sum(1 for exclude_kw in exclude_keywords if exclude_kw.lower() in desc_lower)
+            if exclude_count >= 2:
+                return False
+            return has_rubber and has_aia and not has_exclude
+    else:
+        rubber_keywords = crawler.rubber_keywords
+        exclude_keywords = getattr(crawler, "exclude_keywords", [])
+
+        def check(title, description):
+            title_lower = title.lower()
+            desc_lower = description.lower()
+            text_combined = title_lower + " " + desc_lower
+            if not any(keyword.lower() in title_lower or keyword.lower() in desc_lower for keyword in keywords):
+                return False
+            if not any(rubber_kw.lower() in text_combined for rubber_kw in rubber_keywords):
+                return False
+            return not any(exclude_kw.lower() in text_combined for exclude_kw in exclude_keywords)
+    return check
+
+
+# ------------------------------------------------------------ 공용 엔진 필터
+def engine_filter(crawler: NewsCrawler, matcher: KeywordMatcher) -> Callable[[str, str], bool]:
+    """크롤러 필터를 주어진 엔진의 매처로 실행"""
+    crawler.keyword_matcher = matcher
+
+    def check(title, description):
+        return crawler.filter_reason(title, description) is None
+    return check
+
+
+def measure(check: Callable[[str, str], bool], corpus: List[Tuple[str, str]], repeat: int) -> float:
+    """기사 하나당 평균 시간 (마이크로초)"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for title, description in corpus:
+            check(title, description)
+        best = min(best, time.perf_counter() - started)
+    return best / len(corpus) * 1e6
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="키워드 필터 비용 비교 (이전 방식 vs 공용 엔진 필터)")
+    parser.add_argument("--repeat", "-r", type=int, default=20, help="반복 횟수 (최솟값 사용, 기본: 20)")
+    args = parser.parse_args()
+
+    corpus = load_corpus()
+    if not corpus:
+        print("[오류] data.json 기사가 없습니다.")
+        return
+    avg_len = sum(len(t) + len(d) for t, d in corpus) / len(corpus)
+    print(f"[벤치마크] 기사 {len(corpus)}개 (평균 {avg_len:.0f}자), 반복 {args.repeat}회 중 최솟값\n")
+    engines = ["regex"] + (["ahocorasick"] if AHOCORASICK_AVAILABLE else [])
+    header = f"{'업체':<20} {'키워드':>6} {'통과':>5} {'이전(µs)':>10}"
+    for engine in engines:
+        header += f" {engine + '(µs)':>17} {'배율':>6}"
+    print(header)
+
+    totals: Dict[str, float] = {name: 0.0 for name in ["legacy"] + engines}
+    for company, config in find_company_configs(BASE_DIR).items():
+        folder = config["folder"]
+        crawler = load_crawler(config)
+        legacy = legacy_filter(company, crawler)
+        before = measure(legacy, corpus, args.repeat)
+        totals["legacy"] += before
+        passed = sum(1 for title, description in corpus if legacy(title, description))
+        line = f"{folder:<20} {len(crawler.keyword_matcher):>6} {passed:>5} {before:>10.2f}"
+
+        for engine in engines:
+            compiled = engine_filter(crawler, KeywordMatcher(crawler.keyword_matcher.groups, engine=engine))
+            mismatches = [title for title, description in corpus
+                          if legacy(title, description) != compiled(title, description)]
+            if mismatches:
+                print(f"[경고] {folder}/{engine}: 판정이 다른 기사 {len(mismatches)}개 - 예: {mismatches[0][:60]}")
+            after = measure(compiled, corpus, args.repeat)
+            totals[engine] += after
+            line += f" {after:>17.2f} {before / after:>5.2f}x"
+        print(line)
+
+    summary = f"\n[합계] 이전 {totals['legacy']:.2f}µs"
+    for engine in engines:
+        summary += f" / {engine} {totals[engine]:.2f}µs ({totals['legacy'] / totals[engine]:.2f}x)"
+    print(summary)
+
+
+if __name__ == "__main__":
+    main()
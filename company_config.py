@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+업체 설정 - 업체 폴더의 config.json 로드와 업체 목록 탐색
+
+표준 라이브러리만 사용하므로, 통합 서버가 크롤러 모듈(bs4, feedparser 등)을
+불러오지 않고도 업체 목록과 데이터 파일 경로를 알 수 있습니다.
+config.json 형식은 news_crawler 모듈 설명을 참고하세요.
+"""
+
+import json
+from pathlib import Path
+from typing import Dict
+
+PROJECT_ROOT = Path(__file__).resolve().parent
+
+CONFIG_FILE_NAME = "config.json"
+COMPANY_MATCH_MODES = ("title", "title_or_description", "anywhere")
+
+
+def load_company_config(folder) -> Dict:
+    """업체 폴더의 config.json 로드"""
+    with open(Path(folder) / CONFIG_FILE_NAME, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+    if not config.get("slug") or not config.get("keywords"):
+        raise ValueError(f"{folder}/{CONFIG_FILE_NAME}: slug와 keywords는 필수입니다.")
+    company_match = config.get("filter", {}).get("company_match", "title_or_description")
+    if company_match not in COMPANY_MATCH_MODES:
+        raise ValueError(f"{folder}/{CONFIG_FILE_NAME}: 알 수 없는 company_match: {company_match}")
+    return config
+
+
+def find_company_configs(base_dir=PROJECT_ROOT) -> Dict[str, Dict]:
+    """config.json이 있는 업체 폴더를 찾아 slug → 설정 (폴더 이름은 "folder" 키)"""
+    companies = {}
+    for config_file in sorted(Path(base_dir).glob(f"*/{CONFIG_FILE_NAME}")):
+        folder = config_file.parent
+        try:
+            config = load_company_config(folder)
+        except Exception as e:
+            print(f"[업체 설정 오류] {config_file}: {str(e)}")
+            continue
+        if config["slug"] in companies:
+            print(f"[업체 설정 오류] slug 중복 ({config['slug']}): {folder.name} 건너뜀")
+            continue
+        config["folder"] = folder.name
+        companies[config["slug"]] = config
+    return companies
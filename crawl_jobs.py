@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+백그라운드 크롤링 작업 큐 - 작업 ID 발급, 업체별 중복 요청 병합, 진행 상황 조회
+"""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional, Tuple
+
+# 완료된 작업 기록 보관 개수
+MAX_FINISHED_JOBS = 200
+
+
+class CrawlJob:
+    """크롤링 작업 하나의 상태"""
+
+    def __init__(self, company: str):
+        self.job_id = uuid.uuid4().hex
+        self.company = company
+        self.status = "queued"  # queued → running → done / failed
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.progress = {"keywords_total": 0, "keywords_done": 0, "articles_found": 0}
+        self.result = None
+        self.error = None
+
+    @property
+    def in_flight(self) -> bool:
+        return self.status in ("queued", "running")
+
+    def to_dict(self) -> Dict:
+        return {
+            "job_id": self.job_id,
+            "company": self.company,
+            "status": self.status,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "progress": dict(self.progress),
+            "result": self.result,
+            "error": self.error,
+        }
+
+
+class CrawlJobQueue:
+    """업체별 크롤링 작업을 워커 풀에서 실행하는 큐
+
+    runner(company, progress_callback)는 update_news_now와 같은 형식의
+    결과 딕셔너리를 반환해야 합니다. 같은 업체의 작업이 이미 대기/실행 중이면
+    새 작업을 만들지 않고 기존 작업을 돌려줍니다.
+    """
+
+    def __init__(self, runner: Callable[[str, Callable[[Dict], None]], Dict], max_workers: int = 2):
+        self.runner = runner
+        self.max_workers = max(1, max_workers)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="crawl-job")
+        self._jobs: "OrderedDict[str, CrawlJob]" = OrderedDict()
+        self._active_by_company: Dict[str, CrawlJob] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, company: str) -> Tuple[CrawlJob, bool]:
+        """작업 등록 (반환: (작업, 새로 생성 여부))"""
+        with self._lock:
+            active = self._active_by_company.get(company)
+            if active is not None and active.in_flight:
+                return active, False
+
+            job = CrawlJob(company)
+            self._jobs[job.job_id] = job
+            self._active_by_company[company] = job
+            self._prune_locked()
+
+        self._executor.submit(self._run, job)
+        return job, True
+
+    def get(self, job_id: str) -> Optional[CrawlJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def get_active(self, company: str) -> Optional[CrawlJob]:
+        """업체의 대기/실행 중인 작업 반환"""
+        with self._lock:
+            job = self._active_by_company.get(company)
+            return job if job is not None and job.in_flight else None
+
+    def _run(self, job: CrawlJob):
+        def on_progress(progress: Dict):
+            with self._lock:
+                job.progress = dict(progress)
+
+        with self._lock:
+            job.status = "running"
+            job.started_at = time.time()
+
+        try:
+            result = self.runner(job.company, on_progress)
+            with self._lock:
+                job.result = result
+                if result and result.get("success"):
+                    job.status = "done"
+                else:
+                    job.status = "failed"
+                    job.error = (result or {}).get("error", "알 수 없는 오류")
+        except Exception as e:
+            print(f"[{job.company} 크롤링 작업 오류] {str(e)}")
+            import traceback
+            traceback.print_exc()
+            with self._lock:
+                job.status = "failed"
+                job.error = str(e)
+        finally:
+            with self._lock:
+                job.finished_at = time.time()
+                if self._active_by_company.get(job.company) is job:
+                    del self._active_by_company[job.company]
+
+    def _prune_locked(self):
+        """오래된 완료 작업 기록 정리 (잠금 보유 상태에서 호출)"""
+        finished = [job_id for job_id, job in self._jobs.items() if not job.in_flight]
+        excess = len(finished) - MAX_FINISHED_JOBS
+        for job_id in finished[:max(0, excess)]:
+            del self._jobs[job_id]
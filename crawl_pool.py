@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+크롤러 공용 동시 실행 유틸리티 - 키워드별 검색을 스레드 풀로 병렬 실행
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Any, Optional
+from urllib.parse import urlparse
+
+# 크롤링 동시 실행 설정 (환경 변수로 조정 가능)
+CRAWL_MAX_WORKERS = int(os.environ.get('CRAWL_MAX_WORKERS', 8))
+CRAWL_PER_HOST_LIMIT = int(os.environ.get('CRAWL_PER_HOST_LIMIT', 4))
+
+
+class HostLimiter:
+    """호스트별 동시 요청 수 제한"""
+
+    def __init__(self, per_host_limit: int = CRAWL_PER_HOST_LIMIT):
+        self.per_host_limit = max(1, per_host_limit)
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def _get_semaphore(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            semaphore = self._semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.per_host_limit)
+                self._semaphores[host] = semaphore
+            return semaphore
+
+    @contextmanager
+    def limit(self, url: str):
+        """URL의 호스트 슬롯을 점유한 상태로 실행"""
+        host = urlparse(url).netloc.lower()
+        semaphore = self._get_semaphore(host)
+        with semaphore:
+            yield
+
+
+# 프로세스 전체에서 공유하는 호스트 제한기
+host_limiter = HostLimiter()
+
+
+def run_ordered(tasks: List[Callable[[], Any]], max_workers: int = CRAWL_MAX_WORKERS) -> List[Any]:
+    """작업들을 병렬로 실행하고 입력 순서대로 결과 반환
+
+    결과 순서가 입력 순서와 같으므로, 직렬 실행과 동일한 순서로
+    중복 제거/병합을 할 수 있습니다. 작업에서 발생한 예외는 그대로 전달됩니다.
+    """
+    if not tasks:
+        return []
+    if max_workers <= 1 or len(tasks) == 1:
+        return [task() for task in tasks]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(tasks))) as executor:
+        futures = [executor.submit(task) for task in tasks]
+        return [future.result() for future in futures]
+
+
+class CrawlProgress:
+    """키워드 단위 크롤링 진행 상황 집계 (스레드 안전)
+
+    키워드마다 여러 검색 작업(네이버, 구글 등)이 있으므로, 해당 키워드의
+    작업이 모두 끝났을 때 완료된 키워드로 셉니다.
+    """
+
+    def __init__(self, keywords: List[str], tasks_per_keyword: int,
+                 callback: Optional[Callable[[Dict], None]] = None):
+        self.keywords_total = len(keywords)
+        self.keywords_done = 0
+        self.articles_found = 0
+        self._pending = [tasks_per_keyword] * len(keywords)
+        self._callback = callback
+        self._lock = threading.Lock()
+
+    def snapshot(self) -> Dict:
+        return {
+            "keywords_total": self.keywords_total,
+            "keywords_done": self.keywords_done,
+            "articles_found": self.articles_found,
+        }
+
+    def task_done(self, keyword_index: Optional[int], article_count: int):
+        """검색 작업 하나 완료 (keyword_index가 None이면 키워드와 무관한 작업)"""
+        with self._lock:
+            self.articles_found += article_count
+            if keyword_index is not None:
+                self._pending[keyword_index] -= 1
+                if self._pending[keyword_index] == 0:
+                    self.keywords_done += 1
+            snapshot = self.snapshot()
+        if self._callback:
+            try:
+                self._callback(snapshot)
+            except Exception as e:
+                print(f"[진행 상황 콜백 오류] {str(e)}")
+
+    def track(self, keyword_index: Optional[int], task: Callable[[], List]) -> Callable[[], List]:
+        """작업이 끝나면 진행 상황을 갱신하도록 감싼 작업 반환"""
+        def tracked():
+            articles = task()
+            self.task_done(keyword_index, len(articles))
+            return articles
+        return tracked
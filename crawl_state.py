@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+증분 크롤링 상태 - (출처, 키워드)별로 마지막으로 본 가장 최신 기사(기준점)를 저장
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import atomic_file
+from article_dates import parse_pub_date
+
+# 기준점이 있을 때 첫 페이지 크기 (새 기사가 많으면 다음 페이지를 이어서 조회)
+INCREMENTAL_PAGE_SIZE = int(os.environ.get('CRAWL_INCREMENTAL_PAGE_SIZE', 20))
+# false로 설정하면 항상 전체 페이지를 다시 조회
+INCREMENTAL_ENABLED = os.environ.get('CRAWL_INCREMENTAL', 'true').lower() == 'true'
+
+
+class CrawlState:
+    """(출처, 키워드)별 기준점 저장소
+
+    크롤링 중에는 stage()로 새 기준점을 임시 기록하고, 결과가 data.json에
+    저장된 뒤 commit()으로 확정합니다. 저장 전에 실패하면 이전 기준점이
+    그대로 남으므로 기사가 누락되지 않습니다.
+    """
+
+    def __init__(self, filepath, enabled: bool = INCREMENTAL_ENABLED):
+        self.filepath = Path(filepath)
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._marks = self._load()
+        self._staged: Dict[str, Dict] = {}
+
+    @staticmethod
+    def _key(source: str, keyword: str) -> str:
+        return f"{source}:{keyword}"
+
+    def _load(self) -> Dict[str, Dict]:
+        try:
+            with open(self.filepath, 'r', encoding='utf-8') as f:
+                return json.load(f).get("marks", {})
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(f"[증분 크롤링] 상태 파일 로드 오류: {str(e)}")
+            return {}
+
+    def get_mark(self, source: str, keyword: str) -> Optional[Dict]:
+        """확정된 기준점 반환 ({"pub_date", "article_id"} 또는 None)"""
+        if not self.enabled:
+            return None
+        with self._lock:
+            return self._marks.get(self._key(source, keyword))
+
+    def stage(self, source: str, keyword: str, pub_date: str, article_id: str):
+        """이번 크롤링에서 본 가장 최신 기사를 새 기준점으로 임시 기록"""
+        with self._lock:
+            self._staged[self._key(source, keyword)] = {
+                "pub_date": pub_date,
+                "article_id": article_id
+            }
+
+    def commit(self):
+        """임시 기준점을 확정하고 파일에 저장"""
+        with self._lock:
+            if not self._staged:
+                return
+            self._marks.update(self._staged)
+            self._staged = {}
+            data = {"marks": self._marks}
+            try:
+                atomic_file.write_json(self.filepath, data)
+            except Exception as e:
+                print(f"[증분 크롤링] 상태 파일 저장 오류: {str(e)}")
+
+
+def split_at_mark(items: List[Dict], mark: Optional[Dict],
+                  get_id: Callable[[Dict], str],
+                  get_pub_date: Callable[[Dict], str]) -> Tuple[List[Dict], bool]:
+    """날짜 내림차순 항목 목록에서 기준점 이전(이미 본) 항목을 잘라냄
+
+    반환: (새 항목 목록, 기준점 도달 여부)
+    기준점과 같은 ID이거나 기준점보다 오래된 항목을 만나면 거기서 멈춥니다.
+    같은 시각에 발행된 다른 기사는 새 항목으로 취급합니다.
+    """
+    if not mark:
+        return items, False
+
+    mark_id = mark.get("article_id")
+    mark_dt = parse_pub_date(mark.get("pub_date", ""))
+
+    new_items = []
+    for item in items:
+        if get_id(item) == mark_id:
+            return new_items, True
+        item_dt = parse_pub_date(get_pub_date(item))
+        if mark_dt and item_dt and item_dt < mark_dt:
+            return new_items, True
+        new_items.append(item)
+    return new_items, False
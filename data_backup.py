@@ -17,6 +17,17 @@ def get_kst_now():
     """한국 시간 현재 시각 반환"""
     return datetime.now(KST)
 
+# 업체 폴더별로 백업하는 데이터 파일
+COMPANY_DATA_FILES = ('data.json', 'deleted_articles.json', 'crawl_state.json')
+
+def get_data_file_paths():
+    """업체 폴더(config.json이 있는 폴더)별 데이터 파일 경로 목록"""
+    return [
+        f'{config_file.parent.name}/{name}'
+        for config_file in sorted(Path('.').glob('*/config.json'))
+        for name in COMPANY_DATA_FILES
+    ]
+
 def backup_to_github():
     """데이터 파일을 GitHub에 백업"""
     try:
@@ -72,20 +83,7 @@ def backup_to_github():
         
         # 데이터 파일 목록 (강제로 확인)
         data_files = []
-        data_file_paths = [
-            '251215/data.json',
-            '251215/deleted_articles.json',
-            '251215_yuil/data.json',
-            '251215_yuil/deleted_articles.json',
-            '251215_aia/data.json',
-            '251215_aia/deleted_articles.json',
-            '251215_cooper/data.json',
-            '251215_cooper/deleted_articles.json',
-            '251215_saargummi/data.json',
-            '251215_saargummi/deleted_articles.json',
-            '251215_hutchinson/data.json',
-            '251215_hutchinson/deleted_articles.json'
-        ]
+        data_file_paths = get_data_file_paths()
         
         # 존재하는 파일만 추가
         for file_path in data_file_paths:
@@ -330,20 +328,7 @@ def load_from_github():
         if pull_result.returncode == 0:
             print("[복원 성공] GitHub에서 최신 데이터를 가져왔습니다.")
             # 복원된 파일 확인
-            data_files = [
-                '251215/data.json',
-                '251215/deleted_articles.json',
-                '251215_yuil/data.json',
-                '251215_yuil/deleted_articles.json',
-                '251215_aia/data.json',
-                '251215_aia/deleted_articles.json',
-                '251215_cooper/data.json',
-                '251215_cooper/deleted_articles.json',
-                '251215_saargummi/data.json',
-                '251215_saargummi/deleted_articles.json',
-                '251215_hutchinson/data.json',
-                '251215_hutchinson/deleted_articles.json'
-            ]
+            data_files = get_data_file_paths()
             restored = [f for f in data_files if os.path.exists(f)]
             if restored:
                 print(f"[복원] 복원된 파일: {', '.join(restored)}")
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+공용 HTTP 클라이언트 - 모든 크롤러/API 모듈이 하나의 커넥션 풀을 공유
+(호스트별 keep-alive 커넥션 재사용, 429/5xx 재시도, 커넥션 통계)
+"""
+
+import os
+import threading
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
+
+from crawl_pool import host_limiter
+
+# 커넥션 풀 설정 (환경 변수로 조정 가능)
+HTTP_POOL_CONNECTIONS = int(os.environ.get('HTTP_POOL_CONNECTIONS', 20))  # 캐시할 호스트 풀 개수
+HTTP_POOL_MAXSIZE = int(os.environ.get('HTTP_POOL_MAXSIZE', 10))  # 호스트당 최대 커넥션 수
+HTTP_MAX_RETRIES = int(os.environ.get('HTTP_MAX_RETRIES', 3))
+HTTP_BACKOFF_FACTOR = float(os.environ.get('HTTP_BACKOFF_FACTOR', 0.5))
+
+
+class _ConnectionStats:
+    """커넥션 사용 통계 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.requests = 0
+            self.checkouts = 0
+            self.new_connections = 0
+
+    def incr(self, field: str):
+        with self._lock:
+            setattr(self, field, getattr(self, field) + 1)
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "new_connections": self.new_connections,
+                "pool_hits": max(0, self.checkouts - self.new_connections),
+            }
+
+
+stats = _ConnectionStats()
+
+
+class _CountingHTTPConnectionPool(HTTPConnectionPool):
+    def _new_conn(self):
+        stats.incr("new_connections")
+        return super()._new_conn()
+
+    def _get_conn(self, timeout=None):
+        stats.incr("checkouts")
+        return super()._get_conn(timeout=timeout)
+
+
+class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+    def _new_conn(self):
+        stats.incr("new_connections")
+        return super()._new_conn()
+
+    def _get_conn(self, timeout=None):
+        stats.incr("checkouts")
+        return super()._get_conn(timeout=timeout)
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """커넥션 생성/재사용 횟수를 집계하는 HTTPAdapter"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _CountingHTTPConnectionPool,
+            "https": _CountingHTTPSConnectionPool,
+        }
+
+
+def create_session(pool_connections: int = HTTP_POOL_CONNECTIONS,
+                   pool_maxsize: int = HTTP_POOL_MAXSIZE,
+                   max_retries: int = HTTP_MAX_RETRIES,
+                   backoff_factor: float = HTTP_BACKOFF_FACTOR) -> requests.Session:
+    """재시도/커넥션 풀이 설정된 세션 생성"""
+    session = requests.Session()
+    retry_strategy = Retry(
+        total=max_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET", "HEAD"],
+        respect_retry_after_header=True,
+        raise_on_status=False  # 마지막 응답은 그대로 반환 (raise_for_status로 처리)
+    )
+    adapter = PooledHTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=retry_strategy
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """프로세스 전체에서 공유하는 세션 반환"""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = create_session()
+    return _session
+
+
+def configure(**kwargs):
+    """풀 크기/재시도 설정을 바꿔 공유 세션을 다시 생성 (create_session 인자와 동일)"""
+    global _session
+    with _session_lock:
+        old_session = _session
+        _session = create_session(**kwargs)
+    if old_session is not None:
+        old_session.close()
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    """공유 세션으로 GET 요청 (호스트별 동시 요청 수 제한 적용)"""
+    stats.incr("requests")
+    with host_limiter.limit(url):
+        return get_session().get(url, **kwargs)
+
+
+def get_stats() -> Dict:
+    """요청 수, 새 커넥션(핸드셰이크) 수, 풀 재사용 수 반환"""
+    return stats.snapshot()
+
+
+def format_stats() -> str:
+    """로그 출력용 통계 문자열"""
+    snapshot = stats.snapshot()
+    return (f"요청 {snapshot['requests']}회, "
+            f"새 연결(핸드셰이크) {snapshot['new_connections']}회, "
+            f"커넥션 재사용 {snapshot['pool_hits']}회")
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+키워드 매처 - 여러 키워드 목록을 다중 패턴 매처로 한 번만 컴파일해 기사마다 재사용
+
+크롤러마다 회사 이름/고무 관련/제외 키워드 목록을 그룹으로 묶어 한 번만 만들고,
+기사마다 제목 + 설명에서 그룹별로 어떤 키워드가 제목/설명에 있었는지
+돌려줍니다. 대소문자는 구분하지 않습니다 (기존 kw.lower() in text.lower()와 같음).
+
+기본 엔진(regex)은 그룹별 키워드 트라이를 중첩된 정규식으로 컴파일하고, 그룹을
+물어볼 때 그 그룹 정규식으로 한 번 검색해 첫 일치에서 멈춥니다. 회사 이름이 없는
+기사는 (기존 has_company 검사처럼) 회사 이름 그룹만 보고 끝납니다.
+KEYWORD_MATCHER_ENGINE=ahocorasick이면 pyahocorasick의 Aho–Corasick 오토마톤으로 모든
+그룹을 한 번에 찾습니다 (벤치마크: python benchmark_keyword_filter.py). 순수
+파이썬으로 오토마톤을 한 글자씩 따라가면 C로 구현된 `in` 검사 수십 번보다
+느리므로, 두 방식 모두 텍스트 순회는 C 구현에 맡깁니다.
+"""
+
+import os
+import re
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+# pyahocorasick 모듈 (선택적)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+ENGINES = ("ahocorasick", "regex")
+# 기본 매처 엔진 (ahocorasick은 pyahocorasick이 없으면 regex로 대체)
+KEYWORD_MATCHER_ENGINE = os.environ.get('KEYWORD_MATCHER_ENGINE', 'regex')
+
+# 일치 위치 구분
+_IN_TITLE, _IN_DESCRIPTION, _ACROSS = 0, 1, 2
+
+
+class KeywordHits:
+    """scan 결과 - 찾은 키워드와 위치(제목/설명/경계에 걸침)
+
+    검사는 대부분 "그룹 키워드가 있는지"만 묻고 일치 수는 적으므로, 그룹별
+    집합을 미리 만들지 않고 물어볼 때 일치 목록을 훑습니다.
+    """
+
+    __slots__ = ("_matches", "_patterns", "_pattern_groups")
+
+    def __init__(self, matches: List[Tuple[int, int]], patterns: List[str],
+                 pattern_groups: List[FrozenSet[str]]):
+        self._matches = matches
+        self._patterns = patterns
+        self._pattern_groups = pattern_groups
+
+    def _has(self, group: str, region: Optional[int]) -> bool:
+        pattern_groups = self._pattern_groups
+        for pattern_id, where in self._matches:
+            if group in pattern_groups[pattern_id] and (region is None or where == region):
+                return True
+        return False
+
+    def _keywords(self, group: str, region: Optional[int]) -> FrozenSet[str]:
+        return frozenset(self._patterns[pattern_id] for pattern_id, where in self._matches
+                         if group in self._pattern_groups[pattern_id] and (region is None or where == region))
+
+    def any(self, group: str) -> bool:
+        """제목 + 설명 어디에든 그룹 키워드가 있는지"""
+        return self._has(group, None)
+
+    def in_title(self, group: str) -> bool:
+        return self._has(group, _IN_TITLE)
+
+    def in_description(self, group: str) -> bool:
+        return self._has(group, _IN_DESCRIPTION)
+
+    def keywords(self, group: str) -> FrozenSet[str]:
+        """찾은 그룹 키워드 (소문자)"""
+        return self._keywords(group, None)
+
+    def title_keywords(self, group: str) -> FrozenSet[str]:
+        return self._keywords(group, _IN_TITLE)
+
+    def description_keywords(self, group: str) -> FrozenSet[str]:
+        return self._keywords(group, _IN_DESCRIPTION)
+
+
+class _RegexKeywordHits(KeywordHits):
+    """정규식 엔진의 scan 결과 - 물어보는 그룹만 그때 검색
+
+    있는지 검사는 그룹 정규식을 제목/설명 범위로 한 번 검색해 첫 일치에서
+    멈추고, 키워드 목록을 물어볼 때만 그룹의 일치를 모두 찾습니다.
+    """
+
+    __slots__ = ("_matcher", "_text", "_title_end")
+
+    def __init__(self, matcher: "KeywordMatcher", text: str, title_end: int):
+        self._matcher = matcher
+        self._text = text
+        self._title_end = title_end
+        self._patterns = matcher._patterns
+        self._pattern_groups = matcher._pattern_groups
+
+    def _has(self, group: str, region: Optional[int]) -> bool:
+        compiled = self._matcher._group_regex.get(group)
+        if compiled is None:
+            return False
+        search = compiled[0]
+        if region is None:
+            return search(self._text) is not None
+        if region == _IN_TITLE:
+            return search(self._text, 0, self._title_end) is not None
+        return search(self._text, self._title_end + 1) is not None
+
+    def _keywords(self, group: str, region: Optional[int]) -> FrozenSet[str]:
+        self._matches = self._matcher._scan_regex(group, self._text, self._title_end)
+        return KeywordHits._keywords(self, group, region)
+
+
+class KeywordMatcher:
+    """그룹별 키워드 목록을 컴파일한 다중 패턴 매처 (생성 후 읽기 전용이라 스레드 안전)
+
+    예:
+        matcher = KeywordMatcher({"company": ["Cooper Standard"], "rubber": ["rubber", "tire"]})
+        hits = matcher.scan(title, description)
+        if hits.any("company") and hits.any("rubber"): ...
+    """
+
+    def __init__(self, groups: Dict[str, Iterable[str]], engine: Optional[str] = None):
+        self.groups: Dict[str, Tuple[str, ...]] = {}
+        patterns: List[str] = []
+        pattern_ids: Dict[str, int] = {}
+        pattern_groups: List[List[str]] = []
+        for group, keywords in groups.items():
+            self.groups[group] = tuple(keywords)
+            for keyword in self.groups[group]:
+                keyword = keyword.lower()
+                if not keyword:
+                    continue
+                if keyword not in pattern_ids:
+                    pattern_ids[keyword] = len(patterns)
+                    patterns.append(keyword)
+                    pattern_groups.append([])
+                if group not in pattern_groups[pattern_ids[keyword]]:
+                    pattern_groups[pattern_ids[keyword]].append(group)
+
+        self._patterns = patterns
+        self._pattern_groups = [frozenset(groups_) for groups_ in pattern_groups]
+        self._lengths = [len(pattern) for pattern in patterns]
+
+        if engine is None:
+            engine = KEYWORD_MATCHER_ENGINE
+            if engine == "ahocorasick" and not AHOCORASICK_AVAILABLE:
+                engine = "regex"
+        if engine not in ENGINES or (engine == "ahocorasick" and not AHOCORASICK_AVAILABLE):
+            raise ValueError(f"사용할 수 없는 매처 엔진: {engine}")
+        self.engine = engine
+        if engine == "ahocorasick":
+            self._automaton = ahocorasick.Automaton()
+            for pattern_id, pattern in enumerate(patterns):
+                self._automaton.add_word(pattern, pattern_id)
+            if patterns:
+                self._automaton.make_automaton()
+        else:
+            self._build_regex(patterns, pattern_ids, pattern_groups)
+
+    @staticmethod
+    def _trie_regex(patterns: List[str]) -> str:
+        """키워드 트라이를 중첩 정규식으로 변환 ("ab", "abc", "ad" → a(?:b(?:c)?|d))
+
+        위치마다 첫 글자가 같은 분기 하나만 따라가므로 키워드를 나열한
+        정규식보다 빠르고, 선택적 꼬리를 탐욕적으로 먼저 시도하므로 그 위치에서
+        가장 긴 키워드와 일치합니다.
+        """
+        trie: Dict[str, dict] = {}
+        for pattern in patterns:
+            node = trie
+            for ch in pattern:
+                node = node.setdefault(ch, {})
+            node[""] = {}
+
+        def build(node: Dict[str, dict]) -> str:
+            branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+            if not branches:
+                return ""
+            body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+            return f"(?:{body})?" if "" in node else body
+
+        return build(trie)
+
+    def _build_regex(self, patterns: List[str], pattern_ids: Dict[str, int], pattern_groups: List[List[str]]):
+        """그룹마다 트라이 정규식 하나로 위치마다 가장 긴 일치를 찾음
+
+        한 위치에서 시작하는 더 짧은 일치는 가장 긴 일치의 접두사이므로,
+        키워드별로 같은 그룹에서 접두사인 다른 키워드를 미리 구해 두었다가 함께
+        돌려줍니다. (전방 탐색으로 겹치는 일치를 찾으면 정규식 엔진의 첫 글자
+        건너뛰기 최적화가 꺼져 훨씬 느려지므로, 일치 다음 위치부터 다시 검색합니다.)
+        """
+        self._pattern_ids = pattern_ids
+        self._group_regex: Dict[str, Tuple[Callable, Dict[int, Tuple[int, ...]]]] = {}
+        for group in self.groups:
+            ids = [pattern_id for pattern_id in range(len(patterns)) if group in pattern_groups[pattern_id]]
+            if not ids:
+                continue
+            prefixes = {
+                pattern_id: tuple(other_id for other_id in ids
+                                  if other_id != pattern_id and patterns[pattern_id].startswith(patterns[other_id]))
+                for pattern_id in ids
+            }
+            search = re.compile(self._trie_regex([patterns[pattern_id] for pattern_id in ids])).search
+            self._group_regex[group] = (search, prefixes)
+
+    def _scan_regex(self, group: str, text: str, title_end: int) -> List[Tuple[int, int]]:
+        """그룹 하나의 일치 목록 (정규식 엔진)"""
+        matches: List[Tuple[int, int]] = []
+        compiled = self._group_regex.get(group)
+        if compiled is None:
+            return matches
+        search, prefixes = compiled
+        append = matches.append
+        lengths = self._lengths
+        pattern_ids = self._pattern_ids
+        match = search(text)
+        while match:
+            start = match.start()
+            pattern_id = pattern_ids[match.group()]
+            for found_id in (pattern_id,) + prefixes[pattern_id]:
+                if start + lengths[found_id] <= title_end:
+                    append((found_id, _IN_TITLE))
+                elif start > title_end:
+                    append((found_id, _IN_DESCRIPTION))
+                else:
+                    append((found_id, _ACROSS))
+            match = search(text, start + 1)
+        return matches
+
+    def scan(self, title: str, description: str = "") -> KeywordHits:
+        """제목과 설명에서 그룹별 키워드를 찾음 (정규식 엔진은 그룹을 물어볼 때 검색)
+
+        기존 필터와 같이 제목 + " " + 설명을 하나의 텍스트로 보며, 제목/설명
+        경계를 걸친 일치는 제목이나 설명 어느 쪽에도 넣지 않고 전체에만 넣습니다.
+        """
+        title_lower = (title or "").lower()
+        title_end = len(title_lower)
+        text = title_lower + " " + description.lower() if description else title_lower
+
+        if self.engine == "regex":
+            return _RegexKeywordHits(self, text, title_end)
+
+        patterns = self._patterns
+        matches: List[Tuple[int, int]] = []
+        if not patterns:
+            return KeywordHits(matches, patterns, self._pattern_groups)
+
+        append = matches.append
+        lengths = self._lengths
+        for end, pattern_id in self._automaton.iter(text):
+            if end < title_end:
+                append((pattern_id, _IN_TITLE))
+            elif end - lengths[pattern_id] >= title_end:
+                append((pattern_id, _IN_DESCRIPTION))
+            else:
+                append((pattern_id, _ACROSS))
+        return KeywordHits(matches, patterns, self._pattern_groups)
+
+    def __len__(self) -> int:
+        return len(self._patterns)
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+기존 data.json 발행 시각 정규화 스크립트 (1회 마이그레이션)
+
+이전에 저장된 기사에는 수집 시 추가하는 published_at/published_ts 필드가
+없으므로, 모든 251215* 폴더의 data.json 기사에 두 필드를 채우고 최신순으로
+다시 정렬해 저장합니다. 이후에는 새 기사를 이미 정렬된 목록에 병합만 하면
+됩니다. 이미 정규화된 기사는 건너뛰므로 여러 번 실행해도 결과가 같습니다.
+
+통합 서버가 실행 중이어도 서버는 data.json을 다시 만들기 전에 바뀐 파일을
+기사 저장소에 병합하므로 결과가 덮어써지지 않습니다. 다만 두 쪽이 같은 순간에
+저장하면 한쪽 변경이 빠질 수 있어, 대량 작업은 서버를 멈춘 상태가 안전합니다.
+
+사용법:
+    python migrate_pub_dates.py                    # 모든 폴더
+    python migrate_pub_dates.py 251215_cooper      # 특정 폴더만
+    python migrate_pub_dates.py --force            # 이미 정규화된 기사도 다시 계산
+    python migrate_pub_dates.py --dry-run          # 저장하지 않고 결과만 출력
+"""
+
+import sys
+from pathlib import Path
+from typing import List
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    import io
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
+
+BASE_DIR = Path(__file__).parent
+sys.path.insert(0, str(BASE_DIR))
+
+import atomic_file
+import static_cache
+from article_dates import PUBLISHED_TS_FIELD, article_timestamp, ensure_pub_date, normalize_pub_date
+
+
+def find_data_folders() -> List[str]:
+    """data.json이 있는 업체 폴더 목록"""
+    return sorted(path.parent.name for path in BASE_DIR.glob("251215*/data.json"))
+
+
+def migrate(folder: str, force: bool, dry_run: bool):
+    """폴더 하나의 data.json 기사 정규화 + 최신순 정렬"""
+    data_file = BASE_DIR / folder / "data.json"
+    try:
+        data = atomic_file.read_json(data_file)
+    except Exception as e:
+        print(f"[{folder}] 데이터 로드 오류: {str(e)}")
+        return
+    if data is None:
+        print(f"[{folder}] data.json이 없습니다.")
+        return
+
+    articles = data.get("articles", [])
+    normalized = 0
+    for article in articles:
+        if force or not isinstance(article.get(PUBLISHED_TS_FIELD), int):
+            normalize_pub_date(article)
+            normalized += 1
+        else:
+            ensure_pub_date(article)
+    undated = sum(1 for article in articles if not article[PUBLISHED_TS_FIELD])
+
+    ordered = sorted(articles, key=article_timestamp, reverse=True)
+    reordered = any(a is not b for a, b in zip(ordered, articles))
+    print(f"[{folder}] 기사 {len(articles)}개 - 정규화 {normalized}개, 날짜 없음 {undated}개, "
+          f"{'순서 변경' if reordered else '순서 유지'}")
+
+    if dry_run or not (normalized or reordered):
+        return
+    data["articles"] = ordered
+    data["total_count"] = len(ordered)
+    atomic_file.write_json(data_file, data)
+    static_cache.compress_file(data_file)
+    print(f"[{folder}] 저장 완료")
+
+
+def main():
+    """메인 함수"""
+    import argparse
+    parser = argparse.ArgumentParser(description="기존 data.json 기사에 정규화한 발행 시각(published_at/published_ts) 추가")
+    parser.add_argument("folders", nargs="*", help="처리할 폴더 (기본: 모든 251215* 폴더)")
+    parser.add_argument("--force", action="store_true", help="이미 정규화된 기사도 다시 계산")
+    parser.add_argument("--dry-run", action="store_true", help="저장하지 않고 결과만 출력")
+    args = parser.parse_args()
+
+    print("="*60)
+    print("기존 데이터 발행 시각 정규화")
+    print("="*60)
+
+    for folder in args.folders or find_data_folders():
+        migrate(folder, args.force, args.dry_run)
+
+    print("\n[완료] 모든 작업이 완료되었습니다.")
+
+
+if __name__ == "__main__":
+    main()
@@ -14,6 +14,8 @@ import hashlib
 import urllib3
 from bs4 import BeautifulSoup
 
+import http_client
+
 # SSL 경고 메시지 비활성화
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
@@ -64,7 +66,7 @@ class NaverFinanceAPI:
             }
             
             try:
-                response = requests.get(
+                response = http_client.get(
                     base_url,
                     headers=self.headers,
                     params=params,
@@ -117,7 +119,7 @@ class NaverFinanceAPI:
         if stock_code:
             try:
                 finance_url = f"https://finance.naver.com/item/main.naver?code={stock_code}"
-                response = requests.get(finance_url, timeout=30, verify=False)
+                response = http_client.get(finance_url, timeout=30, verify=False)
                 if response.status_code == 200:
                     soup = BeautifulSoup(response.text, 'html.parser')
                     
@@ -243,7 +245,7 @@ class NaverFinanceAPI:
         
         try:
             finance_url = f"https://finance.naver.com/item/main.naver?code={stock_code}"
-            response = requests.get(finance_url, timeout=30, verify=False)
+            response = http_client.get(finance_url, timeout=30, verify=False)
             if response.status_code == 200:
                 soup = BeautifulSoup(response.text, 'html.parser')
                 
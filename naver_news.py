@@ -11,6 +11,8 @@ from typing import List, Dict
 import hashlib
 import urllib3
 
+import http_client
+
 # SSL 경고 메시지 비활성화 (verify=False 사용 시)
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
@@ -74,7 +76,7 @@ class NaverNewsAPI:
             }
             
             try:
-                response = requests.get(
+                response = http_client.get(
                     base_url,
                     headers=self.headers,
                     params=params,
@@ -186,7 +188,7 @@ class NaverNewsAPI:
             
             try:
                 # SSL 인증서 검증 우회 (회사 네트워크 환경 대응)
-                response = requests.get(
+                response = http_client.get(
                     self.base_url, 
                     headers=self.headers, 
                     params=params, 
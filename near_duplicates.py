@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+근접 중복 기사 탐지 - SimHash + 밴드 LSH 색인으로 여러 매체에 실린 같은 기사를 묶음
+
+기사 ID는 링크의 md5라서, 같은 통신사 기사가 여러 매체와 구글 뉴스 링크로
+실리면 각각 다른 기사로 저장·번역됩니다. 수집 시점에 제목과 제목+요약의
+SimHash(64비트, 글자 3-gram)를 계산해 업체별 색인에서 비트 차이가
+NEAR_DUPLICATE_MAX_DISTANCE 이하인 기사를 찾고, 같은 기사로 보이는 사본은
+대표 기사 하나의 duplicates 목록에 (출처, 링크 등만) 붙입니다.
+
+- 구글 뉴스 제목 끝의 " - 매체명"은 떼고 비교합니다.
+- 구글 뉴스 요약은 제목 + 매체명뿐이라 매체 간 사본은 요약이 다르므로, 제목
+  지문이나 제목+요약 지문 중 하나만 가까워도 같은 기사로 봅니다. 너무 짧은
+  제목과, 제목이 기사 제목이 아닌 구글 웹 검색 결과("회사명 | LinkedIn" 등)는
+  제목만으로는 묶지 않습니다.
+- 색인은 64비트를 (최대 거리 + 1)개 밴드로 나눠 밴드별 버킷에 넣습니다. 비트
+  차이가 최대 거리 이하이면 적어도 한 밴드는 같으므로 후보를 놓치지 않고,
+  전체 기사와 비교하지 않아도 됩니다.
+"""
+
+import hashlib
+import os
+from functools import lru_cache
+import re
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# false로 설정하면 근접 중복 탐지를 하지 않음
+NEAR_DUPLICATE_ENABLED = os.environ.get('NEAR_DUPLICATE_DETECTION', 'true').lower() == 'true'
+# 같은 기사로 볼 SimHash 최대 비트 차이 (64비트 중)
+NEAR_DUPLICATE_MAX_DISTANCE = int(os.environ.get('NEAR_DUPLICATE_MAX_DISTANCE', 3))
+
+SIMHASH_BITS = 64
+SHINGLE_SIZE = 3
+# 정규화한 제목이 이보다 짧으면 제목 지문만으로는 묶지 않음
+MIN_TITLE_CHARS = 10
+
+# 제목 지문을 쓰지 않는 출처 (일반 웹 페이지 제목은 기사 제목처럼 구별되지 않음)
+TITLE_MATCH_EXCLUDED_SOURCES = {"google_web"}
+
+# 대표 기사 우선순위 (원문 링크와 실제 요약이 있는 출처 우선)
+SOURCE_PRIORITY = {"naver": 0, "google_web": 1, "google": 2}
+
+# 대표 기사에 남길 사본 정보
+DUPLICATE_FIELDS = ("article_id", "source", "link", "pub_date", "source_type")
+
+_NON_WORD = re.compile(r"[^\w]+", re.UNICODE)
+
+
+def normalize_text(text: str) -> str:
+    """소문자 + 문장부호/공백 정리"""
+    return _NON_WORD.sub(" ", (text or "").lower()).strip()
+
+
+def strip_source_suffix(title: str, source: str = "") -> str:
+    """구글 뉴스 제목 끝의 " - 매체명" 제거"""
+    title = title or ""
+    if source and title.endswith(" - " + source):
+        return title[:-len(source) - 3]
+    return title
+
+
+# 비트별 개수를 큰 정수 하나에 16비트 칸으로 나눠 더하기 위한 표 (바이트 → 8칸)
+_LANE_BITS = 16
+_LANE_MASK = (1 << _LANE_BITS) - 1
+_SPREAD = [sum((byte >> bit & 1) << (_LANE_BITS * bit) for bit in range(8)) for byte in range(256)]
+
+
+@lru_cache(maxsize=65536)
+def _spread_shingle(shingle: str) -> int:
+    """3-gram 해시의 64비트를 16비트 칸 64개에 펼친 값 (기사마다 같은 3-gram이 많아 캐시)"""
+    digest = hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest()
+    spread = 0
+    # digest는 big-endian → 마지막 바이트가 지문의 0~7번 비트
+    for position, byte in enumerate(digest):
+        spread |= _SPREAD[byte] << (_LANE_BITS * 8 * (7 - position))
+    return spread
+
+
+def simhash(text: str) -> int:
+    """글자 3-gram SimHash (64비트)
+
+    지문 비트마다 1인 3-gram 수를 세어 절반을 넘는 비트를 1로 둡니다. 비트마다
+    반복하는 대신, 각 해시의 비트를 16비트 칸에 펼친 값을 큰 정수 하나에 더해
+    64개 개수를 한 번에 셉니다 (칸 하나에 65535개까지, 3-gram 수를 그 아래로 제한).
+    """
+    text = text.replace(" ", "")
+    if len(text) <= SHINGLE_SIZE:
+        shingles = {text} if text else set()
+    else:
+        shingles = {text[i:i + SHINGLE_SIZE] for i in range(min(len(text), _LANE_MASK) - SHINGLE_SIZE + 1)}
+    if not shingles:
+        return 0
+    total = sum(map(_spread_shingle, shingles))
+    half = len(shingles) / 2
+    fingerprint = 0
+    for bit in range(SIMHASH_BITS):
+        if (total >> (_LANE_BITS * bit)) & _LANE_MASK > half:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+def fingerprints(article: Dict) -> Tuple[Optional[int], Optional[int]]:
+    """(제목 지문, 제목+요약 지문) - 제목이 짧거나 웹 검색 결과면 제목 지문은 None"""
+    title = normalize_text(strip_source_suffix(article.get("title", ""), article.get("source", "")))
+    description = normalize_text(article.get("description", ""))
+    text = f"{title} {description}".strip()
+    title_hash = None
+    if (len(title.replace(" ", "")) >= MIN_TITLE_CHARS
+            and article.get("source_type") not in TITLE_MATCH_EXCLUDED_SOURCES):
+        title_hash = simhash(title)
+    text_hash = simhash(text) if text else None
+    return title_hash, text_hash
+
+
+class NearDuplicateIndex:
+    """업체별 근접 중복 색인 (SimHash 밴드 LSH, 스레드 안전)"""
+
+    def __init__(self, max_distance: int = NEAR_DUPLICATE_MAX_DISTANCE):
+        self.max_distance = max(0, min(max_distance, SIMHASH_BITS // 2 - 1))
+        band_count = self.max_distance + 1
+        width = SIMHASH_BITS // band_count
+        # (시작 비트, 마스크) - 마지막 밴드가 남는 비트를 가짐
+        self._bands = [
+            (index * width, (1 << (width if index < band_count - 1 else SIMHASH_BITS - index * width)) - 1)
+            for index in range(band_count)
+        ]
+        # 지문 종류(제목/제목+요약)별 밴드 버킷: (밴드 번호, 밴드 값) → [(지문, 기사 ID)]
+        self._buckets: Tuple[Dict[Tuple[int, int], List[Tuple[int, str]]], ...] = ({}, {})
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def _keys(self, fingerprint: int):
+        for index, (shift, mask) in enumerate(self._bands):
+            yield index, fingerprint >> shift & mask
+
+    def _find(self, kind: int, fingerprint: Optional[int]) -> Optional[str]:
+        if fingerprint is None:
+            return None
+        best, best_distance = None, self.max_distance + 1
+        for key in self._keys(fingerprint):
+            for other, article_id in self._buckets[kind].get(key, ()):
+                distance = hamming_distance(fingerprint, other)
+                if distance < best_distance:
+                    best, best_distance = article_id, distance
+        return best
+
+    def find(self, article: Dict, prints: Optional[Tuple[Optional[int], Optional[int]]] = None) -> Optional[str]:
+        """같은 기사로 보이는 색인 기사 ID (없으면 None)"""
+        title_hash, text_hash = prints or fingerprints(article)
+        with self._lock:
+            return self._find(0, title_hash) or self._find(1, text_hash)
+
+    def add(self, article: Dict, prints: Optional[Tuple[Optional[int], Optional[int]]] = None):
+        article_id = article.get("article_id", "")
+        with self._lock:
+            for kind, fingerprint in enumerate(prints or fingerprints(article)):
+                if fingerprint is None:
+                    continue
+                for key in self._keys(fingerprint):
+                    self._buckets[kind].setdefault(key, []).append((fingerprint, article_id))
+            self._size += 1
+
+    def add_all(self, articles: Iterable[Dict]):
+        for article in articles:
+            self.add(article)
+
+    def __len__(self) -> int:
+        return self._size
+
+
+def duplicate_entry(article: Dict) -> Dict:
+    """대표 기사의 duplicates에 넣을 사본 정보"""
+    return {field: article.get(field) for field in DUPLICATE_FIELDS}
+
+
+def group_near_duplicates(articles: List[Dict], index: Optional[NearDuplicateIndex] = None
+                          ) -> Tuple[List[Dict], int, Dict[str, List[Dict]]]:
+    """근접 중복 기사를 대표 기사로 묶음
+
+    목록 안의 사본끼리는 출처 우선순위가 높은 기사를 대표로 남겨 나머지를 대표
+    기사의 duplicates에 붙입니다. index에 있는 (이미 저장된) 기사와 같은 기사는
+    목록에서 빼고, 저장된 기사의 duplicates에 붙일 사본 정보로 돌려줍니다 (사본이
+    가진 duplicates 포함). 남은 대표 기사는 index에 추가합니다.
+    반환: (대표 기사 목록 - 입력 순서 유지, 묶은 기사 수,
+           저장된 기사 ID → 그 기사에 붙일 사본 정보 목록)
+    """
+    stored_duplicates: Dict[str, List[Dict]] = {}
+    if not NEAR_DUPLICATE_ENABLED or not articles:
+        return articles, 0, stored_duplicates
+    if index is None:
+        index = NearDuplicateIndex()
+    batch = NearDuplicateIndex(index.max_distance)
+    canonical: Dict[str, Dict] = {}
+    dropped = set()
+
+    prints_by_position = [fingerprints(article) for article in articles]
+    order = sorted(range(len(articles)), key=lambda i: SOURCE_PRIORITY.get(articles[i].get("source_type"), 9))
+    for position in order:
+        article = articles[position]
+        prints = prints_by_position[position]
+        stored_match = index.find(article, prints)
+        if stored_match:
+            copies = stored_duplicates.setdefault(stored_match, [])
+            copies.append(duplicate_entry(article))
+            copies.extend(article.get("duplicates", ()))
+            dropped.add(position)
+            continue
+        match = batch.find(article, prints)
+        if match:
+            duplicates = canonical[match].setdefault("duplicates", [])
+            duplicates.append(duplicate_entry(article))
+            duplicates.extend(article.get("duplicates", ()))
+            dropped.add(position)
+            continue
+        batch.add(article, prints)
+        canonical[article.get("article_id", "")] = article
+
+    kept = []
+    for position, article in enumerate(articles):
+        if position not in dropped:
+            kept.append(article)
+            index.add(article, prints_by_position[position])
+    return kept, len(dropped), stored_duplicates
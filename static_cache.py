@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+정적 파일 캐시 - 강한 ETag 계산과 gzip/brotli 사전 압축본 관리
+
+data.json과 대시보드 HTML은 파일 옆에 압축본(data.json.gz, data.json.br)을
+만들어 두고, 원본이 바뀌면 다시 만듭니다. 압축본의 mtime을 원본과 같게
+맞춰 두므로 mtime이 다르면 오래된 압축본으로 판단합니다.
+"""
+
+import gzip
+import hashlib
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# brotli 모듈 (선택적)
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+# ETag/압축 대상 확장자
+CACHEABLE_SUFFIXES = ('.json', '.html')
+# 이보다 작은 파일은 압축하지 않음 (헤더 비용이 더 큼)
+MIN_COMPRESS_SIZE = 1024
+
+
+def _gzip(data: bytes) -> bytes:
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def _brotli(data: bytes) -> bytes:
+    return brotli.compress(data, quality=11)
+
+
+# (Content-Encoding, 파일 접미사, 압축 함수) - 선호 순서
+ENCODINGS: List[Tuple[str, str, object]] = []
+if BROTLI_AVAILABLE:
+    ENCODINGS.append(('br', '.br', _brotli))
+ENCODINGS.append(('gzip', '.gz', _gzip))
+
+# 경로별 (mtime_ns, 크기, ETag 값)
+_etags: Dict[str, Tuple[int, int, str]] = {}
+_lock = threading.Lock()
+# 같은 파일의 압축본을 동시에 만들지 않도록 파일별 잠금
+_compress_locks: Dict[str, threading.Lock] = {}
+
+
+def _file_lock(path: str) -> threading.Lock:
+    with _lock:
+        lock = _compress_locks.get(path)
+        if lock is None:
+            lock = threading.Lock()
+            _compress_locks[path] = lock
+        return lock
+
+
+def file_etag(path, st: Optional[os.stat_result] = None) -> str:
+    """파일 내용 기반 강한 ETag 값 (따옴표 제외, 인코딩 접미사 없음)
+
+    내용 해시는 (mtime, 크기)가 같으면 다시 계산하지 않습니다.
+    """
+    path = str(path)
+    st = st or os.stat(path)
+    with _lock:
+        cached = _etags.get(path)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            digest.update(chunk)
+    etag = digest.hexdigest()[:32]
+    with _lock:
+        _etags[path] = (st.st_mtime_ns, st.st_size, etag)
+    return etag
+
+
+def compress_file(path) -> List[str]:
+    """원본 파일의 압축본을 모두 다시 만듦 (만든 Content-Encoding 목록 반환)"""
+    path = Path(path)
+    with _file_lock(str(path)):
+        try:
+            st = path.stat()
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return []
+        if len(data) < MIN_COMPRESS_SIZE:
+            return []
+
+        created = []
+        for encoding, suffix, compress in ENCODINGS:
+            variant = path.with_name(path.name + suffix)
+            tmp_file = variant.with_name(variant.name + '.tmp')
+            try:
+                tmp_file.write_bytes(compress(data))
+                # 원본과 같은 mtime으로 맞춰 두어 원본 변경 여부를 판단
+                os.utime(tmp_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+                os.replace(tmp_file, variant)
+                created.append(encoding)
+            except Exception as e:
+                print(f"[압축] {variant} 생성 오류: {str(e)}")
+        return created
+
+
+def _parse_accept_encoding(header: Optional[str]) -> Dict[str, float]:
+    accepted = {}
+    for part in (header or "").split(','):
+        token, _, params = part.strip().partition(';')
+        token = token.strip().lower()
+        if not token:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[token] = q
+    return accepted
+
+
+def select_variant(path, accept_encoding: Optional[str],
+                   st: Optional[os.stat_result] = None) -> Tuple[Optional[str], str]:
+    """클라이언트가 받을 수 있는 압축본 선택
+
+    반환: (Content-Encoding 또는 None, 보낼 파일 경로)
+    압축본이 없거나 오래됐으면 이 자리에서 다시 만듭니다.
+    """
+    path = str(path)
+    st = st or os.stat(path)
+    if st.st_size < MIN_COMPRESS_SIZE:
+        return None, path
+
+    accepted = _parse_accept_encoding(accept_encoding)
+    for encoding, suffix, _ in ENCODINGS:
+        if accepted.get(encoding, accepted.get('*', 0)) <= 0:
+            continue
+        variant = path + suffix
+        try:
+            fresh = os.stat(variant).st_mtime_ns == st.st_mtime_ns
+        except FileNotFoundError:
+            fresh = False
+        if not fresh:
+            compress_file(path)
+            try:
+                fresh = os.stat(variant).st_mtime_ns == st.st_mtime_ns
+            except FileNotFoundError:
+                fresh = False
+        if fresh:
+            return encoding, variant
+    return None, path
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match 헤더가 이 파일의 ETag(어느 인코딩이든)와 일치하는지"""
+    for candidate in if_none_match.split(','):
+        candidate = candidate.strip()
+        if candidate == '*':
+            return True
+        if candidate.startswith('W/'):
+            candidate = candidate[2:]
+        candidate = candidate.strip('"')
+        if candidate.split('-', 1)[0] == etag:
+            return True
+    return False
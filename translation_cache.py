@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+번역 캐시 - (원문 해시, 언어 쌍) → 번역문을 파일에 저장해 같은 문장을 다시 번역하지 않음
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# 캐시 설정 (환경 변수로 조정 가능)
+TRANSLATION_CACHE_FILE = os.environ.get(
+    'TRANSLATION_CACHE_FILE', str(Path(__file__).parent / "translation_cache.json"))
+TRANSLATION_CACHE_MAX_ENTRIES = int(os.environ.get('TRANSLATION_CACHE_MAX_ENTRIES', 20000))
+TRANSLATION_CACHE_MAX_AGE_DAYS = int(os.environ.get('TRANSLATION_CACHE_MAX_AGE_DAYS', 90))
+# 새 항목이 이만큼 쌓이면 파일에 저장
+SAVE_EVERY = 50
+
+
+class TranslationCache:
+    """번역 결과 캐시 (스레드 안전)
+
+    항목: 키 → [번역문, 생성 시각, 마지막 사용 시각]
+    생성 후 max_age_days가 지난 항목은 버리고, max_entries를 넘으면 가장 오래
+    사용하지 않은 항목부터 버립니다.
+    """
+
+    def __init__(self, filepath=TRANSLATION_CACHE_FILE,
+                 max_entries: int = TRANSLATION_CACHE_MAX_ENTRIES,
+                 max_age_days: int = TRANSLATION_CACHE_MAX_AGE_DAYS):
+        self.filepath = Path(filepath)
+        self.max_entries = max(1, max_entries)
+        self.max_age = max_age_days * 86400
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._entries: Optional[Dict[str, List]] = None  # 처음 사용할 때 로드
+        self._unsaved = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(text: str, source: str, target: str) -> str:
+        digest = hashlib.sha256(text.encode('utf-8')).hexdigest()
+        return f"{source}:{target}:{digest}"
+
+    def _ensure_loaded(self):
+        """캐시 파일 로드 (잠금 보유 상태에서 호출)"""
+        if self._entries is not None:
+            return
+        self._entries = {}
+        try:
+            with open(self.filepath, 'r', encoding='utf-8') as f:
+                self._entries = json.load(f).get("entries", {})
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"[번역 캐시] 캐시 파일 로드 오류: {str(e)}")
+        self._evict_locked()
+
+    def _evict_locked(self):
+        now = time.time()
+        expired = [key for key, entry in self._entries.items() if now - entry[1] > self.max_age]
+        for key in expired:
+            del self._entries[key]
+
+        excess = len(self._entries) - self.max_entries
+        if excess > 0:
+            # 자주 넘치지 않도록 한도의 10%를 더 비움
+            excess += self.max_entries // 10
+            for key in sorted(self._entries, key=lambda k: self._entries[k][2])[:excess]:
+                del self._entries[key]
+
+    def get(self, text: str, source: str = 'en', target: str = 'ko') -> Optional[str]:
+        """캐시된 번역문 (없거나 만료됐으면 None)"""
+        key = self.make_key(text, source, target)
+        now = time.time()
+        with self._lock:
+            self._ensure_loaded()
+            entry = self._entries.get(key)
+            if entry is not None and now - entry[1] > self.max_age:
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            entry[2] = now
+            self.hits += 1
+            return entry[0]
+
+    def put(self, text: str, translation: str, source: str = 'en', target: str = 'ko'):
+        if not translation:
+            return
+        key = self.make_key(text, source, target)
+        now = time.time()
+        with self._lock:
+            self._ensure_loaded()
+            self._entries[key] = [translation, now, now]
+            self._unsaved += 1
+            if len(self._entries) > self.max_entries:
+                self._evict_locked()
+            should_save = self._unsaved >= SAVE_EVERY
+        if should_save:
+            self.save()
+
+    def save(self):
+        """캐시를 파일에 저장 (임시 파일에 쓴 뒤 교체)"""
+        with self._lock:
+            if self._entries is None or self._unsaved == 0:
+                return
+            self._evict_locked()
+            data = {"entries": dict(self._entries)}
+            self._unsaved = 0
+        tmp_file = self.filepath.with_suffix(self.filepath.suffix + ".tmp")
+        with self._save_lock:
+            try:
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False)
+                os.replace(tmp_file, self.filepath)
+            except Exception as e:
+                print(f"[번역 캐시] 캐시 파일 저장 오류: {str(e)}")
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 3) if total else 0.0,
+                "entries": len(self._entries) if self._entries is not None else 0,
+            }
+
+    def format_stats(self) -> str:
+        stats = self.get_stats()
+        return (f"적중 {stats['hits']}회, 미적중 {stats['misses']}회 "
+                f"(적중률 {stats['hit_rate'] * 100:.1f}%), 저장된 번역 {stats['entries']}개")
+
+
+# 프로세스 전체에서 공유하는 번역 캐시
+translation_cache = TranslationCache()
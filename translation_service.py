@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+번역 서비스 - 전용 세션으로 구글 번역 모바일 페이지를 호출하고, 짧은 문장은 묶어서 번역
+
+전역 requests를 패치하지 않고 자체 세션(SSL 검증 설정 포함)을 쓰므로 여러
+크롤링이 동시에 사용해도 안전합니다. 번역 요청은 프로세스 전체에서 공유하는
+워커 풀에서 실행되어 동시 요청 수가 제한됩니다.
+"""
+
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+import urllib3
+from bs4 import BeautifulSoup
+
+import http_client
+from crawl_pool import host_limiter
+from translation_cache import translation_cache, TranslationCache
+
+# 번역 설정 (환경 변수로 조정 가능)
+TRANSLATE_URL = "https://translate.google.com/m"
+TRANSLATE_MAX_WORKERS = int(os.environ.get('TRANSLATE_MAX_WORKERS', 4))
+# 한 번에 묶어서 보낼 최대 글자 수
+TRANSLATE_BATCH_CHARS = int(os.environ.get('TRANSLATE_BATCH_CHARS', 3000))
+# 요청 한 번에 번역할 수 있는 최대 글자 수 (넘으면 문장 단위로 나눔)
+TRANSLATE_MAX_CHARS = 5000
+TRANSLATE_TIMEOUT = 15
+# 기존 번역 경로와 같이 기본은 SSL 검증 없이 호출
+TRANSLATE_VERIFY_SSL = os.environ.get('TRANSLATE_VERIFY_SSL', 'false').lower() == 'true'
+
+if not TRANSLATE_VERIFY_SSL:
+    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+
+def is_mostly_english(text: str) -> bool:
+    """텍스트가 주로 영어인지 판단 (한글이 있으면 영어가 아님)"""
+    if not text:
+        return False
+    if re.search(r'[가-힣]', text):
+        return False
+    # 영문자, 숫자, 공백, 기본 구두점이 주를 이루는지 확인
+    english_chars = len(re.findall(r'[a-zA-Z0-9\s.,!?;:\-()\[\]{}"\']', text))
+    total_chars = len(re.sub(r'\s', '', text))
+    if total_chars == 0:
+        return False
+    return (english_chars / total_chars) > 0.7
+
+
+class TranslationService:
+    """캐시 → 묶음 번역 → 개별 번역 순으로 처리하는 번역기 (스레드 안전)
+
+    묶음 번역은 한 줄짜리 문장들을 줄바꿈으로 이어 한 번에 요청하고 결과를
+    줄 단위로 다시 나눕니다. 결과 줄 수가 맞지 않으면 해당 묶음은 개별로
+    번역하고, 이후에는 묶음 번역을 사용하지 않습니다.
+    """
+
+    def __init__(self, source: str = 'en', target: str = 'ko',
+                 max_workers: int = TRANSLATE_MAX_WORKERS,
+                 batch_chars: int = TRANSLATE_BATCH_CHARS,
+                 cache: Optional[TranslationCache] = translation_cache,
+                 verify_ssl: bool = TRANSLATE_VERIFY_SSL):
+        self.source = source
+        self.target = target
+        self.batch_chars = min(batch_chars, TRANSLATE_MAX_CHARS)
+        self.cache = cache
+        self._session = http_client.create_session()
+        self._session.verify = verify_ssl
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="translate")
+        self._batching = True
+        self._lock = threading.Lock()
+        self.requests = 0
+
+    # ------------------------------------------------------------ 요청 단위
+    def _request(self, text: str) -> Optional[str]:
+        """번역 요청 한 번 (실패하면 None)"""
+        params = {"sl": self.source, "tl": self.target, "q": text}
+        try:
+            with host_limiter.limit(TRANSLATE_URL):
+                response = self._session.get(TRANSLATE_URL, params=params, timeout=TRANSLATE_TIMEOUT)
+            with self._lock:
+                self.requests += 1
+            if response.status_code != 200:
+                print(f"    [번역 오류] HTTP {response.status_code}")
+                return None
+            soup = BeautifulSoup(response.text, 'html.parser')
+            element = soup.find('div', {'class': 't0'}) or soup.find('div', {'class': 'result-container'})
+            if not element:
+                return None
+            return element.get_text().strip() or None
+        except Exception as e:
+            print(f"    [번역 오류] {str(e)}")
+            return None
+
+    @staticmethod
+    def _split_long(text: str, chunk_size: int = TRANSLATE_MAX_CHARS) -> List[str]:
+        """긴 텍스트를 문장 단위로 chunk_size 이하 조각으로 나눔"""
+        chunks = []
+        current_chunk = ""
+        for sentence in re.split(r'(?<=[.!?])\s+', text):
+            if len(current_chunk) + len(sentence) <= chunk_size:
+                current_chunk += sentence + " "
+                continue
+            if current_chunk.strip():
+                chunks.append(current_chunk.strip())
+            # 한 문장이 chunk_size보다 길면 글자 수로 자름
+            while len(sentence) > chunk_size:
+                chunks.append(sentence[:chunk_size])
+                sentence = sentence[chunk_size:]
+            current_chunk = sentence + " "
+        if current_chunk.strip():
+            chunks.append(current_chunk.strip())
+        return chunks
+
+    def _translate_one(self, text: str) -> Optional[str]:
+        if len(text) <= TRANSLATE_MAX_CHARS:
+            return self._request(text)
+        parts = [self._request(chunk) for chunk in self._split_long(text)]
+        parts = [part for part in parts if part]
+        return "\n\n".join(parts) if parts else None
+
+    def _translate_batch(self, texts: List[str]) -> List[Optional[str]]:
+        if len(texts) == 1 or not self._batching:
+            return [self._translate_one(text) for text in texts]
+
+        result = self._request("\n".join(texts))
+        if result:
+            lines = [line.strip() for line in result.split("\n") if line.strip()]
+            if len(lines) == len(texts):
+                return lines
+            with self._lock:
+                if self._batching:
+                    print(f"[번역] 묶음 번역 결과가 {len(texts)}줄이 아닌 {len(lines)}줄 → 개별 번역으로 전환")
+                    self._batching = False
+        return [self._translate_one(text) for text in texts]
+
+    def _make_batches(self, texts: List[str]) -> List[List[str]]:
+        """한 줄짜리 짧은 문장은 batch_chars 이하로 묶고, 나머지는 하나씩"""
+        batches = []
+        current, current_len = [], 0
+        for text in texts:
+            if "\n" in text or len(text) > self.batch_chars:
+                batches.append([text])
+                continue
+            if current and current_len + len(text) + 1 > self.batch_chars:
+                batches.append(current)
+                current, current_len = [], 0
+            current.append(text)
+            current_len += len(text) + 1
+        if current:
+            batches.append(current)
+        return batches
+
+    # ------------------------------------------------------------ 인터페이스
+    def translate_many(self, texts: List[str]) -> List[Optional[str]]:
+        """여러 문장 번역 (입력 순서대로, 실패한 항목은 None)
+
+        같은 문장은 한 번만 번역하고, 캐시에 있으면 네트워크를 쓰지 않습니다.
+        """
+        results: List[Optional[str]] = [None] * len(texts)
+        pending: Dict[str, List[int]] = {}
+        for index, text in enumerate(texts):
+            text = (text or "").strip()
+            if not text:
+                continue
+            if text in pending:
+                pending[text].append(index)
+                continue
+            cached = self.cache.get(text, self.source, self.target) if self.cache else None
+            if cached:
+                results[index] = cached
+            else:
+                pending[text] = [index]
+
+        if not pending:
+            return results
+
+        batches = self._make_batches(list(pending))
+        futures = [self._executor.submit(self._translate_batch, batch) for batch in batches]
+        for batch, future in zip(batches, futures):
+            try:
+                translations = future.result()
+            except Exception as e:
+                print(f"    [번역 오류] {str(e)}")
+                translations = [None] * len(batch)
+            for text, translation in zip(batch, translations):
+                if translation and self.cache:
+                    self.cache.put(text, translation, self.source, self.target)
+                for index in pending[text]:
+                    results[index] = translation
+        return results
+
+    def translate(self, text: str) -> Optional[str]:
+        """문장 하나 번역 (실패하면 None)"""
+        return self.translate_many([text])[0]
+
+
+# 프로세스 전체에서 공유하는 영어 → 한국어 번역기
+translation_service = TranslationService('en', 'ko')
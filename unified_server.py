@@ -5,16 +5,33 @@
 """
 
 import os
+import signal
 import sys
 import time
+
+# 시작 시간 측정 기준 (모듈 import 시간 포함)
+STARTUP_STARTED = time.perf_counter()
+
 import json
 import http.server
 import socketserver
 import threading
+import email.utils
 from pathlib import Path
 from urllib.parse import urlparse, parse_qs
 from datetime import datetime, timezone, timedelta
 
+import atomic_file
+import static_cache
+from article_cache import article_cache
+from article_prefetch import article_bodies, article_prefetcher
+from crawl_jobs import CrawlJobQueue
+from translation_cache import translation_cache
+from article_events import event_broker, format_sse, SSE_KEEPALIVE_SECONDS
+from article_store import get_store, DEFAULT_PAGE_SIZE
+from write_behind import WriteBehind
+from near_duplicates import NearDuplicateIndex, group_near_duplicates
+
 # 로그 파일 설정
 LOG_FILE = Path(__file__).parent / "server.log"
 
@@ -52,62 +69,39 @@ def get_kst_now():
     """한국 시간 현재 시각 반환"""
     return datetime.now(KST)
 
-# 각 업체별 크롤러 import (독립적으로 로드)
+# 업체 레지스트리 - config.json이 있는 업체 폴더를 slug별로 등록
+# (경쟁사 추가는 새 폴더에 config.json과 index.html을 두는 것으로 충분)
+# 크롤러 모듈과 무거운 의존성(bs4, feedparser, 번역 서비스 등)은 업체별로
+# 크롤러가 처음 필요할 때 불러오므로 서버는 설정 파일만 읽고 바로 시작합니다.
 import importlib.util
+from company_config import find_company_configs
+
+def load_crawler_class(company_config: dict):
+    """업체 폴더의 crawler.py에서 크롤러 클래스 로드 (독립적으로 로드, 없으면 공용 엔진 사용)"""
+    crawler_file = Path(__file__).parent / company_config["folder"] / "crawler.py"
+    class_name = company_config.get("crawler_class")
+    if class_name and crawler_file.exists():
+        spec = importlib.util.spec_from_file_location(f"crawler_{company_config['slug']}", crawler_file)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return getattr(module, class_name)
+    from news_crawler import NewsCrawler
+    return NewsCrawler
+
+def create_crawler(company: str):
+    """업체 설정으로 크롤러 인스턴스 생성 (크롤러 모듈은 이때 처음 로드)"""
+    company_config = COMPANIES[company]
+    started = time.perf_counter()
+    crawler_class = load_crawler_class(company_config)
+    if crawler_class.CONFIG_DIR is None:
+        crawler = crawler_class(config_dir=Path(__file__).parent / company_config["folder"])
+    else:
+        crawler = crawler_class()
+    print(f"[크롤러 로드] {company}: {crawler_class.__name__} ({time.perf_counter() - started:.2f}초)")
+    return crawler
 
-# 화승 알엔에이
-spec_hwasung_crawler = importlib.util.spec_from_file_location(
-    "crawler_hwasung", 
-    Path(__file__).parent / "251215" / "crawler.py"
-)
-crawler_hwasung_module = importlib.util.module_from_spec(spec_hwasung_crawler)
-spec_hwasung_crawler.loader.exec_module(crawler_hwasung_module)
-HwasungNewsCrawler = crawler_hwasung_module.HwasungNewsCrawler
-
-# 유일고무
-spec_yuil_crawler = importlib.util.spec_from_file_location(
-    "crawler_yuil", 
-    Path(__file__).parent / "251215_yuil" / "crawler.py"
-)
-crawler_yuil_module = importlib.util.module_from_spec(spec_yuil_crawler)
-spec_yuil_crawler.loader.exec_module(crawler_yuil_module)
-YuilNewsCrawler = crawler_yuil_module.YuilNewsCrawler
-
-# AIA
-spec_aia_crawler = importlib.util.spec_from_file_location(
-    "crawler_aia", 
-    Path(__file__).parent / "251215_aia" / "crawler.py"
-)
-crawler_aia_module = importlib.util.module_from_spec(spec_aia_crawler)
-spec_aia_crawler.loader.exec_module(crawler_aia_module)
-AIANewsCrawler = crawler_aia_module.AIANewsCrawler
-
-# Cooper Standard
-spec_cooper_crawler = importlib.util.spec_from_file_location(
-    "crawler_cooper", 
-    Path(__file__).parent / "251215_cooper" / "crawler.py"
-)
-crawler_cooper_module = importlib.util.module_from_spec(spec_cooper_crawler)
-spec_cooper_crawler.loader.exec_module(crawler_cooper_module)
-CooperStandardNewsCrawler = crawler_cooper_module.CooperStandardNewsCrawler
-
-# SaarGummi
-spec_saargummi_crawler = importlib.util.spec_from_file_location(
-    "crawler_saargummi", 
-    Path(__file__).parent / "251215_saargummi" / "crawler.py"
-)
-crawler_saargummi_module = importlib.util.module_from_spec(spec_saargummi_crawler)
-spec_saargummi_crawler.loader.exec_module(crawler_saargummi_module)
-SaarGummiNewsCrawler = crawler_saargummi_module.SaarGummiNewsCrawler
-
-# Hutchinson
-spec_hutchinson_crawler = importlib.util.spec_from_file_location(
-    "crawler_hutchinson", 
-    Path(__file__).parent / "251215_hutchinson" / "crawler.py"
-)
-crawler_hutchinson_module = importlib.util.module_from_spec(spec_hutchinson_crawler)
-spec_hutchinson_crawler.loader.exec_module(crawler_hutchinson_module)
-HutchinsonNewsCrawler = crawler_hutchinson_module.HutchinsonNewsCrawler
+# slug → 업체 설정 (config.json 내용 + "folder")
+COMPANIES = find_company_configs(Path(__file__).parent)
 
 # 스케줄러는 직접 구현 (import 충돌 방지)
 class UnifiedNewsScheduler:
@@ -130,48 +124,14 @@ class UnifiedNewsScheduler:
             # 크롤링 실행
             new_crawled_articles = self.crawler.crawl_all_news()
             
-            # 삭제된 기사 ID 목록 로드
-            deleted_ids = load_deleted_articles(self.company_name)
-            if deleted_ids:
-                print(f"[{self.company_name} 삭제된 기사 필터링] {len(deleted_ids)}개의 삭제된 기사 ID 제외")
-            
-            # 기존 데이터 로드
-            data_file = get_data_file_path(self.company_name)
-            existing_data = self.crawler.load_from_json(data_file)
-            existing_articles = existing_data.get("articles", [])
-            existing_ids = {article["article_id"] for article in existing_articles}
-            
-            # 새로운 기사만 추가 (기존에 없고, 삭제된 목록에도 없는 기사만)
-            new_articles = [
-                article for article in new_crawled_articles 
-                if article["article_id"] not in existing_ids and article["article_id"] not in deleted_ids
-            ]
-            
-            # 기존 기사와 새 기사 병합
-            all_articles = existing_articles + new_articles
-            
-            # 날짜순 정렬 (최신순)
-            def parse_date(date_str):
-                """날짜 문자열을 파싱하여 정렬 가능한 형식으로 변환"""
-                if not date_str:
-                    return "0000-00-00 00:00:00"
-                try:
-                    if len(date_str) >= 19 and date_str[4] == '-':
-                        return date_str[:19]
-                    dt = datetime.strptime(date_str[:25], "%a, %d %b %Y %H:%M:%S")
-                    return dt.strftime("%Y-%m-%d %H:%M:%S")
-                except:
-                    return date_str[:19] if len(date_str) >= 19 else date_str
-            
-            all_articles.sort(key=lambda x: parse_date(x.get("pub_date", "")), reverse=True)
-            
-            # 모든 기사 저장
-            self.crawler.save_to_json(all_articles, data_file)
+            # 새 기사만 메모리 저장소에 추가 (data.json은 지연 저장)
+            new_articles, total_count = merge_crawled_articles(self.company_name, self.crawler, new_crawled_articles)
             
             # GitHub 백업 (활성화된 경우)
             if BACKUP_AVAILABLE and os.environ.get('ENABLE_GITHUB_BACKUP', 'false').lower() == 'true':
                 try:
                     print(f"[백업] {self.company_name} 데이터 백업 시작...")
+                    persist_queue.flush()  # 미뤄 둔 저장을 먼저 파일에 반영
                     backup_to_github()
                 except Exception as e:
                     print(f"[백업 오류] {str(e)}")
@@ -183,7 +143,7 @@ class UnifiedNewsScheduler:
             else:
                 print(f"[새로운 기사] 새로운 기사 없음")
             
-            print(f"[업데이트 완료] 총 {len(all_articles)}개의 기사")
+            print(f"[업데이트 완료] 총 {total_count}개의 기사")
             print(f"{'='*60}\n")
             
         except Exception as e:
@@ -223,56 +183,61 @@ class UnifiedNewsScheduler:
 BASE_DIR = Path(__file__).parent
 os.chdir(BASE_DIR)
 
+# 동시에 실행할 크롤링 작업 수 (요청 처리 스레드와 분리된 워커 풀)
+CRAWL_WORKERS = int(os.environ.get('CRAWL_WORKERS', 2))
+
 # 각 업체별 크롤러 인스턴스
-crawlers = {
-    "hwasung": None,
-    "yuil": None,
-    "aia": None,
-    "cooper": None,
-    "saargummi": None,
-    "hutchinson": None
-}
+crawlers = {company: None for company in COMPANIES}
 
 # 각 업체별 스케줄러 인스턴스
-schedulers = {
-    "hwasung": None,
-    "yuil": None,
-    "aia": None,
-    "cooper": None,
-    "saargummi": None,
-    "hutchinson": None
-}
+schedulers = {company: None for company in COMPANIES}
+
+# 크롤러 생성 잠금 (같은 업체 크롤러가 동시에 두 번 만들어지지 않도록)
+crawlers_lock = threading.Lock()
+
+# 메모리에서 바꾼 기사 목록/삭제 ID를 파일로 저장하기 전에 모으는 시간 (초)
+# 그 사이의 변경은 한 번의 data.json / deleted_articles.json 저장으로 합쳐집니다.
+PERSIST_DELAY_SECONDS = float(os.environ.get('PERSIST_DELAY_SECONDS', 2))
+persist_queue = WriteBehind(PERSIST_DELAY_SECONDS, name="지연 저장")
+
+# 업체별 삭제된 기사 ID (처음 사용할 때 파일에서 한 번 읽고 이후에는 메모리에서 갱신)
+deleted_ids_cache = {}
+deleted_ids_lock = threading.Lock()
+
+# 업체별 근접 중복 색인 (처음 사용할 때 저장된 기사로 만들고 이후 새 기사만 추가)
+near_duplicate_indexes = {}
+near_duplicate_lock = threading.Lock()
+
+# 업체별 기사 목록 마지막 변경 시각 (data.json 저장이 늦어질 수 있어 파일 수정 시각 대신 사용)
+last_changed = {}
 
 def get_crawler(company: str):
-    """업체별 크롤러 인스턴스 가져오기"""
-    if company == "hwasung":
-        if crawlers["hwasung"] is None:
-            crawlers["hwasung"] = HwasungNewsCrawler()
-        return crawlers["hwasung"]
-    elif company == "yuil":
-        if crawlers["yuil"] is None:
-            crawlers["yuil"] = YuilNewsCrawler()
-        return crawlers["yuil"]
-    elif company == "aia":
-        if crawlers["aia"] is None:
-            crawlers["aia"] = AIANewsCrawler()
-        return crawlers["aia"]
-    elif company == "cooper":
-        if crawlers["cooper"] is None:
-            crawlers["cooper"] = CooperStandardNewsCrawler()
-        return crawlers["cooper"]
-    elif company == "saargummi":
-        if crawlers["saargummi"] is None:
-            crawlers["saargummi"] = SaarGummiNewsCrawler()
-        return crawlers["saargummi"]
-    elif company == "hutchinson":
-        if crawlers["hutchinson"] is None:
-            crawlers["hutchinson"] = HutchinsonNewsCrawler()
-        return crawlers["hutchinson"]
-    return None
+    """업체별 크롤러 인스턴스 가져오기 (처음 요청될 때 생성)"""
+    if company not in COMPANIES:
+        return None
+    if crawlers[company] is None:
+        with crawlers_lock:
+            if crawlers[company] is None:
+                crawler = create_crawler(company)
+                seed_url_index(company, crawler)
+                crawlers[company] = crawler
+    return crawlers[company]
 
-def update_news_now(company: str):
-    """즉시 뉴스 업데이트 실행"""
+def seed_url_index(company: str, crawler):
+    """정규 URL 색인에 저장된 기사 링크 추가 (색인 파일이 생기기 전에 저장된 기사도 다른 출처 사본을 거르도록)"""
+    url_index = getattr(crawler, "url_index", None)
+    if url_index is None:
+        return
+    try:
+        store = get_store(get_data_file_path(company), company)
+        added = url_index.seed(store.articles())
+        if added:
+            print(f"[{company} URL 색인] 저장된 기사 링크 {added}개 추가 (전체 {len(url_index)}개)")
+    except Exception as e:
+        print(f"[{company} URL 색인 오류] {str(e)}")
+
+def update_news_now(company: str, progress_callback=None):
+    """즉시 뉴스 업데이트 실행 (progress_callback: 크롤링 진행 상황 콜백)"""
     crawler = get_crawler(company)
     if crawler is None:
         return {
@@ -282,50 +247,16 @@ def update_news_now(company: str):
     
     try:
         print(f"\n[{company} 수동 업데이트 요청] {get_kst_now().strftime('%Y-%m-%d %H:%M:%S')}")
-        new_crawled_articles = crawler.crawl_all_news()
-        
-        # 삭제된 기사 ID 목록 로드
-        deleted_ids = load_deleted_articles(company)
-        print(f"[{company} 삭제된 기사 필터링] {len(deleted_ids)}개의 삭제된 기사 ID 제외")
-        
-        # 기존 데이터 로드
-        data_file = f"{get_data_file_path(company)}"
-        existing_data = crawler.load_from_json(data_file)
-        existing_articles = existing_data.get("articles", [])
-        existing_ids = {article["article_id"] for article in existing_articles}
-        
-        # 새로운 기사만 확인 (기존에 없고, 삭제된 목록에도 없는 기사만)
-        new_articles = [
-            article for article in new_crawled_articles 
-            if article["article_id"] not in existing_ids and article["article_id"] not in deleted_ids
-        ]
-        
-        # 기존 기사와 새 기사 병합
-        all_articles = existing_articles + new_articles
-        
-        # 날짜순 정렬 (최신순)
-        def parse_date(date_str):
-            """날짜 문자열을 파싱하여 정렬 가능한 형식으로 변환"""
-            if not date_str:
-                return "0000-00-00 00:00:00"
-            try:
-                if len(date_str) >= 19 and date_str[4] == '-':
-                    return date_str[:19]
-                from datetime import datetime
-                dt = datetime.strptime(date_str[:25], "%a, %d %b %Y %H:%M:%S")
-                return dt.strftime("%Y-%m-%d %H:%M:%S")
-            except:
-                return date_str[:19] if len(date_str) >= 19 else date_str
+        new_crawled_articles = crawler.crawl_all_news(progress_callback=progress_callback)
         
-        all_articles.sort(key=lambda x: parse_date(x.get("pub_date", "")), reverse=True)
-        
-        # 모든 기사 저장
-        crawler.save_to_json(all_articles, data_file)
+        # 새 기사만 메모리 저장소에 추가 (data.json은 지연 저장)
+        new_articles, total_count = merge_crawled_articles(company, crawler, new_crawled_articles)
         
         # GitHub 백업 (활성화된 경우)
         if BACKUP_AVAILABLE and os.environ.get('ENABLE_GITHUB_BACKUP', 'false').lower() == 'true':
             try:
                 print(f"[백업] {company} 데이터 백업 시작...")
+                persist_queue.flush()  # 미뤄 둔 저장을 먼저 파일에 반영
                 backup_to_github()
             except Exception as e:
                 print(f"[백업 오류] {str(e)}")
@@ -334,11 +265,11 @@ def update_news_now(company: str):
         
         result = {
             "success": True,
-            "total_count": len(all_articles),
+            "total_count": total_count,
             "new_count": len(new_articles),
             "last_updated": get_kst_now().strftime('%Y-%m-%d %H:%M:%S')
         }
-        print(f"[{company} 수동 업데이트 완료] 총 {len(all_articles)}개, 신규 {len(new_articles)}개")
+        print(f"[{company} 수동 업데이트 완료] 총 {total_count}개, 신규 {len(new_articles)}개")
         return result
     except Exception as e:
         print(f"[{company} 수동 업데이트 오류] {str(e)}")
@@ -355,104 +286,205 @@ def update_news_now(company: str):
             "error": str(e)
         }
 
+def merge_crawled_articles(company: str, crawler, crawled_articles):
+    """크롤링 결과 중 새 기사만 저장소에 추가하고 data.json 저장을 예약
+
+    반환: (새 기사 목록, 전체 기사 수)
+    """
+    # 삭제된 기사 ID (메모리)
+    deleted_ids = get_deleted_ids(company)
+    if deleted_ids:
+        print(f"[{company} 삭제된 기사 필터링] {len(deleted_ids)}개의 삭제된 기사 ID 제외")
+    
+    # 기존 데이터 (기사 저장소)
+    store = get_store(get_data_file_path(company), company)
+    existing_ids = store.ids()
+    marker = store.marker()
+    
+    # 새로운 기사만 추가 (기존에 없고, 삭제된 목록에도 없는 기사만)
+    new_articles = [
+        article for article in crawled_articles
+        if article["article_id"] not in existing_ids and article["article_id"] not in deleted_ids
+    ]
+    
+    # 같은 기사를 다른 매체에서 가져온 사본은 대표 기사의 duplicates로 묶음
+    new_articles, duplicate_count, stored_duplicates = group_near_duplicates(
+        new_articles, get_near_duplicate_index(company, store))
+    updated_articles = attach_stored_duplicates(store, stored_duplicates)
+    if duplicate_count:
+        print(f"[{company} 근접 중복] 사본 {duplicate_count}개를 묶음 "
+              f"(저장된 기사 {len(updated_articles)}개의 duplicates에 추가)")
+    
+    # 번역 등 후처리는 실제로 저장할 새 기사에만 수행
+    if hasattr(crawler, "enrich_articles"):
+        crawler.enrich_articles(new_articles)
+    
+    # 새 기사만 저장소 로그에 추가하고, 변경이 있을 때만 data.json 재생성 예약
+    if store.add_articles(new_articles) or updated_articles:
+        schedule_materialize(company, store)
+    crawler.commit_crawl_state()  # 저장소에 기록한 뒤 증분 크롤링 기준점 확정
+    publish_changes(company, store, marker)
+    
+    # 새 기사 본문을 백그라운드에서 미리 가져옴 (ARTICLE_PREFETCH=true일 때만)
+    article_prefetcher.submit(company, crawler, new_articles)
+    return new_articles, store.count()
+
+def attach_stored_duplicates(store, stored_duplicates: dict) -> list:
+    """저장된 기사와 같은 기사로 본 사본을 그 기사의 duplicates에 추가 (바뀐 기사 반환)
+
+    저장소의 기사 교체로 기록하므로 변경분 조회/SSE로 대시보드에 전달됩니다.
+    """
+    updated = []
+    for article_id, copies in stored_duplicates.items():
+        article = store.get_article(article_id)
+        if article is None:
+            continue  # 그 사이 삭제된 기사
+        duplicates = list(article.get("duplicates", []))
+        known = {article_id} | {duplicate.get("article_id") for duplicate in duplicates}
+        for copy in copies:
+            if copy.get("article_id") not in known:
+                known.add(copy.get("article_id"))
+                duplicates.append(copy)
+        if len(duplicates) > len(article.get("duplicates", [])):
+            updated.append({**article, "duplicates": duplicates})
+    return store.update_articles(updated) if updated else []
+
+def get_near_duplicate_index(company: str, store=None) -> NearDuplicateIndex:
+    """업체별 근접 중복 색인 (처음 사용할 때 저장소의 기사로 생성)"""
+    with near_duplicate_lock:
+        index = near_duplicate_indexes.get(company)
+        if index is None:
+            if store is None:
+                store = get_store(get_data_file_path(company), company)
+            index = NearDuplicateIndex()
+            index.add_all(store.articles())
+            near_duplicate_indexes[company] = index
+        return index
+
+def preload_company_data():
+    """업체별 기사 저장소와 삭제된 기사 ID를 미리 읽어 둠 (이후에는 메모리에서 사용)"""
+    for company in COMPANIES:
+        try:
+            store = get_store(get_data_file_path(company), company)
+            get_deleted_ids(company)
+            get_near_duplicate_index(company, store)
+        except Exception as e:
+            print(f"[{company} 데이터 미리 읽기 오류] {str(e)}")
+
+def schedule_materialize(company: str, store):
+    """대시보드용 data.json 재생성 예약 (잠시 동안의 변경을 한 번의 저장으로 합침)"""
+    last_changed[company] = get_kst_now().strftime('%Y-%m-%d %H:%M:%S')
+    persist_queue.schedule(f"data:{company}", store.materialize)
+
+# 업데이트 요청을 처리하는 백그라운드 작업 큐 (같은 업체의 중복 요청은 병합)
+job_queue = CrawlJobQueue(update_news_now, max_workers=CRAWL_WORKERS)
+
 def get_data_file_path(company: str) -> str:
     """업체별 데이터 파일 경로 반환"""
-    if company == "hwasung":
-        return "251215/data.json"
-    elif company == "yuil":
-        return "251215_yuil/data.json"
-    elif company == "aia":
-        return "251215_aia/data.json"
-    elif company == "cooper":
-        return "251215_cooper/data.json"
-    elif company == "saargummi":
-        return "251215_saargummi/data.json"
-    elif company == "hutchinson":
-        return "251215_hutchinson/data.json"
+    if company in COMPANIES:
+        return f"{COMPANIES[company]['folder']}/data.json"
     return "data.json"
 
+def get_last_updated(company: str):
+    """기사 목록 마지막 변경 시각 (KST 문자열, 이번 실행에서 바뀐 적이 없으면 data.json 생성 시각)"""
+    if company in last_changed:
+        return last_changed[company]
+    try:
+        mtime = os.path.getmtime(get_data_file_path(company))
+    except OSError:
+        return None
+    return datetime.fromtimestamp(mtime, KST).strftime('%Y-%m-%d %H:%M:%S')
+
+def publish_changes(company: str, store, since_marker: str):
+    """since_marker 이후 저장소 변경분을 SSE 구독자에게 전달
+
+    이벤트의 since가 클라이언트가 가진 marker와 같으면 그대로 반영하고,
+    다르면 클라이언트가 /api/articles?since=로 변경분을 다시 조회합니다.
+    """
+    try:
+        changes = store.changes_since(since_marker)
+        if changes["reset"]:
+            event_broker.publish(company, "reset", {"reset": True}, changes["marker"])
+        elif changes["articles"] or changes["deleted"]:
+            changes["since"] = since_marker
+            changes["last_updated"] = get_last_updated(company)
+            event_broker.publish(company, "changes", changes, changes["marker"])
+    except Exception as e:
+        print(f"[{company} 변경 알림 오류] {str(e)}")
+
 def get_deleted_articles_file_path(company: str) -> str:
     """업체별 삭제된 기사 파일 경로 반환"""
-    if company == "hwasung":
-        return "251215/deleted_articles.json"
-    elif company == "yuil":
-        return "251215_yuil/deleted_articles.json"
-    elif company == "aia":
-        return "251215_aia/deleted_articles.json"
-    elif company == "cooper":
-        return "251215_cooper/deleted_articles.json"
-    elif company == "saargummi":
-        return "251215_saargummi/deleted_articles.json"
-    elif company == "hutchinson":
-        return "251215_hutchinson/deleted_articles.json"
+    if company in COMPANIES:
+        return f"{COMPANIES[company]['folder']}/deleted_articles.json"
     return "deleted_articles.json"
 
 def load_deleted_articles(company: str) -> set:
     """삭제된 기사 ID 목록 로드"""
     deleted_file = get_deleted_articles_file_path(company)
     try:
-        with open(deleted_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            return set(data.get("deleted_ids", []))
-    except FileNotFoundError:
-        return set()
+        data = atomic_file.read_json(deleted_file, {})
+        return set(data.get("deleted_ids", []))
     except Exception as e:
         print(f"[{company} 삭제된 기사 로드 오류] {str(e)}")
         return set()
 
-def save_deleted_article(company: str, article_id: str):
-    """삭제된 기사 ID 저장"""
-    deleted_file = get_deleted_articles_file_path(company)
-    deleted_ids = load_deleted_articles(company)
-    deleted_ids.add(article_id)
-    
+def get_deleted_ids(company: str) -> set:
+    """삭제된 기사 ID 집합 (처음 사용할 때 파일에서 한 번 읽고 이후에는 메모리 사용, 읽기 전용)"""
+    with deleted_ids_lock:
+        if company not in deleted_ids_cache:
+            deleted_ids_cache[company] = load_deleted_articles(company)
+        return deleted_ids_cache[company]
+
+def persist_deleted_articles(company: str):
+    """메모리의 삭제된 기사 ID 집합 전체를 파일에 저장"""
+    with deleted_ids_lock:
+        deleted_ids = sorted(deleted_ids_cache.get(company, ()))
     data = {
-        "deleted_ids": list(deleted_ids),
+        "deleted_ids": deleted_ids,
         "last_updated": get_kst_now().strftime('%Y-%m-%d %H:%M:%S')
     }
-    
-    try:
-        with open(deleted_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-        print(f"[{company} 삭제된 기사 저장] article_id: {article_id} (총 {len(deleted_ids)}개)")
-    except Exception as e:
-        print(f"[{company} 삭제된 기사 저장 오류] {str(e)}")
+    atomic_file.write_json(get_deleted_articles_file_path(company), data)
+
+def save_deleted_article(company: str, article_id: str):
+    """삭제된 기사 ID 저장 (메모리에 추가하고 파일 저장은 예약)"""
+    get_deleted_ids(company)
+    with deleted_ids_lock:
+        deleted_ids_cache[company].add(article_id)
+        total = len(deleted_ids_cache[company])
+    persist_queue.schedule(f"deleted:{company}", lambda: persist_deleted_articles(company))
+    print(f"[{company} 삭제된 기사 저장] article_id: {article_id} (총 {total}개)")
 
 def delete_article(company: str, article_id: str):
     """기사 삭제"""
     try:
-        crawler = get_crawler(company)
-        if crawler is None:
+        if company not in COMPANIES:
             return {
                 "success": False,
                 "error": f"알 수 없는 업체: {company}"
             }
         
-        data_file = get_data_file_path(company)
-        existing_data = crawler.load_from_json(data_file)
-        existing_articles = existing_data.get("articles", [])
-        
-        # 삭제할 기사 제외
-        filtered_articles = [article for article in existing_articles if article.get("article_id") != article_id]
-        
-        if len(filtered_articles) == len(existing_articles):
+        # 저장소에서 삭제 (로그에 삭제 기록만 추가)
+        store = get_store(get_data_file_path(company), company)
+        marker = store.marker()
+        if not store.delete_article(article_id):
             return {
                 "success": False,
                 "error": "기사를 찾을 수 없습니다."
             }
         
-        # 삭제된 기사 저장
-        crawler.save_to_json(filtered_articles, data_file)
+        # 대시보드용 data.json 재생성 (연달아 삭제하면 한 번으로 합쳐짐)
+        schedule_materialize(company, store)
         
         # 삭제된 기사 ID를 별도 파일에 저장 (재크롤링 방지)
         save_deleted_article(company, article_id)
+        publish_changes(company, store, marker)
         
         print(f"[{company} 기사 삭제] article_id: {article_id}")
         
         return {
             "success": True,
             "message": "기사가 삭제되었습니다.",
-            "remaining_count": len(filtered_articles)
+            "remaining_count": store.count()
         }
     except Exception as e:
         print(f"[{company} 기사 삭제 오류] {str(e)}")
@@ -463,6 +495,10 @@ def delete_article(company: str, article_id: str):
             "error": str(e)
         }
 
+class ThreadingUnifiedServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    """요청마다 별도 스레드에서 처리하는 서버 (크롤링 중에도 정적 파일/JSON 응답 유지)"""
+    daemon_threads = True
+
 class UnifiedHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
     """통합 HTTP 핸들러"""
     
@@ -496,10 +532,27 @@ class UnifiedHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
         
         if path.startswith('/api/update/'):
             # 뉴스 업데이트 API: /api/update/{company}
+            # 크롤링은 작업 큐에 등록하고 작업 ID를 즉시 반환
             company = path.split('/')[-1]
-            result = update_news_now(company)
+            if company not in crawlers:
+                result = {
+                    "success": False,
+                    "error": f"알 수 없는 업체: {company}"
+                }
+                status_code = 400
+            else:
+                job, created = job_queue.submit(company)
+                if created:
+                    print(f"[{company} 업데이트 작업 등록] job_id: {job.job_id}")
+                result = {
+                    "success": True,
+                    "job_id": job.job_id,
+                    "status": job.status,
+                    "coalesced": not created
+                }
+                status_code = 202
             
-            self.send_response(200)
+            self.send_response(status_code)
             self.send_header('Content-Type', 'application/json; charset=utf-8')
             self.end_headers()
             
@@ -543,14 +596,24 @@ class UnifiedHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
             try:
                 data = json.loads(post_data.decode('utf-8'))
                 url = data.get('url', '')
+                article_id = data.get('article_id', '')
                 
                 if url:
                     crawler = get_crawler(company)
                     if crawler:
-                        article_content = crawler.get_full_article(url)
+                        # 미리 가져온 본문이 있으면 그대로 반환
+                        article_content = article_bodies.get(company, article_id) if article_id else None
+                        cache_status = "prefetched"
+                        if article_content is None:
+                            # 같은 기사는 캐시에서 반환하고, 동시에 들어온 같은 URL 요청은 한 번만 가져옴
+                            article_content, cache_status = article_cache.get_or_fetch(
+                                article_cache.make_key(company, url),
+                                lambda: crawler.get_full_article(url)
+                            )
                         
                         self.send_response(200)
                         self.send_header('Content-Type', 'application/json; charset=utf-8')
+                        self.send_header('X-Cache', cache_status)
                         self.end_headers()
                         
                         response_json = json.dumps(article_content, ensure_ascii=False)
@@ -571,28 +634,231 @@ class UnifiedHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
             self.send_response(404)
             self.end_headers()
     
+    def send_json(self, status_code, data, cache_control=None):
+        """JSON 응답 전송"""
+        self.send_response(status_code)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        if cache_control:
+            self.send_header('Cache-Control', cache_control)
+        self.end_headers()
+        self.safe_write(json.dumps(data, ensure_ascii=False))
+
+    def handle_articles_query(self, params):
+        """기사 검색 API 처리 (저장소 색인으로 필요한 페이지만 조회)
+
+        since가 있으면 해당 marker 이후 추가/삭제된 기사만 반환합니다.
+        """
+        def param(name):
+            values = params.get(name)
+            return values[0] if values else None
+
+        company = param('company')
+        if company not in crawlers:
+            self.send_json(400, {"success": False, "error": f"알 수 없는 업체: {company}"})
+            return
+
+        try:
+            limit = int(param('limit') or DEFAULT_PAGE_SIZE)
+        except ValueError:
+            self.send_json(400, {"success": False, "error": "limit은 숫자여야 합니다."})
+            return
+
+        try:
+            data_file = get_data_file_path(company)
+            store = get_store(data_file, company)
+            if param('since'):
+                result = store.changes_since(param('since'))
+            else:
+                result = store.search(
+                    q=param('q'),
+                    date_from=param('from'),
+                    date_to=param('to'),
+                    source=param('source'),
+                    source_type=param('source_type'),
+                    limit=limit,
+                    cursor=param('cursor')
+                )
+        except ValueError as e:
+            self.send_json(400, {"success": False, "error": str(e)})
+            return
+        except Exception as e:
+            print(f"[{company} 기사 검색 오류] {str(e)}")
+            self.send_json(500, {"success": False, "error": str(e)})
+            return
+
+        result["success"] = True
+        result["company"] = company
+        result["last_updated"] = get_last_updated(company)
+        self.send_json(200, result, cache_control='no-store')
+
+    def handle_event_stream(self, company):
+        """기사 추가/삭제를 SSE로 전달 (연결이 끊길 때까지 유지)
+
+        재연결 시 브라우저가 보내는 Last-Event-ID(저장소 marker) 이후의
+        변경분을 먼저 보내므로 끊겨 있던 동안의 변경도 놓치지 않습니다.
+        """
+        if company not in crawlers:
+            self.send_json(400, {"success": False, "error": f"알 수 없는 업체: {company}"})
+            return
+
+        subscription = event_broker.subscribe(company)
+        if subscription is None:
+            self.send_json(503, {"success": False, "error": "실시간 알림 연결 수가 너무 많습니다."})
+            return
+
+        try:
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/event-stream; charset=utf-8')
+            self.send_header('Cache-Control', 'no-store')
+            self.send_header('X-Accel-Buffering', 'no')
+            self.end_headers()
+            self.wfile.write(b"retry: 5000\n\n")
+
+            last_event_id = self.headers.get('Last-Event-ID')
+            if last_event_id:
+                store = get_store(get_data_file_path(company), company)
+                changes = store.changes_since(last_event_id)
+                if changes["reset"]:
+                    self.wfile.write(format_sse("reset", {"reset": True}, changes["marker"]))
+                elif changes["articles"] or changes["deleted"]:
+                    changes["since"] = last_event_id
+                    self.wfile.write(format_sse("changes", changes, changes["marker"]))
+            self.wfile.flush()
+
+            while True:
+                event = subscription.get(timeout=SSE_KEEPALIVE_SECONDS)
+                if event is None:
+                    self.wfile.write(b": keepalive\n\n")
+                else:
+                    self.wfile.write(format_sse(event["type"], event["data"], event["id"]))
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError, OSError):
+            # 클라이언트가 페이지를 닫거나 연결이 끊김
+            pass
+        finally:
+            event_broker.unsubscribe(subscription)
+            self.close_connection = True
+
+    def send_head(self):
+        """정적 파일 응답 헤더 전송 (data.json/HTML은 ETag 검증과 압축본 사용)"""
+        path = self.translate_path(self.path)
+        if path.endswith(static_cache.CACHEABLE_SUFFIXES) and os.path.isfile(path):
+            return self.send_cacheable_file(path)
+        return super().send_head()
+
+    def send_cacheable_file(self, path):
+        """조건부 요청이면 304, 아니면 클라이언트가 받을 수 있는 압축본 전송"""
+        try:
+            st = os.stat(path)
+            etag = static_cache.file_etag(path, st)
+        except OSError:
+            self.send_error(404, "File not found")
+            return None
+
+        last_modified = email.utils.formatdate(st.st_mtime, usegmt=True)
+        if_none_match = self.headers.get('If-None-Match')
+        if_modified_since = self.headers.get('If-Modified-Since')
+        not_modified = False
+        if if_none_match:
+            not_modified = static_cache.etag_matches(if_none_match, etag)
+        elif if_modified_since:
+            try:
+                since = email.utils.parsedate_to_datetime(if_modified_since)
+                not_modified = int(st.st_mtime) <= since.timestamp()
+            except (TypeError, ValueError):
+                pass
+
+        encoding, send_path = static_cache.select_variant(path, self.headers.get('Accept-Encoding'), st)
+        response_etag = f'"{etag}-{encoding}"' if encoding else f'"{etag}"'
+
+        if not_modified:
+            self.send_response(304)
+            self.send_header('ETag', response_etag)
+            self.send_header('Last-Modified', last_modified)
+            self.send_header('Cache-Control', 'no-cache')
+            self.send_header('Vary', 'Accept-Encoding')
+            self.end_headers()
+            return None
+
+        try:
+            f = open(send_path, 'rb')
+        except OSError:
+            self.send_error(404, "File not found")
+            return None
+
+        self.send_response(200)
+        self.send_header('Content-Type', self.guess_type(path))
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+        self.send_header('Content-Length', str(os.fstat(f.fileno()).st_size))
+        self.send_header('ETag', response_etag)
+        self.send_header('Last-Modified', last_modified)
+        # 항상 재검증 (변경이 없으면 304로 본문 없이 응답)
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Vary', 'Accept-Encoding')
+        self.end_headers()
+        return f
+
     def do_GET(self):
         """GET 요청 처리 (정적 파일 서빙)"""
         parsed_path = urlparse(self.path)
         path = parsed_path.path
-        
+
+        # 공용 HTTP 클라이언트 커넥션 통계 API
+        if path == '/api/http-stats':
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.end_headers()
+            # 크롤링 전에는 HTTP 클라이언트(requests)를 불러오지 않음
+            http_client = sys.modules.get("http_client")
+            stats = http_client.get_stats() if http_client else {}
+            self.safe_write(json.dumps(stats, ensure_ascii=False))
+            return
+
+        # 번역 캐시 적중 통계 API
+        if path == '/api/translation-stats':
+            self.send_json(200, translation_cache.get_stats(), cache_control='no-store')
+            return
+
+        # 기사 본문 캐시 적중 통계 API
+        if path == '/api/article-cache-stats':
+            self.send_json(200, article_cache.get_stats(), cache_control='no-store')
+            return
+
+        # 기사 검색 API: /api/articles?company=&q=&from=&to=&source=&source_type=&limit=&cursor=
+        # 변경분 조회: /api/articles?company=&since={marker}
+        if path == '/api/articles':
+            self.handle_articles_query(parse_qs(parsed_path.query))
+            return
+
+        # 기사 변경 실시간 알림 (SSE): /api/events/{company}
+        if path.startswith('/api/events/'):
+            self.handle_event_stream(path.split('/')[-1])
+            return
+
+        # 크롤링 작업 상태 조회 API: /api/jobs/{job_id}
+        if path.startswith('/api/jobs/'):
+            job = job_queue.get(path.split('/')[-1])
+            if job is None:
+                self.send_response(404)
+                self.send_header('Content-Type', 'application/json; charset=utf-8')
+                self.end_headers()
+                self.safe_write(json.dumps({"success": False, "error": "작업을 찾을 수 없습니다."}, ensure_ascii=False))
+                return
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Cache-Control', 'no-store')
+            self.end_headers()
+            self.safe_write(json.dumps(job.to_dict(), ensure_ascii=False))
+            return
+
         # 루트 경로를 메인 대시보드로 리다이렉트
         if path == '/' or path == '':
             self.path = '/competitor-monitoring.html'
         
-        # 각 업체별 index.html 경로 매핑
-        elif path == '/hwasung' or path == '/hwasung/':
-            self.path = '/251215/index.html'
-        elif path == '/yuil' or path == '/yuil/':
-            self.path = '/251215_yuil/index.html'
-        elif path == '/aia' or path == '/aia/':
-            self.path = '/251215_aia/index.html'
-        elif path == '/cooper' or path == '/cooper/':
-            self.path = '/251215_cooper/index.html'
-        elif path == '/saargummi' or path == '/saargummi/':
-            self.path = '/251215_saargummi/index.html'
-        elif path == '/hutchinson' or path == '/hutchinson/':
-            self.path = '/251215_hutchinson/index.html'
+        # 각 업체별 index.html 경로 매핑 (/cooper → /251215_cooper/index.html)
+        elif path.strip('/') in COMPANIES:
+            self.path = f"/{COMPANIES[path.strip('/')]['folder']}/index.html"
         
         # 정적 파일 서빙
         try:
@@ -601,8 +867,8 @@ class UnifiedHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
             print(f"파일 서빙 오류: {str(e)}")
             self.send_error(404, "File not found")
 
-def start_web_server(port=None):
-    """웹 서버 시작"""
+def bind_web_server(port=None):
+    """웹 서버 포트 바인딩 (바인딩 직후부터 연결을 받아 대기열에 쌓음)"""
     handler = UnifiedHTTPRequestHandler
     
     # Render나 다른 클라우드 플랫폼에서 PORT 환경 변수 사용
@@ -612,23 +878,9 @@ def start_web_server(port=None):
     # 포트가 사용 중이면 다른 포트 시도 (로컬 환경에서만)
     for attempt in range(10):
         try:
-            httpd = socketserver.TCPServer(("", port), handler)
-            print(f"통합 웹 서버가 시작되었습니다: http://localhost:{port}")
-            print(f"메인 페이지: http://localhost:{port}/competitor-monitoring.html")
-            print(f"화승 R&A: http://localhost:{port}/hwasung")
-            print(f"유일고무: http://localhost:{port}/yuil")
-            print(f"AIA(아이아): http://localhost:{port}/aia")
-            print(f"Cooper Standard: http://localhost:{port}/cooper")
-            print(f"SaarGummi: http://localhost:{port}/saargummi")
-            print(f"Hutchinson: http://localhost:{port}/hutchinson")
-            print()
-            
-            try:
-                httpd.serve_forever()
-            except KeyboardInterrupt:
-                print("\n웹 서버를 종료합니다...")
-                httpd.shutdown()
-            break
+            httpd = ThreadingUnifiedServer(("", port), handler)
+            print(f"통합 웹 서버 포트 바인딩: http://localhost:{port}")
+            return httpd
         except OSError as e:
             # Windows 환경에서만 winerror 체크
             if hasattr(e, 'winerror') and e.winerror == 10048:  # 포트가 이미 사용 중
@@ -639,8 +891,28 @@ def start_web_server(port=None):
                 port += 1
             else:
                 raise
-    else:
-        print(f"사용 가능한 포트를 찾을 수 없습니다. (시도한 포트: {port-10}-{port-1})")
+    print(f"사용 가능한 포트를 찾을 수 없습니다. (시도한 포트: {port-10}-{port-1})")
+    return None
+
+def start_web_server(httpd=None):
+    """웹 서버 시작 (바인딩된 서버가 없으면 먼저 바인딩)"""
+    if httpd is None:
+        httpd = bind_web_server()
+        if httpd is None:
+            return
+    
+    port = httpd.server_address[1]
+    print(f"통합 웹 서버가 시작되었습니다: http://localhost:{port}")
+    print(f"메인 페이지: http://localhost:{port}/competitor-monitoring.html")
+    for company, company_config in COMPANIES.items():
+        print(f"{company_config.get('name', company)}: http://localhost:{port}/{company}")
+    print()
+    
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        print("\n웹 서버를 종료합니다...")
+        httpd.shutdown()
 
 def main():
     """메인 함수"""
@@ -655,7 +927,19 @@ def main():
     print(f"[로그] 로그 파일: {LOG_FILE.absolute()}")
     print()
     
+    # 시작 단계별 소요 시간 (초)
+    startup_times = {"모듈 import": time.perf_counter() - STARTUP_STARTED}
+    
+    # 포트부터 바인딩 (Render 등은 포트가 열려야 시작된 것으로 판단)
+    # 바인딩 이후 들어온 연결은 아래 초기화가 끝나는 대로 처리됩니다.
+    phase_started = time.perf_counter()
+    httpd = bind_web_server()
+    startup_times["포트 바인딩"] = time.perf_counter() - phase_started
+    if httpd is None:
+        return
+    
     # GitHub에서 데이터 복원 (활성화된 경우)
+    phase_started = time.perf_counter()
     backup_enabled = os.environ.get('ENABLE_GITHUB_BACKUP', 'false').lower() == 'true'
     if BACKUP_AVAILABLE and backup_enabled:
         try:
@@ -676,41 +960,34 @@ def main():
     else:
         print("[초기화] GitHub 백업이 비활성화되어 있습니다. (ENABLE_GITHUB_BACKUP=false)")
         print("[초기화] 참고: 데이터 영구 저장을 위해 ENABLE_GITHUB_BACKUP=true를 설정하세요.")
+    startup_times["GitHub 복원"] = time.perf_counter() - phase_started
     
-    # 각 업체별 크롤러 초기화
-    print("[초기화] 각 업체별 크롤러 초기화 중...")
-    crawlers["hwasung"] = HwasungNewsCrawler()
-    crawlers["yuil"] = YuilNewsCrawler()
-    crawlers["aia"] = AIANewsCrawler()
-    crawlers["cooper"] = CooperStandardNewsCrawler()
-    crawlers["saargummi"] = SaarGummiNewsCrawler()
-    crawlers["hutchinson"] = HutchinsonNewsCrawler()
-    print("[초기화] 완료\n")
+    # 크롤러는 업체별로 처음 필요할 때 로드 (시작 시에는 만들지 않음)
+    print(f"[초기화] 등록된 업체 {len(COMPANIES)}개: {', '.join(COMPANIES)} (크롤러는 첫 사용 시 로드)\n")
     
     # 각 업체별 초기 데이터 파일 확인 (크롤링은 하지 않음)
-    companies = {
-        "hwasung": ("251215", HwasungNewsCrawler),
-        "yuil": ("251215_yuil", YuilNewsCrawler),
-        "aia": ("251215_aia", AIANewsCrawler),
-        "cooper": ("251215_cooper", CooperStandardNewsCrawler),
-        "saargummi": ("251215_saargummi", SaarGummiNewsCrawler),
-        "hutchinson": ("251215_hutchinson", HutchinsonNewsCrawler)
-    }
-    
-    for company_name, (folder, CrawlerClass) in companies.items():
-        data_file = f"{folder}/data.json"
+    phase_started = time.perf_counter()
+    for company_name in COMPANIES:
+        data_file = get_data_file_path(company_name)
         if not os.path.exists(data_file):
             print(f"[초기화] {company_name} 데이터 파일이 없습니다.")
             print(f"[초기화] 빈 데이터 파일을 생성합니다.")
             # 빈 데이터 구조 생성 (HTML에서 에러 없이 로드되도록)
-            crawler = get_crawler(company_name)
             empty_data = {
                 "last_updated": get_kst_now().strftime('%Y-%m-%d %H:%M:%S'),
                 "total_count": 0,
                 "articles": []
             }
-            crawler.save_to_json([], data_file)
+            atomic_file.write_json(data_file, empty_data)
+            static_cache.compress_file(data_file)
             print(f"[초기화] {company_name} 빈 데이터 파일 생성 완료. 새로고침 버튼을 눌러 크롤링을 시작하세요.")
+    startup_times["데이터 파일 확인"] = time.perf_counter() - phase_started
+    
+    # 종료 신호(SIGTERM)에도 정상 종료 경로로 나가 미뤄 둔 저장(persist_queue)을 마침
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    
+    # 기사 저장소와 삭제된 기사 ID는 요청 처리와 함께 백그라운드에서 한 번 읽어 둠
+    threading.Thread(target=preload_company_data, daemon=True).start()
     
     # 자동 스케줄러 비활성화 (수동 업데이트만 사용)
     # 각 업체별 스케줄러 시작 (1시간 = 3600초)
@@ -743,9 +1020,13 @@ def main():
     print("[초기화] 자동 크롤링이 비활성화되었습니다. 새로고침 버튼을 통해 수동으로 업데이트하세요.")
     print()
     
+    # 시작 시간 내역
+    breakdown = " / ".join(f"{name} {seconds:.2f}초" for name, seconds in startup_times.items())
+    print(f"[시작 시간] {breakdown} (합계 {time.perf_counter() - STARTUP_STARTED:.2f}초)")
+    
     # 웹 서버 시작 (메인 스레드에서 직접 실행 - Render 헬스체크를 위해)
     print("[서버 시작] 웹 서버를 시작합니다...")
-    start_web_server()
+    start_web_server(httpd)
     
     # 아래 코드는 실행되지 않음 (serve_forever가 블로킹)
     try:
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+URL 정규화 + 정규 URL → 기사 ID 색인 - 출처가 달라도 같은 원문 링크면 같은 기사 ID 사용
+
+기사 ID는 링크의 md5인데, 네이버는 검색 결과의 link(네이버 뉴스 링크)를,
+구글 뉴스는 news.google.com 리다이렉트 링크를, 구글 웹은 원문 링크를 해시하므로
+같은 원문이 출처마다 다른 ID로 저장됩니다. 수집 시점에 링크를 정규 URL로 바꾸고
+업체별 색인(config_dir/url_index.json)에서 이미 다른 ID로 본 원문이면 그 ID를
+그대로 쓰므로, crawl_all_news와 서버의 기존 ID 비교에서 바로 걸러집니다.
+출처별 검색은 동시에 실행되므로 검색 중에는 색인을 읽기만 하고, 새 원문은
+crawl_all_news가 결과를 정해진 출처 순서로 병합하면서 등록합니다 (실행 시점과
+관계없이 같은 기사가 같은 ID를 받음).
+
+정규화 단계:
+  1. 리다이렉트 풀기 - google.com/url?q=, news.google.com의 url= 파라미터,
+     예전 형식(CBMi...) 구글 뉴스 기사 링크에 들어 있는 원문 URL
+  2. 스킴은 https, 호스트는 소문자 + www./m. 제거, 기본 포트/프래그먼트/끝 슬래시 제거
+  3. 추적용 파라미터(utm_*, fbclid 등) 제거 후 나머지 파라미터 정렬
+  4. 네이버 뉴스 기사는 언론사/기사 번호만 남긴 한 형식으로 통일
+
+새 형식(AU_yqL...) 구글 뉴스 링크는 원문 URL이 암호화되어 있어 오프라인으로
+풀 수 없으므로 정규화한 구글 뉴스 링크 그대로 색인합니다.
+"""
+
+import base64
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import parse_qsl, unquote, urlencode, urlparse, urlunparse
+
+import atomic_file
+
+# 색인에 남길 최대 URL 수 (넘으면 오래 등록된 URL부터 제거)
+URL_INDEX_MAX_ENTRIES = int(os.environ.get('URL_INDEX_MAX_ENTRIES', 50000))
+
+# 어느 사이트에서든 제거하는 추적용 파라미터
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "msclkid", "yclid", "igshid", "mc_cid", "mc_eid",
+    "ocid", "cmpid", "ncid", "ref_src", "_ga",
+}
+TRACKING_PREFIXES = ("utm_",)
+
+# 사이트별로 기사 식별과 무관한 파라미터
+HOST_IGNORED_PARAMS = {
+    "news.google.com": {"oc", "hl", "gl", "ceid"},
+    "news.naver.com": {"sid", "sid1", "sid2", "mode", "type"},
+}
+
+# 리다이렉트 안의 원문 URL을 담는 파라미터
+_REDIRECT_PARAMS = ("url", "q", "u")
+_REDIRECT_HOSTS = ("google.com", "news.google.com")
+# 예전 형식 구글 뉴스 기사 ID 안의 원문 URL
+_EMBEDDED_URL = re.compile(rb"https?://[\x21-\x7e]+")
+_NAVER_ARTICLE = re.compile(r"/(?:mnews/)?article/(\d{3})/(\d+)")
+
+
+def _host(netloc: str) -> str:
+    host = netloc.lower().rsplit("@", 1)[-1]
+    if host.endswith(":80") or host.endswith(":443"):
+        host = host.rsplit(":", 1)[0]
+    if host in ("n.news.naver.com", "m.news.naver.com"):
+        return "news.naver.com"
+    for prefix in ("www.", "m."):
+        if host.startswith(prefix) and host.count(".") >= 2:
+            return host[len(prefix):]
+    return host
+
+
+def _decode_google_news_id(path: str) -> Optional[str]:
+    """예전 형식 구글 뉴스 기사 링크(/rss/articles/CBMi...)에 들어 있는 원문 URL"""
+    token = path.rstrip("/").rsplit("/", 1)[-1]
+    if not token:
+        return None
+    try:
+        payload = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+    except (ValueError, TypeError):
+        return None
+    match = _EMBEDDED_URL.search(payload)
+    if not match:
+        return None
+    # URL 뒤의 필드 구분 바이트(AMP 링크 등)는 출력 가능한 ASCII가 아니라 여기서 끊김
+    return match.group(0).decode("ascii")
+
+
+def unwrap_redirect(url: str) -> str:
+    """구글 리다이렉트 링크면 원문 URL, 아니면 그대로 (풀 수 없는 링크도 그대로)"""
+    for _ in range(3):  # 리다이렉트 안의 리다이렉트까지
+        parsed = urlparse(url)
+        host = _host(parsed.netloc)
+        if not any(host == h or host.endswith("." + h) for h in _REDIRECT_HOSTS):
+            return url
+        params = dict(parse_qsl(parsed.query))
+        target = next((params[name] for name in _REDIRECT_PARAMS
+                       if params.get(name, "").startswith(("http://", "https://"))), None)
+        if target is None and host == "news.google.com" and "/articles/" in parsed.path:
+            target = _decode_google_news_id(parsed.path)
+        if target is None:
+            return url
+        url = unquote(target) if target.startswith(("http%3A", "https%3A")) else target
+    return url
+
+
+def canonicalize_url(url: str) -> str:
+    """비교용 정규 URL (빈 문자열이나 http(s)가 아닌 링크는 빈 문자열)"""
+    url = unwrap_redirect((url or "").strip())
+    parsed = urlparse(url)
+    if parsed.scheme.lower() not in ("http", "https") or not parsed.netloc:
+        return ""
+    host = _host(parsed.netloc)
+    path = re.sub(r"/{2,}", "/", parsed.path) or "/"
+    if len(path) > 1:
+        path = path.rstrip("/")
+
+    query = parse_qsl(parsed.query, keep_blank_values=True)
+    if host == "news.naver.com":
+        # https://n.news.naver.com/mnews/article/001/0011234567?sid=101
+        # https://news.naver.com/main/read.naver?oid=001&aid=0011234567
+        match = _NAVER_ARTICLE.search(path)
+        params = dict(query)
+        if match:
+            return f"https://news.naver.com/article/{match.group(1)}/{match.group(2)}"
+        if params.get("oid") and params.get("aid"):
+            return f"https://news.naver.com/article/{params['oid']}/{params['aid']}"
+
+    ignored = HOST_IGNORED_PARAMS.get(host, ())
+    query = sorted(
+        (key, value) for key, value in query
+        if key.lower() not in TRACKING_PARAMS
+        and not key.lower().startswith(TRACKING_PREFIXES)
+        and key not in ignored
+    )
+    return urlunparse(("https", host, path, "", urlencode(query), ""))
+
+
+class CanonicalUrlIndex:
+    """업체별 정규 URL → 기사 ID 색인
+
+    lookup()은 색인을 바꾸지 않고 기사의 URL을 보관해 두고, register()가 정해진
+    순서로 등록합니다. 등록한 URL은 바로 다음 조회에 쓰지만 파일에는 commit()에서
+    저장합니다 (증분 크롤링 기준점과 같이, 기사가 저장된 뒤).
+    """
+
+    def __init__(self, filepath, max_entries: int = URL_INDEX_MAX_ENTRIES):
+        self.filepath = Path(filepath)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._urls: Dict[str, str] = self._load()
+        self._pending: Dict[str, List[str]] = {}  # 기사 ID → 아직 등록하지 않은 정규 URL
+        self._dirty = False
+
+    def _load(self) -> Dict[str, str]:
+        try:
+            data = atomic_file.read_json(self.filepath, default={})
+            return dict(data.get("urls", {}))
+        except Exception as e:
+            print(f"[URL 색인] 색인 파일 로드 오류: {str(e)}")
+            return {}
+
+    def get(self, url: str) -> Optional[str]:
+        canonical = canonicalize_url(url)
+        if not canonical:
+            return None
+        with self._lock:
+            return self._urls.get(canonical)
+
+    def lookup(self, urls: Iterable[str], article_id: str) -> str:
+        """urls 중 색인에 있는 URL이 있으면 그 기사 ID, 없으면 article_id
+
+        색인은 바꾸지 않고 URL을 반환하는 ID로 보관해 두었다가 register()에서
+        등록합니다 (동시에 검색하는 출처끼리 먼저 끝난 쪽이 ID를 정하지 않도록).
+        """
+        canonicals = [c for c in dict.fromkeys(canonicalize_url(url) for url in urls) if c]
+        with self._lock:
+            resolved = next((self._urls[c] for c in canonicals if c in self._urls), article_id)
+            pending = self._pending.setdefault(resolved, [])
+            pending.extend(c for c in canonicals if c not in pending)
+            return resolved
+
+    def register(self, article_id: str) -> str:
+        """lookup()으로 보관한 기사 URL을 색인에 등록하고 최종 기사 ID 반환
+
+        앞서 등록한 기사와 같은 원문이면 그 기사의 ID를 돌려줍니다. 호출 순서대로
+        ID가 정해지므로 정해진 순서(crawl_all_news의 병합 순서)로 호출합니다.
+        """
+        with self._lock:
+            canonicals = self._pending.pop(article_id, ())
+            resolved = next((self._urls[c] for c in canonicals if c in self._urls), article_id)
+            for canonical in canonicals:
+                if canonical not in self._urls:
+                    self._urls[canonical] = resolved
+                    self._dirty = True
+            return resolved
+
+    def discard_pending(self):
+        """등록하지 않은 URL 버리기 (새 크롤링 시작 시)"""
+        with self._lock:
+            self._pending.clear()
+
+    def seed(self, articles: Iterable[Dict]) -> int:
+        """저장된 기사의 링크를 색인에 추가 (색인 파일이 생기기 전 기사용, 추가한 수 반환)"""
+        added = 0
+        entries = [(canonicalize_url(article.get("link", "")), article.get("article_id"))
+                   for article in articles]
+        with self._lock:
+            for canonical, article_id in entries:
+                if canonical and article_id and canonical not in self._urls:
+                    self._urls[canonical] = article_id
+                    added += 1
+            if added:
+                self._dirty = True
+        return added
+
+    def commit(self):
+        """바뀐 색인을 파일에 저장"""
+        with self._lock:
+            if not self._dirty:
+                return
+            overflow = len(self._urls) - self.max_entries
+            if overflow > 0:
+                for canonical in list(self._urls)[:overflow]:
+                    del self._urls[canonical]
+            data = {"urls": dict(self._urls)}
+            self._dirty = False
+        try:
+            atomic_file.write_json(self.filepath, data, indent=None)
+        except Exception as e:
+            self._dirty = True  # 다음 commit에서 다시 저장
+            print(f"[URL 색인] 색인 파일 저장 오류: {str(e)}")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._urls)
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+지연 저장 (write-behind) - 메모리에서 바꾼 내용을 잠시 모았다가 한 번에 파일로 저장
+
+같은 키로 여러 번 저장을 예약하면 마지막 예약 하나만 실행합니다. 첫 예약 시각부터
+delay초 뒤에 실행하므로, 삭제가 연달아 들어와도 저장은 delay마다 한 번이고
+계속 들어오더라도 delay보다 오래 미뤄지지 않습니다.
+
+저장 함수는 실행 시점의 메모리 상태를 통째로 쓰는 형태여야 합니다 (예:
+저장소의 materialize, 삭제 ID 집합 전체 저장). 같은 키의 저장 함수는 동시에
+두 번 실행되지 않으며, 백업 전이나 종료 시에는 flush()로 남은 저장을 바로
+실행합니다.
+"""
+
+import atexit
+import threading
+import time
+from typing import Callable, Dict, Optional, Set, Tuple
+
+
+class WriteBehind:
+    """키별로 병합되는 지연 저장 큐 (백그라운드 스레드 하나)"""
+
+    def __init__(self, delay: float = 2.0, name: str = "지연 저장"):
+        self.delay = max(0.0, delay)
+        self.name = name
+        self._cond = threading.Condition()
+        self._pending: Dict[str, Tuple[float, Callable[[], None]]] = {}
+        self._running: Set[str] = set()
+        self._thread: Optional[threading.Thread] = None
+        self.stats = {"scheduled": 0, "written": 0, "errors": 0}
+        atexit.register(self.flush)
+
+    def schedule(self, key: str, write: Callable[[], None]):
+        """저장 예약 (같은 키에 대기 중인 예약이 있으면 그 예약에 병합)"""
+        with self._cond:
+            self.stats["scheduled"] += 1
+            due = self._pending[key][0] if key in self._pending else time.monotonic() + self.delay
+            self._pending[key] = (due, write)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._worker, name="write-behind", daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+
+    def pending(self) -> int:
+        with self._cond:
+            return len(self._pending)
+
+    def _take(self, key: str) -> Optional[Callable[[], None]]:
+        """실행 중인 같은 키 저장이 끝나길 기다린 뒤 대기 중인 예약을 꺼냄 (잠금 안에서 호출)"""
+        while key in self._running:
+            self._cond.wait()
+        entry = self._pending.pop(key, None)
+        if entry is None:
+            return None
+        self._running.add(key)
+        return entry[1]
+
+    def _run(self, key: str, write: Callable[[], None]):
+        try:
+            write()
+            self.stats["written"] += 1
+        except Exception as e:
+            self.stats["errors"] += 1
+            print(f"[{self.name} 오류] {key}: {str(e)}")
+        finally:
+            with self._cond:
+                self._running.discard(key)
+                self._cond.notify_all()
+
+    def _worker(self):
+        while True:
+            with self._cond:
+                while True:
+                    now = time.monotonic()
+                    ready = [key for key, (due, _) in self._pending.items()
+                             if due <= now and key not in self._running]
+                    if ready:
+                        key = min(ready, key=lambda k: self._pending[k][0])
+                        write = self._take(key)
+                        break
+                    waiting = [due for key, (due, _) in self._pending.items() if key not in self._running]
+                    self._cond.wait(max(0.0, min(waiting) - now) if waiting else None)
+            self._run(key, write)
+
+    def flush(self, key: Optional[str] = None):
+        """대기 중인 저장을 지금 호출한 스레드에서 실행 (key가 없으면 전부)"""
+        with self._cond:
+            keys = [key] if key is not None else list(self._pending)
+        for flush_key in keys:
+            with self._cond:
+                write = self._take(flush_key)
+            if write is not None:
+                self._run(flush_key, write)